@@ -0,0 +1,174 @@
+"""
+Build the property atlas of the compounds in the shipped datasets.
+
+Run before packaging (see release-workflow.sh); writes `_data/atlas`.
+Every atlas cell is checked against PC-SAFT at its midpoints and only
+cells interpolated within `ATLAS_TOLERANCE` are used at runtime.
+"""
+
+import os
+import os.path as osp
+import sys
+from copy import copy
+from typing import List, Optional, Tuple
+
+import numpy as np
+import polars as pl
+import si_units as si
+from feos import PhaseEquilibrium  # pyright: ignore[reportAttributeAccessIssue]
+from gnnepcsaft.pcsaft.pcsaft_feos import pc_saft, pure_den_feos
+from gnnepcsaft_mcp_server.utils import inchitosmiles, predict_pcsaft_parameters
+from utils_atlas import (
+    ATLAS_PATH,
+    ATLAS_PRESSURES,
+    ATLAS_SATURATION_MIN_TR,
+    ATLAS_TEMPERATURES,
+    ATLAS_TOLERANCE,
+    interpolate_density,
+    interpolate_saturation,
+    saturation_nodes,
+)
+from utils_data import application_path
+from utils_pure import _saturation_properties, pure_critical_point
+from utils_sweep import continuation_sweep
+
+
+def _within_tolerance(approx: np.ndarray, exact: np.ndarray) -> np.ndarray:
+    "check the interpolation error of each point (all columns)"
+    ok = np.abs(approx - exact) <= ATLAS_TOLERANCE * np.abs(exact)
+    return ok if ok.ndim == 1 else np.all(ok, axis=1)
+
+
+def _density(parameters: List[float], temperature: float, pressure: float) -> float:
+    "liquid density, NaN where PC-SAFT does not converge"
+    try:
+        return pure_den_feos(parameters, [temperature, pressure])
+    except RuntimeError:
+        return np.nan
+
+
+def density_table(parameters: List[float]) -> Tuple[np.ndarray, np.ndarray]:
+    "density on the atlas T-P grid and the mask of its validated cells"
+    t_nodes = ATLAS_TEMPERATURES
+    t_mid = (t_nodes[:-1] + t_nodes[1:]) / 2
+    p_mid = np.sqrt(ATLAS_PRESSURES[:-1] * ATLAS_PRESSURES[1:])
+    table = np.array(
+        [[_density(parameters, t, p) for t in t_nodes] for p in ATLAS_PRESSURES]
+    )
+    corners = np.isfinite(table)
+    valid = corners[:-1, :-1] & corners[1:, :-1] & corners[:-1, 1:] & corners[1:, 1:]
+
+    # midpoints along temperature on the isobars of the nodes
+    for j, pressure in enumerate(ATLAS_PRESSURES):
+        cells = (valid[j - 1] if j > 0 else False) | (
+            valid[j] if j < len(valid) else False
+        )
+        ok = _checked(parameters, table, pressure, t_mid, cells)
+        if j > 0:
+            valid[j - 1] &= ok
+        if j < len(valid):
+            valid[j] &= ok
+    # cell centers, between the isobars of the nodes
+    for j, pressure in enumerate(p_mid):
+        valid[j] &= _checked(parameters, table, pressure, t_mid, valid[j])
+    return table, valid
+
+
+def _checked(parameters, table, pressure, t_mid, cells) -> np.ndarray:
+    "interpolation check of the cells at their temperature midpoints"
+    ok = np.zeros(len(t_mid), dtype=bool)
+    if not np.any(cells):
+        return ok
+    approx = interpolate_density(table, pressure, t_mid)
+    exact = np.array(
+        [
+            _density(parameters, t, pressure) if c else np.nan
+            for t, c in zip(t_mid, cells)
+        ]
+    )
+    ok[cells] = _within_tolerance(approx[cells], exact[cells])
+    return ok
+
+
+def saturation_table(
+    smiles: str,
+) -> Tuple[np.ndarray, np.ndarray, float, float]:
+    "saturation properties on the atlas grid, the mask of validated cells, T min and Tc"
+    tc, pc, dc = pure_critical_point(smiles)
+    t_min = ATLAS_SATURATION_MIN_TR * tc
+    eos = pc_saft(predict_pcsaft_parameters(smiles))
+
+    def _saturation(temperatures: np.ndarray) -> np.ndarray:
+        last_vle = {}
+
+        def _solve(temperature, guess):
+            if temperature >= tc:
+                return [pc, 0.0, dc, dc]
+            vle = PhaseEquilibrium.pure(
+                eos,
+                temperature * si.KELVIN,
+                initial_state=None if guess is None else last_vle.get("vle"),
+            )
+            last_vle["vle"] = vle
+            return _saturation_properties(vle)
+
+        # from the critical point down, where the VLE is easiest to follow
+        return continuation_sweep(_solve, list(temperatures[::-1])).y[::-1]
+
+    nodes = saturation_nodes(t_min, tc)
+    table = _saturation(tc * (1.0 - nodes**2))
+    corners = np.all(np.isfinite(table), axis=1)
+    valid = corners[:-1] & corners[1:]
+    t_mid = tc * (1.0 - ((nodes[:-1] + nodes[1:]) / 2) ** 2)
+    approx = interpolate_saturation(table, t_min, tc, t_mid)
+    valid &= _within_tolerance(approx, _saturation(t_mid))
+    return table, valid, t_min, tc
+
+
+def _dataset_compounds() -> List[str]:
+    "InChIs of the compounds with pure-component data"
+    data = [
+        pl.read_parquet(osp.join(application_path, "_data", name), columns=["inchi1"])
+        for name in ("rho_pure.parquet", "vp_pure.parquet")
+    ]
+    return sorted(pl.concat(data)["inchi1"].unique().to_list())
+
+
+def build_atlas(limit: Optional[int] = None):
+    "tabulate the dataset compounds and write the atlas files"
+    inchis, densities, density_valid, saturations, saturation_valid = [], [], [], [], []
+    t_mins, tcs = [], []
+    for inchi in _dataset_compounds()[:limit]:
+        try:
+            smiles = inchitosmiles(inchi)
+            parameters = copy(predict_pcsaft_parameters(smiles))
+            table, valid = density_table(parameters)
+            sat_table, sat_valid, t_min, tc = saturation_table(smiles)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            print(f"skipped {inchi}: {e}")
+            continue
+        inchis.append(inchi)
+        densities.append(table)
+        density_valid.append(valid)
+        saturations.append(sat_table)
+        saturation_valid.append(sat_valid)
+        t_mins.append(t_min)
+        tcs.append(tc)
+
+    os.makedirs(ATLAS_PATH, exist_ok=True)
+    np.save(osp.join(ATLAS_PATH, "density.npy"), np.array(densities, dtype=np.float32))
+    np.save(osp.join(ATLAS_PATH, "density_valid.npy"), np.array(density_valid))
+    np.save(osp.join(ATLAS_PATH, "saturation.npy"), np.array(saturations))
+    np.save(osp.join(ATLAS_PATH, "saturation_valid.npy"), np.array(saturation_valid))
+    pl.DataFrame(
+        {
+            "inchi1": inchis,
+            "row": list(range(len(inchis))),
+            "t_sat_min": t_mins,
+            "tc": tcs,
+        }
+    ).write_parquet(osp.join(ATLAS_PATH, "index.parquet"))
+
+
+if __name__ == "__main__":
+    build_atlas(int(sys.argv[1]) if len(sys.argv) > 1 else None)
@@ -0,0 +1,149 @@
+"Hover effect of the widgets under the mouse"
+
+from weakref import WeakKeyDictionary, WeakSet, ref
+
+from kivy.core.window import Window
+from kivy.properties import ColorProperty  # pylint: disable=no-name-in-module
+from kivy.uix.button import Button
+from kivy.uix.relativelayout import RelativeLayout
+from kivy.uix.scrollview import ScrollView
+
+# Side in pixels of the cells of the hover index
+HOVER_CELL = 64
+
+
+class HoverManager:
+    """
+    One `mouse_pos` binding for all hoverable widgets. The widgets are
+    indexed by the window cells they cover, so a mouse move hit-tests only
+    the few in the cell under the pointer, and `on_hover(hovered)` is
+    called only on the widgets entered and left. Widgets leave the index
+    when removed from their parent or garbage collected.
+
+    Scroll views and relative layouts move their content without changing
+    its `pos`, so scrolling or moving one marks the index stale, and it is
+    rebuilt once at the next mouse move.
+    """
+
+    def __init__(self):
+        self._cells = {}  # (column, row) -> WeakSet of widgets
+        self._indexed = WeakKeyDictionary()  # widget -> its cells
+        self._watched = WeakSet()  # ancestors moving their content
+        self._stale = False
+        self._hovered = None  # weak reference to the widget under the mouse
+        self._bound = False
+
+    def register(self, widget):
+        "call `widget.on_hover(hovered)` as the mouse enters and leaves it"
+        widget.fbind("pos", self._reindex)
+        widget.fbind("size", self._reindex)
+        widget.fbind("parent", self._on_parent)
+        self._reindex(widget)
+        if not self._bound:
+            Window.bind(mouse_pos=self._on_mouse_pos)  # type: ignore pylint: disable=no-member
+            self._bound = True
+
+    def unregister(self, widget):
+        "drop a widget from the index, leaving its hover state"
+        self._drop(widget)
+        if self._hovered is not None and self._hovered() is widget:
+            self._hovered = None
+            widget.on_hover(False)
+
+    def _on_parent(self, widget, parent):
+        if parent is None:
+            self.unregister(widget)
+        else:
+            self._reindex(widget)
+
+    def _drop(self, widget):
+        for cell in self._indexed.pop(widget, ()):
+            self._cells[cell].discard(widget)
+            if not self._cells[cell]:
+                del self._cells[cell]
+
+    def _invalidate(self, *_):
+        self._stale = True
+
+    def _watch_ancestors(self, widget):
+        "mark the index stale when an ancestor moves its content"
+        parent = widget.parent
+        # the window is its own parent
+        while parent not in (None, widget) and parent not in self._watched:
+            if isinstance(parent, ScrollView):
+                # the content is translated by the scroll and its own size
+                for name in ("scroll_x", "scroll_y", "pos", "size"):
+                    parent.fbind(name, self._invalidate)
+                widget.fbind("size", self._invalidate)
+                self._watched.add(parent)
+            elif isinstance(parent, RelativeLayout):
+                parent.fbind("pos", self._invalidate)
+                self._watched.add(parent)
+            widget, parent = parent, parent.parent
+
+    def _reindex(self, widget, *_):
+        self._drop(widget)
+        self._watch_ancestors(widget)
+        x, y = widget.to_window(*widget.pos)
+        cells = [
+            (column, row)
+            for column in range(
+                int(x // HOVER_CELL), int((x + widget.width) // HOVER_CELL) + 1
+            )
+            for row in range(
+                int(y // HOVER_CELL), int((y + widget.height) // HOVER_CELL) + 1
+            )
+        ]
+        for cell in cells:
+            self._cells.setdefault(cell, WeakSet()).add(widget)
+        self._indexed[widget] = cells
+
+    def _hit(self, pos):
+        "the visible indexed widget under `pos`, if any"
+        cell = (int(pos[0] // HOVER_CELL), int(pos[1] // HOVER_CELL))
+        for widget in self._cells.get(cell, ()):
+            # widgets of the screens not shown are off the window
+            if widget.get_root_window() is not None and widget.collide_point(
+                *widget.to_widget(*pos)
+            ):
+                return widget
+        return None
+
+    def _on_mouse_pos(self, _window, pos):
+        if self._stale:
+            self._stale = False
+            for widget in list(self._indexed.keys()):
+                self._reindex(widget)
+        hit = self._hit(pos)
+        hovered = None if self._hovered is None else self._hovered()
+        if hit is hovered:
+            return
+        if hovered is not None:
+            hovered.on_hover(False)
+        if hit is not None:
+            hit.on_hover(True)
+        self._hovered = None if hit is None else ref(hit)
+
+
+hover_manager = HoverManager()
+
+
+class HoverButton(Button):
+    "Button tinted with `hover_color` while the mouse is over it"
+
+    hover_color = ColorProperty([0.3, 0.6, 1, 1])
+
+    def __init__(self, **kwargs):
+        self._normal_color = None  # background color while hovered
+        super().__init__(**kwargs)
+        # Hover effect through the shared mouse binding
+        hover_manager.register(self)
+
+    def on_hover(self, hovered):
+        "function for mouse hover effect"
+        if hovered:
+            self._normal_color = list(self.background_color)
+            self.background_color = self.hover_color
+        elif self._normal_color is not None:
+            self.background_color = self._normal_color
+            self._normal_color = None
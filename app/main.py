@@ -3,29 +3,64 @@
 import os
 
 import kivy
-import kivy_matplotlib_widget  # pylint: disable=unused-import
 from about_screen import AboutLayout, AboutScreen  # pylint: disable=unused-import
+from hover import HoverButton  # pylint: disable=unused-import
 from kivy.app import App
+from kivy.clock import Clock
+from kivy.factory import Factory
 from kivy.properties import (  # pylint: disable=no-name-in-module
+    BooleanProperty,
+    ListProperty,
+    NumericProperty,
     ObjectProperty,
     StringProperty,
 )
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.screenmanager import Screen, ScreenManager
-from mixture_screen import MixtureLayout, MixtureScreen  # pylint: disable=unused-import
+from panels import data_dropdown
 from pure_screen import PureLayout, PureScreen  # pylint: disable=unused-import
+from utils import dispose_figures
 
 kivy.require("2.3.1")  # replace with your current kivy version
 
 application_path = os.path.dirname(os.path.abspath(__file__))
 
+# Plots listed in the history of the plot screen
+HISTORY_SIZE = 20
+
+# the mixture screen module is imported when the screen is first built;
+# it is listed in the hidden imports of gnnpcsaft.spec for PyInstaller
+Factory.register("MixtureScreen", module="mixture_screen")
+Factory.register("MixtureLayout", module="mixture_screen")
+
 
 class WindowManager(ScreenManager):
-    "Window manager for multiple screens"
+    """
+    Window manager for multiple screens. Only the first screen is built at
+    startup, the others when first navigated to, and kept afterwards.
+    """
+
+    # name -> class of the screens built on first navigation
+    lazy_screens = {
+        "pure_screen": "PureScreen",
+        "mixture_screen": "MixtureScreen",
+        "plot_screen": "PlotScreen",
+        "about_screen": "AboutScreen",
+    }
+
+    def get_screen(self, name):
+        if name in self.lazy_screens and not self.has_screen(name):
+            self.add_widget(Factory.get(self.lazy_screens[name])())
+        return super().get_screen(name)
 
 
 class PlotScreen(Screen):
-    "Plot screen"
+    "Plot screen, loading matplotlib and its widget when first built"
+
+    def __init__(self, **kwargs):
+        import plot_widget  # pylint: disable=import-outside-toplevel,unused-import
+
+        super().__init__(**kwargs)
 
 
 class PlotLayout(BoxLayout):
@@ -33,17 +68,64 @@ class PlotLayout(BoxLayout):
 
     previous_screen = StringProperty("pure_screen")
     matplot_figure = ObjectProperty(None)
+    history = ListProperty([])  # (label, replay) of the plots drawn, latest first
+
+    def remember(self, label, replay):
+        "add a plot to the history, or move it to the top if drawn before"
+        self.history = [(label, replay)] + [
+            entry for entry in self.history if entry[0] != label
+        ][: HISTORY_SIZE - 1]
+
+    def open_history(self, button):
+        "list the plots drawn, each one drawn again when picked"
+        dropdown = data_dropdown(self.history)
+        dropdown.auto_width = False
+        dropdown.width = self.width * 0.8  # the labels name the inputs too
+        dropdown.open(button)
 
 
 class NavBar(BoxLayout):
     "Navigation Bar"
 
 
+class JobStatus(BoxLayout):
+    "Spinner and progress bar of the background job of a screen"
+
+    active = BooleanProperty(False)
+    progress = NumericProperty(0.0)
+    spinner = StringProperty("")
+
+    _job = None
+    _event = None
+    _frame = 0
+
+    def track(self, job):
+        "show the status of a job until it is done"
+        self._job = job
+        self.progress = 0.0
+        self.active = True
+        if self._event is None:
+            self._event = Clock.schedule_interval(self._update, 0.2)
+
+    def _update(self, _dt):
+        if self._job is None or self._job.done:
+            self.active = False
+            self._event.cancel()  # type: ignore
+            self._event = None
+            return
+        self.progress = self._job.progress
+        self._frame = (self._frame + 1) % 4
+        self.spinner = "Calculating" + "." * self._frame
+
+
 class GNNPCSAFT(App):
     "Main app class"
 
     icon = os.path.join(application_path, "512.png")
 
+    def on_stop(self):
+        dispose_figures()
+
 
 if __name__ == "__main__":
     GNNPCSAFT().run()
@@ -1,90 +1,69 @@
 "Mixture Screen"
 
-from copy import copy
+from itertools import product
 
-from gnnepcsaft.pcsaft.pcsaft_feos import critical_points_feos
+import numpy as np
 from gnnepcsaft_mcp_server.utils import predict_pcsaft_parameters
-from kivy.core.window import Window
-from kivy.graphics import Color, Rectangle
+from kivy.clock import Clock
 from kivy.properties import ObjectProperty  # pylint: disable=no-name-in-module
-from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.button import Button
-from kivy.uix.dropdown import DropDown
-from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
 from kivy.uix.screenmanager import Screen
-from utils import (
-    available_params,
-    generate_plot,
-    generate_ternary_plot,
-    get_smiles_from_input,
+from panels import (
+    add_binary_data_dropdowns,
+    add_ternary_data_dropdowns,
+    parameter_table,
 )
+from phase_plots import PhaseEquilibriumPlotsMixin
+from plot_jobs import PREVIEW_SWEEP_POINTS, PropertyPlotsMixin
+from utils import get_smiles_from_input, parse_grid, title_with_note
 from utils_data import (
     retrieve_available_data_binary,
     retrieve_available_data_ternary,
     retrieve_bubble_pressure_data,
-    retrieve_lle_binary_data,
-    retrieve_lle_ternary_data,
+    retrieve_e_h_binary_data,
+    retrieve_e_h_ternary_data,
+    retrieve_gamma_binary_data,
+    retrieve_gamma_inf_binary_data,
     retrieve_rho_binary_data,
     retrieve_rho_ternary_data,
-    retrieve_vle_binary_data,
-    retrieve_vle_pxy_binary_data,
-    retrieve_vle_ternary_data,
+    retrieve_st_binary_data,
+    retrieve_st_binary_x_data,
+    retrieve_st_ternary_data,
 )
-from utils_mix import mix_den, mix_lle, mix_ternary_lle, mix_vle, mix_vle_pxy, mix_vp
-
-
-class MixtureScreen(Screen):
-    "Mixture screen"
-
-
-class ActionLabelCustom(ButtonBehavior, Label):  # type: ignore
-    "Label that acts as a button with hover effect"
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.color = "#0d6efd"  # Default link color (Bootstrap Primary)
-        self.background_color_normal = (1, 1, 1, 0)  # Transparent
-        self.background_color_hover = (0.9, 0.9, 0.9, 1)  # Light Gray
-
-        # Determine initial background logic
-        with self.canvas.before:  # type: ignore
-            self.bg_color = Color(*self.background_color_normal)
-            self.rect = Rectangle(size=self.size, pos=self.pos)
-
-        self.bind(size=self._update_rect, pos=self._update_rect)  # type: ignore pylint: disable=no-member
-
-        # Bind mouse position for hover effect
-        Window.bind(mouse_pos=self.on_mouse_pos)
+from utils_jobs import JobExecutor, session_results
+from utils_mix import (
+    mix_activity_coefficients,
+    mix_den,
+    mix_den_grid,
+    mix_excess_enthalpy,
+    mix_gamma_infinite,
+    mix_properties,
+    mix_surface_tension,
+    mix_surface_tension_x,
+    mix_vp,
+)
+from utils_pure import pure_critical_point
+from utils_sweep import failure_note, require_valid
 
-    def _update_rect(self, instance, value):  # pylint: disable=unused-argument
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
+# Axis labels of the state grid dims
+GRID_LABELS = {"T": "Temperature (K)", "P": "Pressure (Pa)"}
 
-    def on_mouse_pos(self, window, pos):  # pylint: disable=unused-argument
-        "function for mouse hover effect"
-        if not self.get_root_window():
-            return
 
-        if self.collide_point(*self.to_widget(*pos)):
-            # Hover state
-            self.bg_color.rgba = self.background_color_hover
-            self.color = "#0a58ca"  # Darker blue
-        else:
-            # Normal state
-            self.bg_color.rgba = self.background_color_normal
-            self.color = "#0d6efd"
+def _envelope_note(bubble, dew):
+    "describe the failed points of the bubble and dew lines (empty when none)"
+    return "; ".join(
+        f"{name} line {failure_note(line)}"
+        for name, line in (("bubble", bubble), ("dew", dew))
+        if failure_note(line)
+    )
 
-    def on_press(self):
-        self.bg_color.rgba = (0.8, 0.8, 0.8, 1)  # Darker gray on click
 
-    def on_release(self):
-        # Return to hover state color since mouse is likely still over it
-        self.bg_color.rgba = self.background_color_hover
+class MixtureScreen(Screen):
+    "Mixture screen"
 
 
-class MixtureLayout(BoxLayout):
+class MixtureLayout(PhaseEquilibriumPlotsMixin, PropertyPlotsMixin, BoxLayout):
     "Mixture Layout"
 
     smiles_or_inchi_input = ObjectProperty(None)
@@ -94,33 +73,17 @@ class MixtureLayout(BoxLayout):
     temp_max = ObjectProperty(None)
     pressure = ObjectProperty(None)
     predicted_parameters = ObjectProperty(None)
-
-    def _show_error_alert(self, e):
-        error_message = Label(
-            text=f"Error: {str(e)}",
-            size_hint_y=None,
-            height=50,
-        )
-        error_message.font_size = 16
-        error_message.color = "#dc3545"
-        self.predicted_parameters.clear_widgets()
-        self.predicted_parameters.add_widget(error_message)
-
-    def _generate_plot(
-        self, x_data, y_datas, title, x_label, y_label, legends=None, exp_data=None
-    ):
-        try:
-            generate_plot(x_data, y_datas, title, x_label, y_label, legends, exp_data)
-        except (ValueError, RuntimeError) as e:
-            self._show_error_alert(e)
-
-    def _generate_ternary_plot(
-        self, a, b, title, a_label, b_label, legends=None, exp_data=None
-    ):
-        try:
-            generate_ternary_plot(a, b, title, a_label, b_label, legends, exp_data)
-        except (ValueError, RuntimeError) as e:
-            self._show_error_alert(e)
+    job_status = ObjectProperty(None)
+
+    jobs = JobExecutor(Clock.schedule_once, results=session_results)
+    job_inputs = (
+        "smiles_or_inchi_input",
+        "fractions_input",
+        "kij_input",
+        "temp_min",
+        "temp_max",
+        "pressure",
+    )
 
     def _get_smiles(self):
         raw_smiles = self.smiles_or_inchi_input.text.split(" ")
@@ -131,8 +94,18 @@ class MixtureLayout(BoxLayout):
             raise ValueError("Please provide at least one component")
         return smiles_list
 
-    def _get_fractions(self, n):
+    def _get_fractions(self, n, grid=False):
         raw_fracs = self.fractions_input.text.split(" ")
+        if grid:
+            # one grid axis per independent fraction, the last is the remainder
+            axes = [f.strip() for f in raw_fracs if f.strip()]
+            if len(axes) not in (n - 1, n):
+                raise ValueError(
+                    f"Expected {n - 1} fraction values or grids (e.g. 0.1:0.9:9)"
+                )
+            return [
+                parse_grid(axis, f"x{i + 1}") for i, axis in enumerate(axes[: n - 1])
+            ]
         try:
             fractions = [float(f.strip()) for f in raw_fracs if f.strip()]
         except ValueError as e:
@@ -144,7 +117,13 @@ class MixtureLayout(BoxLayout):
             raise ValueError("Number of components and fractions must match")
         return fractions
 
-    def _get_temperatures(self, require_max=True):
+    def _get_temperatures(self, require_max=True, grid=False):
+        if grid:
+            t_grid = parse_grid(self.temp_min.text, "Temperature")
+            if t_grid.size == 1 and self.temp_max.text.strip():
+                t_max = parse_grid(self.temp_max.text, "Temperature")[-1]
+                t_grid = np.linspace(t_grid[0], t_max, 10)
+            return t_grid
         try:
             t_min = float(self.temp_min.text)
             t_max = 0.0
@@ -154,12 +133,25 @@ class MixtureLayout(BoxLayout):
         except ValueError as e:
             raise ValueError("Temperature values must be numeric") from e
 
-    def _get_pressure(self):
+    def _get_pressure(self, grid=False):
+        if grid:
+            return parse_grid(self.pressure.text, "Pressure")
         try:
             return float(self.pressure.text)
         except ValueError as e:
             raise ValueError("Pressure must be a numeric value") from e
 
+    def _get_compositions(self, n):
+        "mole fraction vectors spanned by the fraction input, one per family curve"
+        compositions = [
+            list(x) + [1.0 - sum(x)]
+            for x in product(*self._get_fractions(n, grid=True))
+            if sum(x) <= 1.0
+        ]
+        if not compositions:
+            raise ValueError("Fractions must sum to at most 1")
+        return compositions
+
     def _get_kij(self, n):
         kij_txt = self.kij_input.text.strip()
         kij_matrix = [[0.0] * n for _ in range(n)]
@@ -233,389 +225,74 @@ class MixtureLayout(BoxLayout):
             if not smiles_list:
                 return
 
-            if len(smiles_list) == 2:
-                # Check for binary data availability
-                try:
-                    rho_data, bubble_data, lle_data, vle_data, vle_pxy_data = (
-                        retrieve_available_data_binary(smiles_list)
-                    )
-
-                    if any(
-                        (exp_data is not None and len(exp_data) > 0)
-                        for exp_data in [
-                            rho_data,
-                            bubble_data,
-                            lle_data,
-                            vle_data,
-                            vle_pxy_data,
-                        ]
-                    ):
-                        self.predicted_parameters.add_widget(
-                            Label(
-                                text="Experimental Data Availability",
-                                size_hint_y=None,
-                                height=40,
-                                color="#0d6efd",
-                                font_size=20,
-                                bold=True,
-                            )
-                        )
-
-                    # Bubble Point Data (P-T Envelopes)
-                    if bubble_data is not None and len(bubble_data) > 0:
-                        dropdown_bp = DropDown()
-                        for row in bubble_data:
-                            # [x_approx, T_min, T_max]
-                            btn = Button(
-                                text=f"x={row[0]:.2f}: {row[1]:.2f}-{row[2]:.2f} K",
-                                size_hint_y=None,
-                                height=44,
-                            )
-                            btn.bind(  # type: ignore pylint: disable=no-member
-                                on_release=lambda btn, r=row: (
-                                    self._fill_inputs_binary(
-                                        t_min=r[1], t_max=r[2], x1=r[0]
-                                    ),
-                                    dropdown_bp.dismiss(),
-                                )
-                            )
-                            dropdown_bp.add_widget(btn)
-
-                        main_button = Button(
-                            text="Select Bubble Pt. Data",
-                            size_hint_y=None,
-                            height=44,
-                            size_hint_x=0.4,
-                            pos_hint={"center_x": 0.5},
-                            background_color=(0.1, 0.5, 0.8, 1),
-                        )
-                        main_button.bind(on_release=dropdown_bp.open)  # type: ignore pylint: disable=no-member
-                        self.predicted_parameters.add_widget(main_button)
-
-                    # VLE Data
-                    if vle_data is not None and len(vle_data) > 0:
-                        dropdown_vle = DropDown()
-                        for row in vle_data:
-                            # [P_kPa, T_min, T_max]
-                            # Display T range for P
-                            btn = Button(
-                                text=f"Isobar: P={row[0]:.5g} kPa: {row[1]:.2f}-{row[2]:.2f} K",
-                                size_hint_y=None,
-                                height=44,
-                            )
-                            btn.bind(  # type: ignore pylint: disable=no-member
-                                on_release=lambda btn, r=row: (
-                                    self._fill_inputs_binary(
-                                        pressure=r[0], t_min=r[1], t_max=r[2]
-                                    ),
-                                    dropdown_vle.dismiss(),
-                                )
-                            )
-                            dropdown_vle.add_widget(btn)
-
-                        main_button = Button(
-                            text="Select Isobaric VLE Data",
-                            size_hint_y=None,
-                            height=44,
-                            size_hint_x=0.4,
-                            pos_hint={"center_x": 0.5},
-                            background_color=(0.1, 0.5, 0.8, 1),
-                        )
-                        main_button.bind(on_release=dropdown_vle.open)  # type: ignore pylint: disable=no-member
-                        self.predicted_parameters.add_widget(main_button)
-
-                    # VLE Data (Isothermal P-x-y)
-                    if vle_pxy_data is not None and len(vle_pxy_data) > 0:
-                        dropdown_vle_pxy = DropDown()
-                        for row in vle_pxy_data:
-                            # [T_approx, P_min, P_max]
-                            btn = Button(
-                                text=f"Isotherm: T={row[0]:.2f} K: {row[1]:.0f}-{row[2]:.0f} kPa",
-                                size_hint_y=None,
-                                height=44,
-                            )
-                            btn.bind(  # type: ignore pylint: disable=no-member
-                                on_release=lambda btn, r=row: (
-                                    self._fill_inputs_binary(t_min=r[0], t_max=r[0]),
-                                    dropdown_vle_pxy.dismiss(),
-                                )
-                            )
-                            dropdown_vle_pxy.add_widget(btn)
-
-                        main_button = Button(
-                            text="Select Isothermal VLE Data",
-                            size_hint_y=None,
-                            height=44,
-                            size_hint_x=0.4,
-                            pos_hint={"center_x": 0.5},
-                            background_color=(0.1, 0.5, 0.8, 1),
-                        )
-                        main_button.bind(on_release=dropdown_vle_pxy.open)  # type: ignore pylint: disable=no-member
-                        self.predicted_parameters.add_widget(main_button)
-
-                    # LLE Data
-                    if lle_data is not None and len(lle_data) > 0:
-                        dropdown_lle = DropDown()
-                        for row in lle_data:
-                            # [P_kPa, T_min, T_max]
-                            # Display T range for P
-                            btn = Button(
-                                text=f"P={row[0]:.5g} kPa: {row[1]:.2f}-{row[2]:.2f} K",
-                                size_hint_y=None,
-                                height=44,
-                            )
-                            btn.bind(  # type: ignore pylint: disable=no-member
-                                on_release=lambda btn, r=row: (
-                                    self._fill_inputs_binary(
-                                        pressure=r[0], t_min=r[1], t_max=r[2]
-                                    ),
-                                    dropdown_lle.dismiss(),
-                                )
-                            )
-                            dropdown_lle.add_widget(btn)
-
-                        main_button = Button(
-                            text="Select LLE Data",
-                            size_hint_y=None,
-                            height=44,
-                            size_hint_x=0.4,
-                            pos_hint={"center_x": 0.5},
-                            background_color=(0.1, 0.5, 0.8, 1),
-                        )
-                        main_button.bind(on_release=dropdown_lle.open)  # type: ignore pylint: disable=no-member
-                        self.predicted_parameters.add_widget(main_button)
-
-                    # Density Data
-                    if rho_data is not None and len(rho_data) > 0:
-                        dropdown = DropDown()
-                        for row in rho_data:
-                            # [P_kPa, x_c1, T_min, T_max]
-                            btn = Button(
-                                text=f"P={row[0]:.5g} kPa, x={row[1]:.2f}",
-                                size_hint_y=None,
-                                height=44,
-                            )
-                            btn.bind(  # type: ignore pylint: disable=no-member
-                                on_release=lambda btn, r=row: (
-                                    self._fill_inputs_binary(
-                                        pressure=r[0], t_min=r[2], t_max=r[3], x1=r[1]
-                                    ),
-                                    dropdown.dismiss(),
-                                )
-                            )
-                            dropdown.add_widget(btn)
-
-                        main_button = Button(
-                            text="Select Liquid Density Data",
-                            size_hint_y=None,
-                            height=44,
-                            size_hint_x=0.4,
-                            pos_hint={"center_x": 0.5},
-                            background_color=(0.1, 0.5, 0.8, 1),
-                        )
-                        main_button.bind(on_release=dropdown.open)  # type: ignore pylint: disable=no-member
-                        self.predicted_parameters.add_widget(main_button)
-
-                except (ValueError, RuntimeError):
-                    pass
-
-            elif len(smiles_list) == 3:
-                # Check for ternary data availability
+            def compute():
+                available = None
                 try:
-                    rho_data_t, lle_data_t, vle_data_t = (
-                        retrieve_available_data_ternary(smiles_list)
-                    )
-
-                    if any(
-                        (exp_data is not None and len(exp_data) > 0)
-                        for exp_data in [rho_data_t, lle_data_t, vle_data_t]
-                    ):
-                        self.predicted_parameters.add_widget(
-                            Label(
-                                text="Experimental Data Availability",
-                                size_hint_y=None,
-                                height=40,
-                                color="#0d6efd",
-                                font_size=20,
-                                bold=True,
-                            )
-                        )
-
-                    # Density Data
-                    if rho_data_t is not None and len(rho_data_t) > 0:
-                        dropdown_t = DropDown()
-                        for row in rho_data_t:
-                            # [P_kPa, x1, x2, T_min, T_max]
-                            btn = Button(
-                                text=f"P={row[0]:.5g} kPa, x=[{row[1]:.2f}, {row[2]:.2f}]",
-                                size_hint_y=None,
-                                height=44,
-                            )
-                            btn.bind(  # type: ignore pylint: disable=no-member
-                                on_release=lambda btn, r=row: (
-                                    self._fill_inputs_ternary(
-                                        pressure=r[0],
-                                        x1=r[1],
-                                        x2=r[2],
-                                        t_min=r[3],
-                                        t_max=r[4],
-                                    ),
-                                    dropdown_t.dismiss(),
-                                )
-                            )
-                            dropdown_t.add_widget(btn)
-
-                        main_button = Button(
-                            text="Select Ternary Density Data",
-                            size_hint_y=None,
-                            height=44,
-                            size_hint_x=0.4,
-                            pos_hint={"center_x": 0.5},
-                            background_color=(0.1, 0.5, 0.8, 1),
-                        )
-                        main_button.bind(on_release=dropdown_t.open)  # type: ignore pylint: disable=no-member
-                        self.predicted_parameters.add_widget(main_button)
-
-                    # LLE Data
-                    if lle_data_t is not None and len(lle_data_t) > 0:
-                        dropdown_llet = DropDown()
-                        for row in lle_data_t:
-                            # [P_kPa, T_K]
-                            btn = Button(
-                                text=f"LLE: P={row[0]:.5g} kPa, T={row[1]:.2f} K",
-                                size_hint_y=None,
-                                height=44,
-                            )
-                            btn.bind(  # type: ignore pylint: disable=no-member
-                                on_release=lambda btn, r=row: (
-                                    self._fill_inputs_ternary(
-                                        pressure=r[0],
-                                        t_min=r[1],
-                                        t_max=r[1],  # Set fixed T
-                                    ),
-                                    dropdown_llet.dismiss(),
-                                )
-                            )
-                            dropdown_llet.add_widget(btn)
-
-                        main_button = Button(
-                            text="Select Ternary LLE Data",
-                            size_hint_y=None,
-                            height=44,
-                            size_hint_x=0.4,
-                            pos_hint={"center_x": 0.5},
-                            background_color=(0.1, 0.5, 0.8, 1),
-                        )
-                        main_button.bind(on_release=dropdown_llet.open)  # type: ignore pylint: disable=no-member
-                        self.predicted_parameters.add_widget(main_button)
-
-                    # VLE Data (Ternary)
-                    if vle_data_t is not None and len(vle_data_t) > 0:
-                        dropdown_vlet = DropDown()
-                        for row in vle_data_t:
-                            # [P_kPa, T_K]
-                            btn = Button(
-                                text=f"VLE: P={row[0]:.5g} kPa, T={row[1]:.2f} K",
-                                size_hint_y=None,
-                                height=44,
-                            )
-                            btn.bind(  # type: ignore pylint: disable=no-member
-                                on_release=lambda btn, r=row: (
-                                    self._fill_inputs_ternary(
-                                        pressure=r[0],
-                                        t_min=r[1],
-                                        t_max=r[1],  # Set fixed T
-                                    ),
-                                    dropdown_vlet.dismiss(),
-                                )
-                            )
-                            dropdown_vlet.add_widget(btn)
-
-                        main_button = Button(
-                            text="Select Ternary VLE Data",
-                            size_hint_y=None,
-                            height=44,
-                            size_hint_x=0.4,
-                            pos_hint={"center_x": 0.5},
-                            background_color=(0.1, 0.5, 0.8, 1),
-                        )
-                        main_button.bind(on_release=dropdown_vlet.open)  # type: ignore pylint: disable=no-member
-                        self.predicted_parameters.add_widget(main_button)
-
+                    if len(smiles_list) == 2:
+                        # Check for binary data availability
+                        available = retrieve_available_data_binary(smiles_list)
+                    elif len(smiles_list) == 3:
+                        # Check for ternary data availability
+                        available = retrieve_available_data_ternary(smiles_list)
                 except (ValueError, RuntimeError):
                     pass
 
-            self.predicted_parameters.add_widget(Label(size_hint_y=None, height=10))
-
-            for smile in smiles_list:
-                pred = predict_pcsaft_parameters(smile)
-                pred += critical_points_feos(copy(pred))
-
-                # Header for this component
-                comp_header = Label(
-                    text=f"Component: {smile}",
-                    size_hint_y=None,
-                    height=40,
-                    color="#198754",
-                    font_size=18,
-                    bold=True,
-                    halign="left",
-                )
-                comp_header.bind(size=comp_header.setter("text_size"))  # type: ignore pylint: disable=no-member
-                self.predicted_parameters.add_widget(comp_header)
-
-                # Table
-                row_height = 30
-                params_count = len(available_params)
-                table_height = (params_count + 1) * row_height
-
-                table = GridLayout(
-                    cols=2,
-                    size_hint_y=None,
-                    height=table_height,
-                    spacing=[10, 5],
-                )
-
-                # Headers
-                table.add_widget(
-                    Label(
-                        text="Parameter name", bold=True, color="#212529", halign="left"
-                    )
-                )
-                table.add_widget(
-                    Label(
-                        text="Parameter value",
-                        bold=True,
-                        color="#212529",
-                        halign="right",
-                    )
-                )
+                preds = []
+                for smile in smiles_list:
+                    pred = predict_pcsaft_parameters(smile)
+                    pred += list(pure_critical_point(smile))
+                    preds.append(pred)
+                return available, preds
+
+            self._run_job(
+                "submit",
+                compute,
+                lambda result: self._show_parameters(smiles_list, *result),
+                history=False,
+            )
+        except (ValueError, RuntimeError) as e:
+            self._show_error_alert(e)
 
-                for name, para in zip(available_params, pred):
-                    param_label = Label(text=str(name), color="#212529", halign="left")
-                    param_label.bind(size=param_label.setter("text_size"))  # type: ignore pylint: disable=no-member
-                    table.add_widget(param_label)
+    def _show_parameters(self, smiles_list, available, preds):
+        "display the experimental data availability and the estimated parameters"
+        if available is not None and len(smiles_list) == 2:
+            add_binary_data_dropdowns(
+                self.predicted_parameters, self._fill_inputs_binary, *available
+            )
+        elif available is not None and len(smiles_list) == 3:
+            add_ternary_data_dropdowns(
+                self.predicted_parameters, self._fill_inputs_ternary, *available
+            )
 
-                    param_label_value = Label(
-                        text=f"{para:.5g}", color="#212529", halign="right"
-                    )
-                    param_label_value.bind(size=param_label_value.setter("text_size"))  # type: ignore pylint: disable=no-member
-                    table.add_widget(param_label_value)
+        self.predicted_parameters.add_widget(Label(size_hint_y=None, height=10))
 
-                self.predicted_parameters.add_widget(table)
+        for smile, pred in zip(smiles_list, preds):
 
-            # Footer
-            footer = Label(
-                text="* Not estimated",
+            # Header for this component
+            comp_header = Label(
+                text=f"Component: {smile}",
                 size_hint_y=None,
-                height=30,
-                color="#6c757d",
-                italic=True,
+                height=40,
+                color="#198754",
+                font_size=18,
+                bold=True,
+                halign="left",
             )
-            self.predicted_parameters.add_widget(footer)
+            comp_header.bind(size=comp_header.setter("text_size"))  # type: ignore pylint: disable=no-member
+            self.predicted_parameters.add_widget(comp_header)
 
-        except (ValueError, RuntimeError) as e:
-            self._show_error_alert(e)
+            # Table of the parameters, recycled rows
+            self.predicted_parameters.add_widget(parameter_table(pred))
+
+        # Footer
+        footer = Label(
+            text="* Not estimated",
+            size_hint_y=None,
+            height=30,
+            color="#6c757d",
+            italic=True,
+        )
+        self.predicted_parameters.add_widget(footer)
 
     def on_plot_density(self):
         "plot mixture density vs temperature"
@@ -625,292 +302,535 @@ class MixtureLayout(BoxLayout):
             fractions = self._get_fractions(n)
             kij_matrix = self._get_kij(n)
             t_min, t_max = self._get_temperatures(require_max=True)
-            p_val = self._get_pressure()
-
-            # Fetch Experimental Data
-            exp_data = None
-            if len(smiles_list) == 2:
-                try:
-                    # fractions[0] corresponds to x1 relative to smiles_list order
-                    exp_array = retrieve_rho_binary_data(
-                        smiles_list, p_val / 1000.0, fractions[0]
-                    )
-                    if exp_array is not None and len(exp_array) > 0:
-                        exp_data = (exp_array[:, 0], exp_array[:, 1], "Exp. Data")
-                except (ValueError, RuntimeError):
-                    pass
+            pressures = self._get_pressure(grid=True)
+            if len(pressures) > 1:
+                self._plot_density_family(
+                    smiles_list, fractions, kij_matrix, t_min, t_max, pressures
+                )
+                return
+            p_val = float(pressures[0])
 
-            elif len(smiles_list) == 3:
-                try:
-                    # fractions[0]=x1, fractions[1]=x2
-                    if len(fractions) >= 2:
-                        exp_array = retrieve_rho_ternary_data(
-                            smiles_list, p_val / 1000.0, fractions[0], fractions[1]
+            def fetch_exp_data():
+                exp_data = None
+                if len(smiles_list) == 2:
+                    try:
+                        # fractions[0] corresponds to x1 relative to smiles_list order
+                        exp_array = retrieve_rho_binary_data(
+                            smiles_list, p_val / 1000.0, fractions[0]
                         )
                         if exp_array is not None and len(exp_array) > 0:
                             exp_data = (exp_array[:, 0], exp_array[:, 1], "Exp. Data")
-                except (ValueError, RuntimeError):
-                    pass
+                    except (ValueError, RuntimeError):
+                        pass
+
+                elif len(smiles_list) == 3:
+                    try:
+                        # fractions[0]=x1, fractions[1]=x2
+                        if len(fractions) >= 2:
+                            exp_array = retrieve_rho_ternary_data(
+                                smiles_list, p_val / 1000.0, fractions[0], fractions[1]
+                            )
+                            if exp_array is not None and len(exp_array) > 0:
+                                exp_data = (
+                                    exp_array[:, 0],
+                                    exp_array[:, 1],
+                                    "Exp. Data",
+                                )
+                    except (ValueError, RuntimeError):
+                        pass
+                return exp_data
+
+            def curve(preview):
+                sweep = require_valid(
+                    mix_den(
+                        smiles_list,
+                        fractions,
+                        kij_matrix,
+                        t_min,
+                        t_max,
+                        p_val,
+                        num=PREVIEW_SWEEP_POINTS if preview else 10,
+                    )
+                )
+                title = "Mixture Density vs Temperature"
+                return sweep.x, sweep.y, title_with_note(title, failure_note(sweep))
 
-            temperatures, densities = mix_den(
-                smiles_list, fractions, kij_matrix, t_min, t_max, p_val
+            self._plot_progressive(
+                "density",
+                curve,
+                "Temperature (K)",
+                "Density (mol/m³)",
+                fetch_exp_data=fetch_exp_data,
+                stream=lambda sweep: (
+                    sweep.x,
+                    sweep.y,
+                    "Mixture Density vs Temperature",
+                ),
             )
+        except (ValueError, RuntimeError) as e:
+            self._show_error_alert(e)
+
+    def _plot_density_family(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self, smiles_list, fractions, kij_matrix, t_min, t_max, pressures
+    ):
+        "plot a family of mixture density isobars, one per pressure"
+
+        def done(result):
+            curves, note = result
             self._generate_plot(
-                temperatures,
-                densities,
-                "Mixture Density vs Temperature",
+                [sweep.x for _, sweep in curves],
+                [sweep.y for _, sweep in curves],
+                title_with_note("Mixture Density vs Temperature", note),
                 "Temperature (K)",
                 "Density (mol/m³)",
-                exp_data=exp_data,
+                legends=[f"{p:g} Pa" for p, _ in curves],
             )
+
+        self._run_job(
+            "density",
+            lambda: self._compute_family(
+                lambda p: require_valid(
+                    mix_den(smiles_list, fractions, kij_matrix, t_min, t_max, p)
+                ),
+                [float(p) for p in pressures],
+                lambda p: f"{p:g} Pa",
+            ),
+            done,
+        )
+
+    def on_plot_density_map(self):
+        "plot mixture density over a temperature, pressure and composition grid"
+        try:
+            smiles_list = self._get_smiles()
+            n = len(smiles_list)
+            if n < 2:
+                raise ValueError("Density map needs at least two components")
+            kij_matrix = self._get_kij(n)
+            fractions = self._get_fractions(n, grid=True)
+            pressures = self._get_pressure(grid=True)
+            temperatures = self._get_temperatures(grid=True)
+
+            def compute():
+                grid = mix_den_grid(
+                    smiles_list, kij_matrix, fractions, pressures, temperatures
+                ).squeeze()
+                if not grid.dims or len(grid.dims) > 2:
+                    raise ValueError(
+                        "Density map needs one or two grid inputs (e.g. 300:400:11)"
+                    )
+                if not np.any(grid.valid):
+                    raise ValueError("Density calculation failed at all grid points")
+                return grid
+
+            def done(grid):
+                # the last axis is the x axis, the other one a family of lines
+                x_dim = grid.dims[-1]
+                values = grid.values.reshape(-1, len(grid.coords[x_dim]))
+                legends = None
+                if len(grid.dims) == 2:
+                    legends = [
+                        f"{grid.dims[0]}={v:g}" for v in grid.coords[grid.dims[0]]
+                    ]
+                self._generate_plot(
+                    grid.coords[x_dim],
+                    list(values),
+                    "Mixture Density Map",
+                    GRID_LABELS.get(x_dim, f"Mole fraction {x_dim}"),
+                    "Density (mol/m³)",
+                    legends=legends,
+                )
+
+            self._run_job("density map", compute, done)
         except (ValueError, RuntimeError) as e:
             self._show_error_alert(e)
 
+    def _property_sweep(self, name):
+        "state properties along the isobar, with the plot title of `name`"
+        smiles_list = self._get_smiles()
+        n = len(smiles_list)
+        fractions = self._get_fractions(n)
+        kij_matrix = self._get_kij(n)
+        t_min, t_max = self._get_temperatures(require_max=True)
+        p_val = self._get_pressure()
+        return (
+            lambda num: mix_properties(
+                smiles_list, fractions, kij_matrix, t_min, t_max, p_val, num=num
+            ),
+            f"Mixture {name} vs Temperature",
+        )
+
     def on_plot_vp(self):
         "plot mixture vapor pressure vs temperature"
         try:
             smiles_list = self._get_smiles()
             n = len(smiles_list)
-            fractions = self._get_fractions(n)
             kij_matrix = self._get_kij(n)
-            t_min, t_max = self._get_temperatures(require_max=True)
+            t_min, _ = self._get_temperatures(require_max=False)
+            compositions = self._get_compositions(n)
+            if len(compositions) > 1:
+                self._plot_vp_family(smiles_list, kij_matrix, t_min, compositions)
+                return
+            fractions = self._get_fractions(n)
 
-            # Fetch Experimental Bubble Point Data (P vs T for constant x)
-            exp_data = None
-            try:
-                if len(smiles_list) == 2:
-                    # Retrieve data for x1 = fractions[0]
-                    exp_bp = retrieve_bubble_pressure_data(smiles_list, fractions[0])
-                    if exp_bp is not None and len(exp_bp) > 0:
-                        # exp_bp: [T, P_kPa] -> Convert kPa to Pa
-                        exp_data = (
-                            exp_bp[:, 0],
-                            exp_bp[:, 1] * 1000.0,
-                            "Exp. Bubble P",
+            def compute():
+                # Fetch Experimental Bubble Point Data (P vs T for constant x)
+                exp_data = None
+                try:
+                    if len(smiles_list) == 2:
+                        # Retrieve data for x1 = fractions[0]
+                        exp_bp = retrieve_bubble_pressure_data(
+                            smiles_list, fractions[0]
                         )
-            except (ValueError, RuntimeError):
-                pass
+                        if exp_bp is not None and len(exp_bp) > 0:
+                            # exp_bp: [T, P_kPa] -> Convert kPa to Pa
+                            exp_data = (
+                                exp_bp[:, 0],
+                                exp_bp[:, 1] * 1000.0,
+                                "Exp. Bubble P",
+                            )
+                except (ValueError, RuntimeError):
+                    pass
 
-            temperatures, bubbles, dews = mix_vp(
-                smiles_list, fractions, kij_matrix, t_min, t_max
-            )
+                return (
+                    mix_vp(smiles_list, fractions, kij_matrix, t_min),
+                    exp_data,
+                )
+
+            def done(result):
+                (bubble, dew), exp_data = result
+                self._generate_plot(
+                    [bubble.x, dew.x],
+                    [bubble.y, dew.y],
+                    title_with_note(
+                        "Mixture Phase Envelope (P-T)",
+                        _envelope_note(bubble, dew),
+                    ),
+                    "Temperature (K)",
+                    "Pressure (Pa)",
+                    legends=["Bubble Point", "Dew Point"],
+                    exp_data=exp_data,
+                )
+
+            self._run_job("vp", compute, done)
+        except (ValueError, RuntimeError) as e:
+            self._show_error_alert(e)
+
+    def _plot_vp_family(self, smiles_list, kij_matrix, t_min, compositions):
+        "plot a family of mixture phase envelopes, one per composition"
+
+        def describe(fractions):
+            return " ".join(f"x{i + 1}={x:g}" for i, x in enumerate(fractions[:-1]))
+
+        def done(result):
+            curves, note = result
+            x_datas, y_datas, legends = [], [], []
+            notes = [note]
+            for fractions, (bubble, dew) in curves:
+                x_datas += [bubble.x, dew.x]
+                y_datas += [bubble.y, dew.y]
+                failed = _envelope_note(bubble, dew)
+                if failed:
+                    notes.append(f"{describe(fractions)}: {failed}")
+                legends += [
+                    f"Bubble {describe(fractions)}",
+                    f"Dew {describe(fractions)}",
+                ]
             self._generate_plot(
-                temperatures,
-                [bubbles, dews],
-                "Mixture Phase Envelope (P-T)",
+                x_datas,
+                y_datas,
+                title_with_note("Mixture Phase Envelope (P-T)", *notes),
                 "Temperature (K)",
                 "Pressure (Pa)",
-                legends=["Bubble Point", "Dew Point"],
-                exp_data=exp_data,
+                legends=legends,
             )
-        except (ValueError, RuntimeError) as e:
-            self._show_error_alert(e)
 
-    def on_plot_binary_vle_txy(self):
-        "plot binary VLE T-x-y"
+        self._run_job(
+            "vp",
+            lambda: self._compute_family(
+                lambda fractions: mix_vp(smiles_list, fractions, kij_matrix, t_min),
+                compositions,
+                describe,
+            ),
+            done,
+        )
+
+    def on_plot_surface_tension(self):
+        "plot mixture surface tension vs temperature"
         try:
             smiles_list = self._get_smiles()
-            if len(smiles_list) != 2:
-                raise ValueError(
-                    f"VLE for binary mixture, got {len(smiles_list)} components instead"
-                )
-
             n = len(smiles_list)
+            fractions = self._get_fractions(n)
             kij_matrix = self._get_kij(n)
-            p_val = self._get_pressure()
-
-            # Retrieve Experimental Data
-            exp_data = None
-            try:
-                vle_arr = retrieve_vle_binary_data(smiles_list, p_val / 1000.0)
-                if vle_arr is not None and len(vle_arr) > 0:
-                    # vle_arr: [T, x_c1]
-                    exp_data = (vle_arr[:, 1], vle_arr[:, 0], "Exp. data")
-            except (ValueError, RuntimeError):
-                pass
-
-            output = mix_vle(smiles_list, kij_matrix, p_val)
+            t_min, t_max = self._get_temperatures(require_max=True)
 
-            # Check density for correct phase assignment (Liquid > Vapor)
-            # to fix high-pressure inversions
-            dens_l = output["density liquid"]
-            dens_v = output["density vapor"]
-            is_normal = sum(l > v for l, v in zip(dens_l, dens_v)) > len(dens_l) / 2
+            def fetch_exp_data():
+                exp_data = None
+                try:
+                    exp_array = None
+                    if n == 2:
+                        exp_array = retrieve_st_binary_data(smiles_list, fractions[0])
+                    elif n == 3:
+                        exp_array = retrieve_st_ternary_data(
+                            smiles_list, fractions[0], fractions[1]
+                        )
+                    if exp_array is not None and len(exp_array) > 0:
+                        # Convert N/m to mN/m for plotting
+                        exp_data = (
+                            exp_array[:, 0],
+                            exp_array[:, 1] * 1e3,
+                            "Exp. Data",
+                        )
+                except (ValueError, RuntimeError):
+                    pass
+                return exp_data
+
+            def curve(preview):
+                sweep = require_valid(
+                    mix_surface_tension(
+                        smiles_list,
+                        fractions,
+                        kij_matrix,
+                        t_min,
+                        t_max,
+                        num=PREVIEW_SWEEP_POINTS if preview else 10,
+                    )
+                )
+                title = "Mixture Surface Tension vs Temperature"
+                return sweep.x, sweep.y, title_with_note(title, failure_note(sweep))
 
-            self._generate_plot(
-                list(
-                    (output["x0"], output["y0"])
-                    if is_normal
-                    else (output["y0"], output["x0"])
-                ),
-                output["temperature"],
-                f"VLE T-x-y for {smiles_list[0]} at {p_val} Pa",
-                "x,y",
+            self._plot_progressive(
+                "surface tension",
+                curve,
                 "Temperature (K)",
-                legends=["Liquid", "Vapor"],
-                exp_data=exp_data,
+                "Surface Tension (mN/m)",
+                fetch_exp_data=fetch_exp_data,
+                stream=lambda sweep: (
+                    sweep.x,
+                    sweep.y,
+                    "Mixture Surface Tension vs Temperature",
+                ),
             )
         except (ValueError, RuntimeError) as e:
             self._show_error_alert(e)
 
-    def on_plot_binary_vle_pxy(self):
-        "plot binary VLE P-x-y"
+    def on_plot_binary_st_x(self):
+        "plot binary surface tension vs liquid composition"
         try:
             smiles_list = self._get_smiles()
             if len(smiles_list) != 2:
                 raise ValueError(
-                    f"VLE for binary mixture, got {len(smiles_list)} components instead"
+                    "Surface tension for binary mixture, "
+                    f"got {len(smiles_list)} components instead"
                 )
 
-            n = len(smiles_list)
-            kij_matrix = self._get_kij(n)
+            kij_matrix = self._get_kij(2)
             t_min, _ = self._get_temperatures(require_max=False)
 
-            # Retrieve Experimental Data
-            exp_data = None
-            try:
-                # Returns [P_kPa, x_c1]
-                vle_arr = retrieve_vle_pxy_binary_data(smiles_list, t_min)
-                if vle_arr is not None and len(vle_arr) > 0:
-                    exp_data = (vle_arr[:, 1], vle_arr[:, 0] * 1000.0, "Exp. data")
-            except (ValueError, RuntimeError):
-                pass
-
-            output = mix_vle_pxy(smiles_list, kij_matrix, t_min)
+            def compute():
+                # Retrieve Experimental Data
+                exp_data = None
+                try:
+                    # Returns [x_c1, st (N/m)]
+                    st_arr = retrieve_st_binary_x_data(smiles_list, t_min)
+                    if st_arr is not None and len(st_arr) > 0:
+                        exp_data = (st_arr[:, 0], st_arr[:, 1] * 1e3, "Exp. Data")
+                except (ValueError, RuntimeError):
+                    pass
 
-            # Check density for correct phase assignment
-            dens_l = output["density liquid"]
-            dens_v = output["density vapor"]
-            # For P-x-y, higher pressure usually liquid
-            is_normal = sum(l > v for l, v in zip(dens_l, dens_v)) > len(dens_l) / 2
+                sweep = mix_surface_tension_x(smiles_list, kij_matrix, t_min)
+                return require_valid(sweep), exp_data
+
+            def done(result):
+                sweep, exp_data = result
+                self._generate_plot(
+                    sweep.x,
+                    sweep.y,
+                    title_with_note(
+                        f"Surface Tension for {smiles_list[0]} at {t_min} K",
+                        failure_note(sweep),
+                    ),
+                    "x",
+                    "Surface Tension (mN/m)",
+                    exp_data=exp_data,
+                )
 
-            self._generate_plot(
-                list(
-                    (output["x0"], output["y0"])
-                    if is_normal
-                    else (output["y0"], output["x0"])
+            self._run_job(
+                "st-x",
+                compute,
+                done,
+                stream=self._stream_plot(
+                    lambda sweep: (
+                        sweep.x,
+                        sweep.y,
+                        f"Surface Tension for {smiles_list[0]} at {t_min} K",
+                    ),
+                    "x",
+                    "Surface Tension (mN/m)",
                 ),
-                output["pressure"],
-                f"VLE P-x-y for {smiles_list[0]} at {t_min} K",
-                "x,y",
-                "Pressure (Pa)",
-                legends=["Liquid", "Vapor"],
-                exp_data=exp_data,
             )
         except (ValueError, RuntimeError) as e:
             self._show_error_alert(e)
 
-    def on_plot_binary_vle_xy(self):
-        "plot binary VLE x-y"
-        try:
-            smiles_list = self._get_smiles()
-            if len(smiles_list) != 2:
-                raise ValueError(
-                    f"VLE for binary mixture, got {len(smiles_list)} components instead"
-                )
+    def _get_binary_smiles(self, prop):
+        smiles_list = self._get_smiles()
+        if len(smiles_list) != 2:
+            raise ValueError(
+                f"{prop} for binary mixture, got {len(smiles_list)} components instead"
+            )
+        return smiles_list
 
-            n = len(smiles_list)
-            kij_matrix = self._get_kij(n)
+    def on_plot_binary_gamma_x(self):
+        "plot binary activity coefficients vs liquid composition"
+        try:
+            smiles_list = self._get_binary_smiles("Activity coefficients")
+            kij_matrix = self._get_kij(2)
+            t_min, _ = self._get_temperatures(require_max=False)
             p_val = self._get_pressure()
+            x1 = np.linspace(0.0, 1.0, num=21)
 
-            output = mix_vle(smiles_list, kij_matrix, p_val)
+            def compute():
+                # Retrieve Experimental Data
+                exp_data = None
+                try:
+                    # Returns [x_c1, gamma1, gamma2]
+                    gamma_arr = retrieve_gamma_binary_data(smiles_list, t_min)
+                    if gamma_arr is not None and len(gamma_arr) > 0:
+                        exp_data = [
+                            (gamma_arr[:, 0], gamma_arr[:, 1], "Exp. γ1"),
+                            (gamma_arr[:, 0], gamma_arr[:, 2], "Exp. γ2"),
+                        ]
+                except (ValueError, RuntimeError):
+                    pass
 
-            dens_l = output["density liquid"]
-            dens_v = output["density vapor"]
-            is_normal = sum(l > v for l, v in zip(dens_l, dens_v)) > len(dens_l) / 2
+                gammas = mix_activity_coefficients(
+                    smiles_list, kij_matrix, t_min, p_val, [[x, 1.0 - x] for x in x1]
+                )
+                return gammas, exp_data
+
+            def done(result):
+                gammas, exp_data = result
+                self._generate_plot(
+                    x1,
+                    [gammas[:, 0], gammas[:, 1]],
+                    f"Activity Coefficients for {smiles_list[0]} at {t_min} K",
+                    "x",
+                    "γ",
+                    legends=["γ1", "γ2"],
+                    exp_data=exp_data,
+                )
 
-            self._generate_plot(
-                *(
-                    (output["x0"], output["y0"])
-                    if is_normal
-                    else (output["y0"], output["x0"])
-                ),
-                f"VLE x-y for {smiles_list[0]} at {p_val} Pa",
-                "x",
-                "y",
-            )
+            self._run_job("gamma-x", compute, done)
         except (ValueError, RuntimeError) as e:
             self._show_error_alert(e)
 
-    def on_plot_binary_lle_txx(self):
-        "plot binary LLE T-x-x"
+    def on_plot_binary_gamma_inf(self):
+        "plot binary infinite dilution activity coefficients vs temperature"
         try:
-            smiles_list = self._get_smiles()
-            if len(smiles_list) != 2:
-                raise ValueError(
-                    f"LLE for binary mixture, got {len(smiles_list)} components instead"
+            smiles_list = self._get_binary_smiles("Activity coefficients")
+            kij_matrix = self._get_kij(2)
+            t_min, t_max = self._get_temperatures(require_max=True)
+            p_val = self._get_pressure()
+
+            def compute():
+                # Retrieve Experimental Data
+                exp_data = None
+                try:
+                    # Returns ([T, gamma1_inf], [T, gamma2_inf])
+                    gamma_infs = retrieve_gamma_inf_binary_data(
+                        smiles_list, t_min, t_max
+                    )
+                    if gamma_infs is not None:
+                        exp_data = [
+                            (gamma_arr[:, 0], gamma_arr[:, 1], f"Exp. {label}")
+                            for gamma_arr, label in zip(
+                                gamma_infs, ("1 in 2", "2 in 1")
+                            )
+                            if len(gamma_arr) > 0
+                        ]
+                except (ValueError, RuntimeError):
+                    pass
+
+                return (
+                    mix_gamma_infinite(smiles_list, kij_matrix, t_min, t_max, p_val),
+                    exp_data,
                 )
 
-            n = len(smiles_list)
-            fractions = self._get_fractions(n)
-            kij_matrix = self._get_kij(n)
-            t_min, _ = self._get_temperatures(require_max=False)
-            p_val = self._get_pressure()
+            def done(result):
+                (temperatures, gammas), exp_data = result
+                self._generate_plot(
+                    temperatures,
+                    [gammas[:, 0], gammas[:, 1]],
+                    "Infinite Dilution Activity Coefficients",
+                    "Temperature (K)",
+                    "γ∞",
+                    legends=["1 in 2", "2 in 1"],
+                    exp_data=exp_data,
+                )
 
-            # Retrieve Experimental Data
-            exp_data = None
-            try:
-                lle_arr = retrieve_lle_binary_data(smiles_list, p_val / 1000.0)
-                if lle_arr is not None and len(lle_arr) > 0:
-                    # lle_arr: [T, x_c1]
-                    exp_data = (lle_arr[:, 1], lle_arr[:, 0], "Exp. data")
-            except (ValueError, RuntimeError):
-                pass
-
-            output = mix_lle(smiles_list, fractions, kij_matrix, t_min, p_val)
-            self._generate_plot(
-                [output["x0"], output["y0"]],
-                output["temperature"],
-                f"LLE T-x-x for {smiles_list[0]} at {p_val} Pa",
-                "x,x",
-                "Temperature (K)",
-                legends=["Phase 1", "Phase 2"],
-                exp_data=exp_data,
-            )
+            self._run_job("gamma inf", compute, done)
         except (ValueError, RuntimeError) as e:
             self._show_error_alert(e)
 
-    def on_plot_ternary_vle_lle(self):
-        "plot ternary VLE/LLE"
+    def on_plot_excess_enthalpy(self):
+        "plot excess enthalpy vs liquid mole fraction of the first component"
         try:
             smiles_list = self._get_smiles()
-            if len(smiles_list) != 3:
+            n = len(smiles_list)
+            if n not in (2, 3):
                 raise ValueError(
-                    f"VLE/LLE for ternary mixture, got {len(smiles_list)} components instead"
+                    f"Excess enthalpy for binary or ternary mixture, got {n} components"
                 )
-
-            n = len(smiles_list)
             kij_matrix = self._get_kij(n)
             t_min, _ = self._get_temperatures(require_max=False)
             p_val = self._get_pressure()
 
-            # Fetch Experimental Data (Try LLE then VLE)
-            exp_data = None
-            try:
-                # Try LLE first
-                exp_arr = retrieve_lle_ternary_data(smiles_list, p_val / 1000.0, t_min)
-                if exp_arr is not None and len(exp_arr) > 0:
-                    exp_data = (exp_arr[:, 0], exp_arr[:, 1])
-                else:
-                    # Try VLE
-                    exp_arr_vle = retrieve_vle_ternary_data(
-                        smiles_list, p_val / 1000.0, t_min
-                    )
-                    if exp_arr_vle is not None and len(exp_arr_vle) > 0:
-                        exp_data = (exp_arr_vle[:, 0], exp_arr_vle[:, 1])
-            except (ValueError, RuntimeError):
-                pass
-
-            output = mix_ternary_lle(smiles_list, kij_matrix, t_min, p_val)
-
-            self._generate_ternary_plot(
-                [output["x0"], output["y0"]],
-                [output["x1"], output["y1"]],
-                title=f"VLE/LLE at {p_val} Pa, {t_min} K",
-                a_label=smiles_list[0],
-                b_label=smiles_list[1],
-                legends=["Phase 1", "Phase 2"],
-                exp_data=exp_data,
-            )
+            x1 = np.linspace(0.0, 1.0, num=21)
+            x2_ratio = 1.0
+            title = f"Excess Enthalpy for {smiles_list[0]} at {t_min} K"
+            if n == 3:
+                # section with the x2 / (x2 + x3) ratio of the given fractions
+                fractions = self._get_fractions(n)
+                if fractions[1] + fractions[2] <= 0.0:
+                    raise ValueError("x2 + x3 must be positive for the section")
+                x2_ratio = fractions[1] / (fractions[1] + fractions[2])
+                title += f"\n(x2 / (x2 + x3) = {x2_ratio:.2f})"
+
+            def compute():
+                # Retrieve Experimental Data
+                exp_data = None
+                try:
+                    # Returns [x_c1, e_h]
+                    if n == 2:
+                        e_h_arr = retrieve_e_h_binary_data(smiles_list, t_min)
+                    else:
+                        e_h_arr = retrieve_e_h_ternary_data(
+                            smiles_list, t_min, x2_ratio
+                        )
+                    if e_h_arr is not None and len(e_h_arr) > 0:
+                        exp_data = (e_h_arr[:, 0], e_h_arr[:, 1], "Exp. Data")
+                except (ValueError, RuntimeError):
+                    pass
+
+                compositions = [
+                    [x, (1.0 - x) * x2_ratio, (1.0 - x) * (1.0 - x2_ratio)][:n]
+                    for x in x1
+                ]
+                e_h = mix_excess_enthalpy(
+                    smiles_list, kij_matrix, t_min, p_val, compositions
+                )
+                return e_h, exp_data
+
+            def done(result):
+                e_h, exp_data = result
+                self._generate_plot(
+                    x1,
+                    e_h,
+                    title,
+                    "x1",
+                    r"$H^E$ (kJ/mol)",
+                    exp_data=exp_data,
+                )
+
+            self._run_job("excess enthalpy", compute, done)
         except (ValueError, RuntimeError) as e:
             self._show_error_alert(e)
@@ -0,0 +1,254 @@
+"Panels of the experimental data availability and the estimated parameters"
+
+from kivy.factory import Factory
+from kivy.uix.button import Button
+from kivy.uix.dropdown import DropDown
+from kivy.uix.label import Label
+from utils import available_params
+
+# Rows of a data list shown before it scrolls
+VISIBLE_DATA_ROWS = 8
+DATA_ROW_HEIGHT = 44
+
+
+def data_dropdown(rows):
+    """
+    dropdown of `(text, fill)` rows, where `fill()` runs when the row is
+    picked. The rows are a recycled list, so only the visible ones get
+    widgets.
+    """
+    dropdown = DropDown()
+
+    def _fill(fill):
+        fill()
+        dropdown.dismiss()
+
+    data_list = Factory.DataRowList()
+    data_list.data = [
+        {"text": text, "fill": lambda fill=fill: _fill(fill)} for text, fill in rows
+    ]
+    data_list.height = min(len(rows), VISIBLE_DATA_ROWS) * DATA_ROW_HEIGHT
+    dropdown.add_widget(data_list)
+    return dropdown
+
+
+def add_data_dropdown(parent, title, rows):
+    """
+    add a button opening the `(text, fill)` rows of an experimental dataset,
+    where `fill()` populates the inputs from the row
+    """
+    dropdown = data_dropdown(rows)
+
+    main_button = Button(
+        text=title,
+        size_hint_y=None,
+        height=44,
+        size_hint_x=0.4,
+        pos_hint={"center_x": 0.5},
+        background_color=(0.1, 0.5, 0.8, 1),
+    )
+    # bound methods are held weakly, the lambda keeps the dropdown alive
+    main_button.bind(  # type: ignore pylint: disable=no-member
+        on_release=lambda btn: dropdown.open(btn)  # pylint: disable=unnecessary-lambda
+    )
+    parent.add_widget(main_button)
+
+
+def add_binary_data_dropdowns(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    parent, fill, rho_data, bubble_data, lle_data, vle_data, vle_pxy_data
+):
+    """
+    add the dropdowns of the available binary data, where
+    `fill(pressure, t_min, t_max, x1)` populates the inputs from a row
+    """
+
+    if any(
+        (exp_data is not None and len(exp_data) > 0)
+        for exp_data in [
+            rho_data,
+            bubble_data,
+            lle_data,
+            vle_data,
+            vle_pxy_data,
+        ]
+    ):
+        parent.add_widget(
+            Label(
+                text="Experimental Data Availability",
+                size_hint_y=None,
+                height=40,
+                color="#0d6efd",
+                font_size=20,
+                bold=True,
+            )
+        )
+
+    # Bubble Point Data (P-T Envelopes)
+    if bubble_data is not None and len(bubble_data) > 0:
+        add_data_dropdown(
+            parent,
+            "Select Bubble Pt. Data",
+            [
+                # [x_approx, T_min, T_max]
+                (
+                    f"x={row[0]:.2f}: {row[1]:.2f}-{row[2]:.2f} K",
+                    lambda r=row: fill(t_min=r[1], t_max=r[2], x1=r[0]),
+                )
+                for row in bubble_data
+            ],
+        )
+
+    # VLE Data
+    if vle_data is not None and len(vle_data) > 0:
+        add_data_dropdown(
+            parent,
+            "Select Isobaric VLE Data",
+            [
+                # [P_kPa, T_min, T_max]
+                # Display T range for P
+                (
+                    f"Isobar: P={row[0]:.5g} kPa: {row[1]:.2f}-{row[2]:.2f} K",
+                    lambda r=row: fill(pressure=r[0], t_min=r[1], t_max=r[2]),
+                )
+                for row in vle_data
+            ],
+        )
+
+    # VLE Data (Isothermal P-x-y)
+    if vle_pxy_data is not None and len(vle_pxy_data) > 0:
+        add_data_dropdown(
+            parent,
+            "Select Isothermal VLE Data",
+            [
+                # [T_approx, P_min, P_max]
+                (
+                    f"Isotherm: T={row[0]:.2f} K: {row[1]:.0f}-{row[2]:.0f} kPa",
+                    lambda r=row: fill(t_min=r[0], t_max=r[0]),
+                )
+                for row in vle_pxy_data
+            ],
+        )
+
+    # LLE Data
+    if lle_data is not None and len(lle_data) > 0:
+        add_data_dropdown(
+            parent,
+            "Select LLE Data",
+            [
+                # [P_kPa, T_min, T_max]
+                # Display T range for P
+                (
+                    f"P={row[0]:.5g} kPa: {row[1]:.2f}-{row[2]:.2f} K",
+                    lambda r=row: fill(pressure=r[0], t_min=r[1], t_max=r[2]),
+                )
+                for row in lle_data
+            ],
+        )
+
+    # Density Data
+    if rho_data is not None and len(rho_data) > 0:
+        add_data_dropdown(
+            parent,
+            "Select Liquid Density Data",
+            [
+                # [P_kPa, x_c1, T_min, T_max]
+                (
+                    f"P={row[0]:.5g} kPa, x={row[1]:.2f}",
+                    lambda r=row: fill(pressure=r[0], t_min=r[2], t_max=r[3], x1=r[1]),
+                )
+                for row in rho_data
+            ],
+        )
+
+
+def add_ternary_data_dropdowns(parent, fill, rho_data_t, lle_data_t, vle_data_t):
+    """
+    add the dropdowns of the available ternary data, where
+    `fill(pressure, t_min, t_max, x1, x2)` populates the inputs from a row
+    """
+
+    if any(
+        (exp_data is not None and len(exp_data) > 0)
+        for exp_data in [rho_data_t, lle_data_t, vle_data_t]
+    ):
+        parent.add_widget(
+            Label(
+                text="Experimental Data Availability",
+                size_hint_y=None,
+                height=40,
+                color="#0d6efd",
+                font_size=20,
+                bold=True,
+            )
+        )
+
+    # Density Data
+    if rho_data_t is not None and len(rho_data_t) > 0:
+        add_data_dropdown(
+            parent,
+            "Select Ternary Density Data",
+            [
+                # [P_kPa, x1, x2, T_min, T_max]
+                (
+                    f"P={row[0]:.5g} kPa, x=[{row[1]:.2f}, {row[2]:.2f}]",
+                    lambda r=row: fill(
+                        pressure=r[0],
+                        x1=r[1],
+                        x2=r[2],
+                        t_min=r[3],
+                        t_max=r[4],
+                    ),
+                )
+                for row in rho_data_t
+            ],
+        )
+
+    # LLE Data
+    if lle_data_t is not None and len(lle_data_t) > 0:
+        add_data_dropdown(
+            parent,
+            "Select Ternary LLE Data",
+            [
+                # [P_kPa, T_K]
+                (
+                    f"LLE: P={row[0]:.5g} kPa, T={row[1]:.2f} K",
+                    lambda r=row: fill(
+                        pressure=r[0],
+                        t_min=r[1],
+                        t_max=r[1],  # Set fixed T
+                    ),
+                )
+                for row in lle_data_t
+            ],
+        )
+
+    # VLE Data (Ternary)
+    if vle_data_t is not None and len(vle_data_t) > 0:
+        add_data_dropdown(
+            parent,
+            "Select Ternary VLE Data",
+            [
+                # [P_kPa, T_K]
+                (
+                    f"VLE: P={row[0]:.5g} kPa, T={row[1]:.2f} K",
+                    lambda r=row: fill(
+                        pressure=r[0],
+                        t_min=r[1],
+                        t_max=r[1],  # Set fixed T
+                    ),
+                )
+                for row in vle_data_t
+            ],
+        )
+
+
+def parameter_table(pred):
+    "recycled table of the estimated parameters, with its header row"
+    table = Factory.ParameterTable()
+    table.data = [
+        {"param": "Parameter name", "value": "Parameter value", "bold": True}
+    ] + [
+        {"param": str(name), "value": f"{para:.5g}", "bold": False}
+        for name, para in zip(available_params, pred)
+    ]
+    return table
@@ -0,0 +1,307 @@
+"Phase equilibrium plots of the mixture layout"
+
+from plot_jobs import PREVIEW_DIAGRAM_POINTS, PREVIEW_TERNARY_GRID
+from utils import title_with_note
+from utils_data import (
+    retrieve_lle_binary_data,
+    retrieve_lle_ternary_data,
+    retrieve_vle_binary_data,
+    retrieve_vle_pxy_binary_data,
+    retrieve_vle_ternary_data,
+)
+from utils_mix import mix_lle, mix_ternary_lle, mix_vle, mix_vle_pxy
+
+
+def _liquid_vapor_fractions(output):
+    "liquid and vapor mole fractions of a binary VLE diagram"
+    # Check density for correct phase assignment (Liquid > Vapor)
+    # to fix high-pressure inversions
+    dens_l = output["density liquid"]
+    dens_v = output["density vapor"]
+    is_normal = sum(l > v for l, v in zip(dens_l, dens_v)) > len(dens_l) / 2
+    if is_normal:
+        return output["x0"], output["y0"]
+    return output["y0"], output["x0"]
+
+
+class PhaseEquilibriumPlotsMixin:
+    """
+    VLE and LLE diagrams of the mixture layout, drawn with the plot jobs
+    of `PlotJobsMixin` from the inputs of the layout
+    """
+
+    def on_plot_binary_vle_txy(self):
+        "plot binary VLE T-x-y"
+        try:
+            smiles_list = self._get_smiles()
+            if len(smiles_list) != 2:
+                raise ValueError(
+                    f"VLE for binary mixture, got {len(smiles_list)} components instead"
+                )
+
+            n = len(smiles_list)
+            kij_matrix = self._get_kij(n)
+            pressures = self._get_pressure(grid=True)
+            if len(pressures) > 1:
+                self._plot_binary_vle_txy_family(smiles_list, kij_matrix, pressures)
+                return
+            p_val = float(pressures[0])
+
+            def fetch_exp_data():
+                exp_data = None
+                try:
+                    vle_arr = retrieve_vle_binary_data(smiles_list, p_val / 1000.0)
+                    if vle_arr is not None and len(vle_arr) > 0:
+                        # vle_arr: [T, x_c1]
+                        exp_data = (vle_arr[:, 1], vle_arr[:, 0], "Exp. data")
+                except (ValueError, RuntimeError):
+                    pass
+                return exp_data
+
+            def curve(preview):
+                output = mix_vle(
+                    smiles_list,
+                    kij_matrix,
+                    p_val,
+                    npoints=PREVIEW_DIAGRAM_POINTS if preview else 500,
+                )
+                return (
+                    list(_liquid_vapor_fractions(output)),
+                    output["temperature"],
+                    f"VLE T-x-y for {smiles_list[0]} at {p_val} Pa",
+                )
+
+            self._plot_progressive(
+                "vle txy",
+                curve,
+                "x,y",
+                "Temperature (K)",
+                legends=["Liquid", "Vapor"],
+                fetch_exp_data=fetch_exp_data,
+            )
+        except (ValueError, RuntimeError) as e:
+            self._show_error_alert(e)
+
+    def _plot_binary_vle_txy_family(self, smiles_list, kij_matrix, pressures):
+        "plot a family of binary VLE T-x-y isobars, one per pressure"
+
+        def done(result):
+            curves, note = result
+            x_datas, y_datas, legends = [], [], []
+            for p_val, output in curves:
+                x_datas += list(_liquid_vapor_fractions(output))
+                y_datas += [output["temperature"], output["temperature"]]
+                legends += [f"Liquid {p_val:g} Pa", f"Vapor {p_val:g} Pa"]
+            self._generate_plot(
+                x_datas,
+                y_datas,
+                title_with_note(f"VLE T-x-y for {smiles_list[0]}", note),
+                "x,y",
+                "Temperature (K)",
+                legends=legends,
+            )
+
+        self._run_job(
+            "vle txy",
+            lambda: self._compute_family(
+                lambda p: mix_vle(smiles_list, kij_matrix, p),
+                [float(p) for p in pressures],
+                lambda p: f"{p:g} Pa",
+            ),
+            done,
+        )
+
+    def on_plot_binary_vle_pxy(self):
+        "plot binary VLE P-x-y"
+        try:
+            smiles_list = self._get_smiles()
+            if len(smiles_list) != 2:
+                raise ValueError(
+                    f"VLE for binary mixture, got {len(smiles_list)} components instead"
+                )
+
+            n = len(smiles_list)
+            kij_matrix = self._get_kij(n)
+            t_min, _ = self._get_temperatures(require_max=False)
+
+            def fetch_exp_data():
+                exp_data = None
+                try:
+                    # Returns [P_kPa, x_c1]
+                    vle_arr = retrieve_vle_pxy_binary_data(smiles_list, t_min)
+                    if vle_arr is not None and len(vle_arr) > 0:
+                        exp_data = (vle_arr[:, 1], vle_arr[:, 0] * 1000.0, "Exp. data")
+                except (ValueError, RuntimeError):
+                    pass
+                return exp_data
+
+            def curve(preview):
+                output = mix_vle_pxy(
+                    smiles_list,
+                    kij_matrix,
+                    t_min,
+                    npoints=PREVIEW_DIAGRAM_POINTS if preview else 500,
+                )
+                # For P-x-y, higher pressure usually liquid
+                return (
+                    list(_liquid_vapor_fractions(output)),
+                    output["pressure"],
+                    f"VLE P-x-y for {smiles_list[0]} at {t_min} K",
+                )
+
+            self._plot_progressive(
+                "vle pxy",
+                curve,
+                "x,y",
+                "Pressure (Pa)",
+                legends=["Liquid", "Vapor"],
+                fetch_exp_data=fetch_exp_data,
+            )
+        except (ValueError, RuntimeError) as e:
+            self._show_error_alert(e)
+
+    def on_plot_binary_vle_xy(self):
+        "plot binary VLE x-y"
+        try:
+            smiles_list = self._get_smiles()
+            if len(smiles_list) != 2:
+                raise ValueError(
+                    f"VLE for binary mixture, got {len(smiles_list)} components instead"
+                )
+
+            n = len(smiles_list)
+            kij_matrix = self._get_kij(n)
+            p_val = self._get_pressure()
+
+            def curve(preview):
+                output = mix_vle(
+                    smiles_list,
+                    kij_matrix,
+                    p_val,
+                    npoints=PREVIEW_DIAGRAM_POINTS if preview else 500,
+                )
+                return (
+                    *_liquid_vapor_fractions(output),
+                    f"VLE x-y for {smiles_list[0]} at {p_val} Pa",
+                )
+
+            self._plot_progressive("vle xy", curve, "x", "y")
+        except (ValueError, RuntimeError) as e:
+            self._show_error_alert(e)
+
+    def on_plot_binary_lle_txx(self):
+        "plot binary LLE T-x-x"
+        try:
+            smiles_list = self._get_smiles()
+            if len(smiles_list) != 2:
+                raise ValueError(
+                    f"LLE for binary mixture, got {len(smiles_list)} components instead"
+                )
+
+            n = len(smiles_list)
+            fractions = self._get_fractions(n)
+            kij_matrix = self._get_kij(n)
+            t_min, _ = self._get_temperatures(require_max=False)
+            p_val = self._get_pressure()
+
+            def fetch_exp_data():
+                exp_data = None
+                try:
+                    lle_arr = retrieve_lle_binary_data(smiles_list, p_val / 1000.0)
+                    if lle_arr is not None and len(lle_arr) > 0:
+                        # lle_arr: [T, x_c1]
+                        exp_data = (lle_arr[:, 1], lle_arr[:, 0], "Exp. data")
+                except (ValueError, RuntimeError):
+                    pass
+                return exp_data
+
+            def curve(preview):
+                output = mix_lle(
+                    smiles_list,
+                    fractions,
+                    kij_matrix,
+                    t_min,
+                    p_val,
+                    npoints=PREVIEW_DIAGRAM_POINTS if preview else 500,
+                )
+                return (
+                    [output["x0"], output["y0"]],
+                    output["temperature"],
+                    f"LLE T-x-x for {smiles_list[0]} at {p_val} Pa",
+                )
+
+            self._plot_progressive(
+                "lle txx",
+                curve,
+                "x,x",
+                "Temperature (K)",
+                legends=["Phase 1", "Phase 2"],
+                fetch_exp_data=fetch_exp_data,
+            )
+        except (ValueError, RuntimeError) as e:
+            self._show_error_alert(e)
+
+    def on_plot_ternary_vle_lle(self):
+        "plot ternary VLE/LLE"
+        try:
+            smiles_list = self._get_smiles()
+            if len(smiles_list) != 3:
+                raise ValueError(
+                    f"VLE/LLE for ternary mixture, got {len(smiles_list)} components instead"
+                )
+
+            n = len(smiles_list)
+            kij_matrix = self._get_kij(n)
+            t_min, _ = self._get_temperatures(require_max=False)
+            p_val = self._get_pressure()
+
+            def fetch_exp_data():
+                # Fetch Experimental Data (Try LLE then VLE)
+                exp_data = None
+                try:
+                    # Try LLE first
+                    exp_arr = retrieve_lle_ternary_data(
+                        smiles_list, p_val / 1000.0, t_min
+                    )
+                    if exp_arr is not None and len(exp_arr) > 0:
+                        exp_data = (exp_arr[:, 0], exp_arr[:, 1])
+                    else:
+                        # Try VLE
+                        exp_arr_vle = retrieve_vle_ternary_data(
+                            smiles_list, p_val / 1000.0, t_min
+                        )
+                        if exp_arr_vle is not None and len(exp_arr_vle) > 0:
+                            exp_data = (exp_arr_vle[:, 0], exp_arr_vle[:, 1])
+                except (ValueError, RuntimeError):
+                    pass
+                return exp_data
+
+            def tie_lines(output):
+                return (
+                    [output["x0"], output["y0"]],
+                    [output["x1"], output["y1"]],
+                    f"VLE/LLE at {p_val} Pa, {t_min} K",
+                )
+
+            def curve(preview):
+                output = mix_ternary_lle(
+                    smiles_list,
+                    kij_matrix,
+                    t_min,
+                    p_val,
+                    n_pts=PREVIEW_TERNARY_GRID if preview else 25,
+                )
+                return tie_lines(output)
+
+            self._plot_progressive(
+                "ternary",
+                curve,
+                smiles_list[0],
+                smiles_list[1],
+                legends=["Phase 1", "Phase 2"],
+                fetch_exp_data=fetch_exp_data,
+                ternary=True,
+                stream=tie_lines,
+            )
+        except (ValueError, RuntimeError) as e:
+            self._show_error_alert(e)
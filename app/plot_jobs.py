@@ -0,0 +1,237 @@
+"Background plot jobs and plots shared by the pure and mixture layouts"
+
+from kivy.uix.button import Button
+from kivy.uix.dropdown import DropDown
+from kivy.uix.label import Label
+from utils import (
+    curve_updater,
+    generate_plot,
+    generate_ternary_plot,
+    refine_plot,
+    refine_ternary_plot,
+    remember_plot,
+    title_with_note,
+)
+from utils_pure import STATE_PROPERTIES
+from utils_sweep import failure_note, family_map, require_valid
+
+# Coarse resolutions of the progressive previews. The 4 preview points of a
+# sweep are every third point of its 10, so the exact curve reuses them.
+PREVIEW_SWEEP_POINTS = 4
+PREVIEW_DIAGRAM_POINTS = 25
+PREVIEW_TERNARY_GRID = 9
+
+
+class PlotJobsMixin:  # pylint: disable=too-few-public-methods
+    """
+    Plot requests of a layout run as background jobs, drawn progressively
+    or as families of curves computed in parallel. The layout provides
+    `jobs` (a `JobExecutor`), the `job_status` bar, the
+    `predicted_parameters` panel showing errors, and `job_inputs`, the
+    names of the text inputs a request is made from.
+    """
+
+    job_inputs = ()
+
+    def _job_key(self, request):
+        "a request with the inputs it is made from"
+        return (request,) + tuple(getattr(self, name).text for name in self.job_inputs)
+
+    def _run_job(
+        self, request, compute, done, stream=None, key=None, history=True
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        run `compute` in the background, then `done(result)` on the UI
+        thread, with `stream(partial)` drawing its partial results. A press
+        repeating the request in flight is merged into it, any other
+        request cancels it. A request made before in the session is
+        answered from its stored result, and with `history` the plot drawn
+        is added to the plot history.
+        """
+        key = key or self._job_key(request)
+
+        def _done(result):
+            done(result)
+            if history:
+                remember_plot(
+                    ", ".join([request] + [part for part in key[1:] if part]),
+                    lambda: self._run_job(request, compute, done, stream, key),
+                )
+
+        self.job_status.track(
+            self.jobs.submit(
+                compute, _done, self._show_error_alert, key=key, on_partial=stream
+            )
+        )
+
+    def _show_error_alert(self, e):
+        error_message = Label(
+            text=f"Error: {str(e)}",
+            size_hint_y=None,
+            height=50,
+        )
+        error_message.font_size = 16
+        error_message.color = "#dc3545"
+        self.predicted_parameters.clear_widgets()
+        self.predicted_parameters.add_widget(error_message)
+
+    def _generate_plot(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self, x_data, y_data, title, x_label, y_label, legends=None, exp_data=None
+    ):
+        """Helper to generate plot and switch screen"""
+        try:
+            return generate_plot(
+                x_data, y_data, title, x_label, y_label, legends, exp_data
+            )
+        except (ValueError, RuntimeError, AssertionError) as e:
+            self._show_error_alert(e)
+            return None
+
+    def _stream_plot(self, view, x_label, y_label):
+        """
+        `stream` callback drawing the curve published by a sweep as its
+        points converge, with `view(sweep)` giving `(x, y, title)`
+        """
+        update = curve_updater(
+            lambda x, y, title: self._generate_plot(x, y, title, x_label, y_label),
+            refine_plot,
+        )
+        return lambda sweep: update(view(sweep), partial=True)
+
+    def _plot_progressive(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        request,
+        curve,
+        x_label,
+        y_label,
+        legends=None,
+        fetch_exp_data=None,
+        ternary=False,
+        stream=None,
+    ):
+        """
+        Draw the coarse preview `curve(True)` first, then replace it with the
+        exact `curve(False)`, in place when both have the same lines. `curve`
+        returns `(x_datas, y_datas, title)`; both run in the background, the
+        experimental data (`fetch_exp_data()`) with the preview. `stream`
+        maps the partial results of the exact run to the same data, drawn
+        once they have as many points as the preview.
+        """
+        plot = self._generate_ternary_plot if ternary else self._generate_plot
+        key = self._job_key(request)
+        if self.jobs.computing(key):
+            return  # a repeated press joins the exact curve in flight
+
+        def preview():
+            exp_data = fetch_exp_data() if fetch_exp_data else None
+            try:
+                return curve(True), exp_data
+            except (ValueError, RuntimeError):
+                return None, exp_data  # no preview, the exact curve may still converge
+
+        def show_preview(result):
+            coarse, exp_data = result
+            update = curve_updater(
+                lambda x_datas, y_datas, title: plot(
+                    x_datas, y_datas, title, x_label, y_label, legends, exp_data
+                ),
+                refine_ternary_plot if ternary else refine_plot,
+            )
+            if coarse is not None:
+                update(coarse)
+
+            self._run_job(
+                request,
+                lambda: curve(False),
+                update,
+                stream=(
+                    (lambda partial: update(stream(partial), partial=True))
+                    if stream
+                    else None
+                ),
+                key=key,
+                history=False,
+            )
+
+        self._run_job(
+            request, preview, show_preview, key=self._job_key(f"{request} preview")
+        )
+
+    def _generate_ternary_plot(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self, a, b, title, a_label, b_label, legends=None, exp_data=None
+    ):
+        try:
+            return generate_ternary_plot(
+                a, b, title, a_label, b_label, legends, exp_data
+            )
+        except (ValueError, RuntimeError) as e:
+            self._show_error_alert(e)
+            return None
+
+    def _compute_family(self, compute, conditions, describe):
+        """
+        compute one curve per condition on the worker pool, returning the
+        `(condition, curve)` pairs that succeeded and a note on the failed ones
+        """
+        results = family_map(compute, conditions)
+        done = [
+            (condition, result)
+            for condition, result in zip(conditions, results)
+            if not isinstance(result, Exception)
+        ]
+        if not done:
+            raise results[0]
+        failed = [
+            describe(condition)
+            for condition, result in zip(conditions, results)
+            if isinstance(result, Exception)
+        ]
+        return done, f"failed at {', '.join(failed)}" if failed else ""
+
+
+class PropertyPlotsMixin(PlotJobsMixin):  # pylint: disable=too-few-public-methods
+    """
+    Derived state properties along the isobar of a layout, picked from a
+    dropdown. The layout provides `_property_sweep(name)`, returning a
+    `sweep(num)` of all `STATE_PROPERTIES` along the isobar of its inputs
+    and the plot title of property `name`.
+    """
+
+    def on_plot_properties(self, caller):
+        "choose a derived property of the isobar to plot"
+        dropdown = DropDown()
+        for name in STATE_PROPERTIES:
+            btn = Button(text=name, size_hint_y=None, height=44)
+            btn.bind(  # type: ignore pylint: disable=no-member
+                on_release=lambda btn: (
+                    dropdown.dismiss(),
+                    self._plot_property(btn.text),
+                )
+            )
+            dropdown.add_widget(btn)
+        dropdown.open(caller)
+
+    def _plot_property(self, name):
+        "plot a derived property vs temperature along the isobar"
+        column = list(STATE_PROPERTIES).index(name)
+        try:
+            sweep, title = self._property_sweep(name)
+
+            # all properties of the isobar come from one stored sweep
+            def curve(preview):
+                result = require_valid(sweep(PREVIEW_SWEEP_POINTS if preview else 10))
+                return (
+                    result.x,
+                    result.y[:, column],
+                    title_with_note(title, failure_note(result)),
+                )
+
+            self._plot_progressive(
+                f"property {name}",
+                curve,
+                "Temperature (K)",
+                STATE_PROPERTIES[name],
+                stream=lambda result: (result.x, result.y[:, column], title),
+            )
+        except (ValueError, RuntimeError) as e:
+            self._show_error_alert(e)
@@ -0,0 +1,198 @@
+"Plot widget rendering its figures off the UI thread"
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from weakref import WeakKeyDictionary
+
+# the plot widget calls `matplotlib.pyplot.close()` for each new figure
+import matplotlib.pyplot  # pylint: disable=unused-import
+from kivy.clock import Clock
+from kivy.graphics.texture import Texture  # pylint: disable=no-name-in-module
+from kivy.properties import BooleanProperty  # pylint: disable=no-name-in-module
+from kivy_matplotlib_widget.uix.graph_widget import (
+    MatplotFigure,
+    _FigureCanvas,
+)
+from matplotlib.backend_bases import ResizeEvent
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from utils import figure_lock
+
+# Sizes of the textures kept per figure
+TEXTURE_SIZES = 2
+
+_render_pool = ThreadPoolExecutor(1, thread_name_prefix="render")
+_generations = WeakKeyDictionary()  # figure -> count of its content changes
+_textures = WeakKeyDictionary()  # figure -> {size: (generation, texture)}
+
+
+def _generation(figure):
+    return _generations.get(figure, 0)
+
+
+def _changed(figure):
+    "mark the textures of a figure as outdated"
+    _generations[figure] = _generation(figure) + 1
+
+
+def _rasterize(canvas, lock):
+    "draw a figure with Agg, returning its rgba pixels and their size"
+    with lock:
+        FigureCanvasAgg.draw(canvas)
+        renderer = canvas.get_renderer()
+        return bytes(renderer.buffer_rgba()), (
+            int(renderer.width),
+            int(renderer.height),
+        )
+
+
+class _LockedCanvas(_FigureCanvas):  # pylint: disable=abstract-method
+    "canvas of the widget, drawing on the UI thread under the figure lock"
+
+    def __init__(self, figure, widget):
+        super().__init__(figure, widget)
+        self._isDrawn = False  # until drawn, or a render is uploaded
+
+    def draw(self):
+        with figure_lock(self.figure):
+            # pan, zoom and in-place updates change the figure
+            _changed(self.figure)
+            super().draw()
+
+
+class PlotFigure(MatplotFigure):  # pylint: disable=too-many-instance-attributes
+    """
+    MatplotFigure that, with `threaded_render`, renders its figure with
+    Agg on a worker thread when shown or resized, the UI thread only
+    uploading the pixels. The textures are kept per figure and size while
+    the figure is unchanged. Pan, zoom and in-place updates still draw
+    on the UI thread; touches made during a render are held until it is
+    uploaded.
+    """
+
+    threaded_render = BooleanProperty(False)
+
+    def __init__(self, **kwargs):
+        self._width = self._height = 0
+        self._isDrawn = False
+        self.bt_w = self.bt_h = 0  # size of the texture shown
+        self._in_flight = None  # render on the worker thread
+        self._rerender = False  # the figure or size changed meanwhile
+        self._held_touches = []  # touches made during the render
+        self._render_trigger = Clock.create_trigger(self._render)
+        super().__init__(**kwargs)
+
+    def on_figure(self, obj, value):
+        super().on_figure(obj, value)
+        self.figcanvas = _LockedCanvas(value, self)
+
+    def _onSize(self, o, size):
+        if not self.threaded_render:
+            super()._onSize(o, size)
+            return
+        if self.figure is None:
+            return
+        self._width, self._height = size
+        self._isDrawn = False
+        if self._width > 1 and self._height > 1:
+            # one render for the resizes of a frame
+            self._render_trigger()
+
+    def _render(self, *_):
+        "resize the figure and render it on the worker thread"
+        figure = self.figure
+        if figure is None or self._width <= 1 or self._height <= 1:
+            return
+        if self._in_flight is not None:
+            self._rerender = True
+            return
+        size = (int(self._width), int(self._height))
+        lock = figure_lock(figure)
+        with lock:
+            if figure.stale:
+                _changed(figure)  # since it was last drawn
+            figure.set_size_inches(size[0] / figure.dpi, size[1] / figure.dpi)
+            event = ResizeEvent("resize_event", self.figcanvas)
+            self.figcanvas.callbacks.process("resize_event", event)
+
+        generation = _generation(figure)
+        cached = _textures.get(figure, {}).get(size)
+        if cached is not None and cached[0] == generation:
+            figure.stale = False  # the texture shows it as it is
+            self._img_texture = cached[1]
+            return
+
+        self._in_flight = _render_pool.submit(_rasterize, self.figcanvas, lock)
+        self._in_flight.add_done_callback(
+            lambda future: Clock.schedule_once(
+                lambda _dt: self._rendered(future, figure, size, generation)
+            )
+        )
+
+    def _rendered(self, future, figure, size, generation):
+        "upload a render, then dispatch the touches held while it ran"
+        self._in_flight = None
+        if self._rerender:
+            self._rerender = False
+            self._render()
+        self._upload(future, figure, size, generation)
+        if self._in_flight is None:
+            self._release_touches()
+
+    def _upload(self, future, figure, size, generation):
+        "upload the pixels rendered for `figure` at `size`"
+        if figure is not self.figure or generation != _generation(figure):
+            return  # another figure is shown, or it was drawn since
+        if future.exception() is not None:
+            self.figcanvas.draw()  # on the UI thread then
+            return
+
+        pixels, (width, height) = future.result()
+        texture = Texture.create(size=(width, height))
+        texture.blit_buffer(pixels, colorfmt="rgba", bufferfmt="ubyte")
+        texture.flip_vertical()
+        textures = _textures.setdefault(figure, OrderedDict())
+        textures.pop(size, None)
+        textures[size] = (generation, texture)
+        while len(textures) > TEXTURE_SIZES:
+            textures.popitem(last=False)
+
+        self.bt_w, self.bt_h = width, height
+        self._bitmap = pixels
+        self._img_texture = texture
+        self.figcanvas._isDrawn = True  # pylint: disable=protected-access
+        for legend in self.legend_instance:
+            legend.update_size()
+        self.update_hover()
+        self.update_selector()
+
+    def _release_touches(self):
+        "dispatch the held touches, with their release if they ended"
+        touches, self._held_touches = self._held_touches, []
+        for touch in touches:
+            touch.ungrab(self)
+            # held touches are in window coordinates outside the dispatch
+            touch.push()
+            touch.apply_transform_2d(self.parent.to_widget)
+            try:
+                super().on_touch_down(touch)
+                if touch.time_end != -1:
+                    # as dispatched to the widget grabbing it
+                    touch.grab_state = True
+                    super().on_touch_up(touch)
+                    touch.grab_state = False
+            finally:
+                touch.pop()
+
+    def on_touch_down(self, event):
+        if self._in_flight is not None and self.collide_point(*event.pos):
+            # pan and zoom change the figure, so they wait for the render
+            event.grab(self)
+            self._held_touches.append(event)
+            return True
+        return super().on_touch_down(event)
+
+    def on_touch_up(self, event):
+        if event in self._held_touches:
+            event.ungrab(self)  # dispatched with its press once rendered
+            return True
+        return super().on_touch_up(event)
@@ -1,85 +1,40 @@
 "Pure screen"
 
-from copy import copy
-
-from gnnepcsaft.pcsaft.pcsaft_feos import critical_points_feos
 from gnnepcsaft_mcp_server.utils import predict_pcsaft_parameters
-from kivy.core.window import Window
-from kivy.graphics import Color, Rectangle
+from kivy.clock import Clock
 from kivy.properties import ObjectProperty  # pylint: disable=no-name-in-module
-from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.button import Button
-from kivy.uix.dropdown import DropDown
-from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
 from kivy.uix.screenmanager import Screen
-from utils import available_params, generate_plot, get_smiles_from_input
+from panels import add_data_dropdown, parameter_table
+from plot_jobs import PropertyPlotsMixin
+from utils import get_smiles_from_input, title_with_note
 from utils_data import (
     retrieve_available_data_pure,
     retrieve_rho_pure_data,
     retrieve_st_pure_data,
     retrieve_vp_pure_data,
 )
+from utils_jobs import JobExecutor, session_results
 from utils_pure import (
+    clip_to_saturation,
+    pure_critical_point,
     pure_den,
     pure_h_lv,
     pure_phase_diagram,
+    pure_properties,
     pure_surface_tension,
     pure_vp,
+    saturation_property,
 )
+from utils_sweep import failure_note, require_valid
 
 
 class PureScreen(Screen):
     "Pure component screen"
 
 
-class ActionLabelCustom(ButtonBehavior, Label):  # type: ignore
-    "Label that acts as a button with hover effect"
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.color = "#0d6efd"  # Default link color (Bootstrap Primary)
-        self.background_color_normal = (1, 1, 1, 0)  # Transparent
-        self.background_color_hover = (0.9, 0.9, 0.9, 1)  # Light Gray
-
-        # Determine initial background logic
-        with self.canvas.before:  # type: ignore
-            self.bg_color = Color(*self.background_color_normal)
-            self.rect = Rectangle(size=self.size, pos=self.pos)
-
-        self.bind(size=self._update_rect, pos=self._update_rect)  # type: ignore pylint: disable=no-member
-
-        # Bind mouse position for hover effect
-        Window.bind(mouse_pos=self.on_mouse_pos)
-
-    def _update_rect(self, instance, value):  # pylint: disable=unused-argument
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
-
-    def on_mouse_pos(self, window, pos):  # pylint: disable=unused-argument
-        "function for mouse hover effect"
-        if not self.get_root_window():
-            return
-
-        if self.collide_point(*self.to_widget(*pos)):
-            # Hover state
-            self.bg_color.rgba = self.background_color_hover
-            self.color = "#0a58ca"  # Darker blue
-        else:
-            # Normal state
-            self.bg_color.rgba = self.background_color_normal
-            self.color = "#0d6efd"
-
-    def on_press(self):
-        self.bg_color.rgba = (0.8, 0.8, 0.8, 1)  # Darker gray on click
-
-    def on_release(self):
-        # Return to hover state color since mouse is likely still over it
-        self.bg_color.rgba = self.background_color_hover
-
-
-class PureLayout(BoxLayout):
+class PureLayout(PropertyPlotsMixin, BoxLayout):
     "Pure Layout"
 
     smiles_or_inchi_input = ObjectProperty(None)
@@ -87,15 +42,10 @@ class PureLayout(BoxLayout):
     temp_max = ObjectProperty(None)
     pressure = ObjectProperty(None)
     predicted_parameters = ObjectProperty(None)
+    job_status = ObjectProperty(None)
 
-    def _generate_plot(
-        self, x_data, y_data, title, x_label, y_label, legends=None, exp_data=None
-    ):
-        """Helper to generate plot and switch screen"""
-        try:
-            generate_plot(x_data, y_data, title, x_label, y_label, legends, exp_data)
-        except (RuntimeError, AssertionError) as e:
-            self._show_error_alert(e)
+    jobs = JobExecutor(Clock.schedule_once, results=session_results)
+    job_inputs = ("smiles_or_inchi_input", "temp_min", "temp_max", "pressure")
 
     def _get_smiles(self):
         smiles_input = self.smiles_or_inchi_input.text
@@ -113,23 +63,19 @@ class PureLayout(BoxLayout):
         except ValueError as e:
             raise ValueError("Temperature inputs must be numeric values") from e
 
+    def _get_optional_max_temperature(self):
+        "max temperature if given, so saturation plots can share their sweep"
+        try:
+            return float(self.temp_max.text)
+        except ValueError:
+            return None
+
     def _get_pressure(self):
         try:
             return float(self.pressure.text)
         except ValueError as e:
             raise ValueError("Pressure must be a numeric value") from e
 
-    def _show_error_alert(self, e):
-        error_message = Label(
-            text=f"Error: {str(e)}",
-            size_hint_y=None,
-            height=50,
-        )
-        error_message.font_size = 16
-        error_message.color = "#dc3545"
-        self.predicted_parameters.clear_widgets()
-        self.predicted_parameters.add_widget(error_message)
-
     def _fill_inputs(self, pressure=None, t_min=None, t_max=None):
         "Helper to populate inputs with clicked values"
         if pressure is not None:
@@ -147,23 +93,44 @@ class PureLayout(BoxLayout):
             t_min, t_max = self._get_temperatures(require_max=True)
             p_val = self._get_pressure()
 
-            # Fetch experimental data (convert Pa to kPa for DB lookup)
-            exp_data = None
-            try:
-                exp_array = retrieve_rho_pure_data(smiles, p_val / 1000.0)
-                if exp_array is not None and len(exp_array) > 0:
-                    exp_data = (exp_array[:, 0], exp_array[:, 1], "Exp. Data")
-            except (ValueError, RuntimeError):
-                pass  # Ignore exp data errors
-
-            temperatures, densities = pure_den(smiles, t_min, t_max, p_val)
-            self._generate_plot(
-                temperatures,
-                densities,
-                f"Density vs Temperature\n({smiles})",
-                "Temperature (K)",
-                "Density (mol/m³)",
-                exp_data=exp_data,
+            def compute():
+                # Fetch experimental data (convert Pa to kPa for DB lookup)
+                exp_data = None
+                try:
+                    exp_array = retrieve_rho_pure_data(smiles, p_val / 1000.0)
+                    if exp_array is not None and len(exp_array) > 0:
+                        exp_data = (exp_array[:, 0], exp_array[:, 1], "Exp. Data")
+                except (ValueError, RuntimeError):
+                    pass  # Ignore exp data errors
+
+                return require_valid(pure_den(smiles, t_min, t_max, p_val)), exp_data
+
+            def done(result):
+                sweep, exp_data = result
+                self._generate_plot(
+                    sweep.x,
+                    sweep.y,
+                    title_with_note(
+                        f"Density vs Temperature\n({smiles})", failure_note(sweep)
+                    ),
+                    "Temperature (K)",
+                    "Density (mol/m³)",
+                    exp_data=exp_data,
+                )
+
+            self._run_job(
+                "density",
+                compute,
+                done,
+                stream=self._stream_plot(
+                    lambda sweep: (
+                        sweep.x,
+                        sweep.y,
+                        f"Density vs Temperature\n({smiles})",
+                    ),
+                    "Temperature (K)",
+                    "Density (mol/m³)",
+                ),
             )
         except (ValueError, RuntimeError) as e:
             self._show_error_alert(e)
@@ -174,24 +141,51 @@ class PureLayout(BoxLayout):
             smiles = self._get_smiles()
             t_min, t_max = self._get_temperatures(require_max=True)
 
-            # Fetch experimental data
-            exp_data = None
-            try:
-                exp_array = retrieve_vp_pure_data(smiles, t_min, t_max)
-                if exp_array is not None and len(exp_array) > 0:
-                    # Convert kPa to Pa for plotting
-                    exp_data = (exp_array[:, 0], exp_array[:, 1] * 1000.0, "Exp. Data")
-            except (ValueError, RuntimeError):
-                pass
-
-            temperatures, vps = pure_vp(smiles, t_min, t_max)
-            self._generate_plot(
-                temperatures,
-                vps,
-                f"Vapor Pressure vs Temperature\n({smiles})",
-                "Temperature (K)",
-                "Pressure (Pa)",
-                exp_data=exp_data,
+            def compute():
+                # Fetch experimental data
+                exp_data = None
+                try:
+                    exp_array = retrieve_vp_pure_data(smiles, t_min, t_max)
+                    if exp_array is not None and len(exp_array) > 0:
+                        # Convert kPa to Pa for plotting
+                        exp_data = (
+                            exp_array[:, 0],
+                            exp_array[:, 1] * 1000.0,
+                            "Exp. Data",
+                        )
+                except (ValueError, RuntimeError):
+                    pass
+
+                t_low, t_high, note = clip_to_saturation(smiles, t_min, t_max)
+                return require_valid(pure_vp(smiles, t_low, t_high)), note, exp_data
+
+            def done(result):
+                sweep, note, exp_data = result
+                self._generate_plot(
+                    sweep.x,
+                    sweep.y,
+                    title_with_note(
+                        f"Vapor Pressure vs Temperature\n({smiles})",
+                        note,
+                        failure_note(sweep),
+                    ),
+                    "Temperature (K)",
+                    "Pressure (Pa)",
+                    exp_data=exp_data,
+                )
+
+            self._run_job(
+                "vp",
+                compute,
+                done,
+                stream=self._stream_plot(
+                    lambda bundle: (
+                        *saturation_property(bundle, t_max, "pressure")[:2],
+                        f"Vapor Pressure vs Temperature\n({smiles})",
+                    ),
+                    "Temperature (K)",
+                    "Pressure (Pa)",
+                ),
             )
         except (ValueError, RuntimeError) as e:
             self._show_error_alert(e)
@@ -202,43 +196,104 @@ class PureLayout(BoxLayout):
             smiles = self._get_smiles()
             t_min, t_max = self._get_temperatures(require_max=True)
 
-            temperatures, hlvs = pure_h_lv(smiles, t_min, t_max)
-            self._generate_plot(
-                temperatures,
-                hlvs,
-                f"Enthalpy of Vap. vs Temperature\n({smiles})",
-                "Temperature (K)",
-                r"$H_{vap}$ (kJ/mol)",
+            def compute():
+                t_low, t_high, note = clip_to_saturation(smiles, t_min, t_max)
+                return require_valid(pure_h_lv(smiles, t_low, t_high)), note
+
+            def done(result):
+                sweep, note = result
+                self._generate_plot(
+                    sweep.x,
+                    sweep.y,
+                    title_with_note(
+                        f"Enthalpy of Vap. vs Temperature\n({smiles})",
+                        note,
+                        failure_note(sweep),
+                    ),
+                    "Temperature (K)",
+                    r"$H_{vap}$ (kJ/mol)",
+                )
+
+            self._run_job(
+                "hlv",
+                compute,
+                done,
+                stream=self._stream_plot(
+                    lambda bundle: (
+                        *saturation_property(bundle, t_max, "h_lv")[:2],
+                        f"Enthalpy of Vap. vs Temperature\n({smiles})",
+                    ),
+                    "Temperature (K)",
+                    r"$H_{vap}$ (kJ/mol)",
+                ),
             )
         except (ValueError, RuntimeError) as e:
             self._show_error_alert(e)
 
+    def _property_sweep(self, name):
+        "state properties along the isobar, with the plot title of `name`"
+        smiles = self._get_smiles()
+        t_min, t_max = self._get_temperatures(require_max=True)
+        p_val = self._get_pressure()
+        return (
+            lambda num: pure_properties(smiles, t_min, t_max, p_val, num=num),
+            f"{name} vs Temperature\n({smiles})",
+        )
+
     def on_plot_surface_tension(self):
         "plot surface tension vs temperature"
         try:
             smiles = self._get_smiles()
             t_min, _ = self._get_temperatures(require_max=False)
+            # We attempt to get t_max to finding exp data in range
+            t_max_exp = self._get_optional_max_temperature()
+
+            def compute():
+                # Fetch experimental data
+                exp_data = None
+                try:
+                    exp_array = None
+                    if t_max_exp is not None:
+                        exp_array = retrieve_st_pure_data(smiles, t_min, t_max_exp)
+                    if exp_array is not None and len(exp_array) > 0:
+                        # Convert N/m to mN/m for plotting
+                        exp_data = (
+                            exp_array[:, 0],
+                            exp_array[:, 1] * 1e3,
+                            "Exp. Data",
+                        )
+                except (ValueError, RuntimeError):
+                    pass
+
+                return require_valid(pure_surface_tension(smiles, t_min)), exp_data
+
+            def done(result):
+                sweep, exp_data = result
+                self._generate_plot(
+                    sweep.x,
+                    sweep.y,
+                    title_with_note(
+                        f"Surface Tension vs Temperature\n({smiles})",
+                        failure_note(sweep),
+                    ),
+                    "Temperature (K)",
+                    "Surface Tension (mN/m)",
+                    exp_data=exp_data,
+                )
 
-            # Fetch experimental data
-            exp_data = None
-            try:
-                # We attempt to get t_max to finding exp data in range
-                _, t_max_exp = self._get_temperatures(require_max=True)
-                exp_array = retrieve_st_pure_data(smiles, t_min, t_max_exp)
-                if exp_array is not None and len(exp_array) > 0:
-                    # Convert N/m to mN/m for plotting
-                    exp_data = (exp_array[:, 0], exp_array[:, 1] * 1e3, "Exp. Data")
-            except (ValueError, RuntimeError):
-                pass
-
-            temperatures, st = pure_surface_tension(smiles, t_min)
-            self._generate_plot(
-                temperatures,
-                st,
-                f"Surface Tension vs Temperature\n({smiles})",
-                "Temperature (K)",
-                "Surface Tension (mN/m)",
-                exp_data=exp_data,
+            self._run_job(
+                "surface tension",
+                compute,
+                done,
+                stream=self._stream_plot(
+                    lambda sweep: (
+                        sweep.x,
+                        sweep.y,
+                        f"Surface Tension vs Temperature\n({smiles})",
+                    ),
+                    "Temperature (K)",
+                    "Surface Tension (mN/m)",
+                ),
             )
         except (ValueError, RuntimeError) as e:
             self._show_error_alert(e)
@@ -249,14 +304,21 @@ class PureLayout(BoxLayout):
             smiles = self._get_smiles()
             t_min, _ = self._get_temperatures(require_max=False)
 
-            temperatures, _, rho_liq, rho_vap = pure_phase_diagram(smiles, t_min)
-            self._generate_plot(
-                [rho_liq, rho_vap],
-                temperatures,
-                f"Phase diagram - Temperature vs Density\n({smiles})",
-                "Density (mol/m³)",
-                "Temperature (K)",
-                legends=["Liquid", "Vapor"],
+            def done(result):
+                temperatures, _, rho_liq, rho_vap = result
+                self._generate_plot(
+                    [rho_liq, rho_vap],
+                    temperatures,
+                    f"Phase diagram - Temperature vs Density\n({smiles})",
+                    "Density (mol/m³)",
+                    "Temperature (K)",
+                    legends=["Liquid", "Vapor"],
+                )
+
+            self._run_job(
+                "phase diagram T-rho",
+                lambda: pure_phase_diagram(smiles, t_min),
+                done,
             )
         except (ValueError, RuntimeError) as e:
             self._show_error_alert(e)
@@ -267,14 +329,21 @@ class PureLayout(BoxLayout):
             smiles = self._get_smiles()
             t_min, _ = self._get_temperatures(require_max=False)
 
-            _, pressures, rho_liq, rho_vap = pure_phase_diagram(smiles, t_min)
-            self._generate_plot(
-                [rho_liq, rho_vap],
-                pressures,
-                f"Phase diagram - Pressure vs Density\n({smiles})",
-                "Density (mol/m³)",
-                "Pressure (Pa)",
-                legends=["Liquid", "Vapor"],
+            def done(result):
+                _, pressures, rho_liq, rho_vap = result
+                self._generate_plot(
+                    [rho_liq, rho_vap],
+                    pressures,
+                    f"Phase diagram - Pressure vs Density\n({smiles})",
+                    "Density (mol/m³)",
+                    "Pressure (Pa)",
+                    legends=["Liquid", "Vapor"],
+                )
+
+            self._run_job(
+                "phase diagram P-rho",
+                lambda: pure_phase_diagram(smiles, t_min),
+                done,
             )
         except (ValueError, RuntimeError) as e:
             self._show_error_alert(e)
@@ -287,177 +356,111 @@ class PureLayout(BoxLayout):
         try:
             smiles = get_smiles_from_input(smiles_or_inchi_input)
 
-            # Display Available Data
-            try:
-                rho_data, vp_range, st_range = retrieve_available_data_pure(smiles)
-
-                if (rho_data is not None and len(rho_data) > 0) or (
-                    vp_range[0] is not None or st_range[0] is not None
-                ):
-                    self.predicted_parameters.add_widget(
-                        Label(
-                            text="Experimental Data Availability",
-                            size_hint_y=None,
-                            height=40,
-                            color="#0d6efd",
-                            font_size=20,
-                            bold=True,
-                        )
-                    )
-
-                # Surface Tension
-                if st_range[0] is not None:
-                    dropdown_st = DropDown()
-                    btn = Button(
-                        text=f"ST: {st_range[0]:.2f} - {st_range[1]:.2f} K",
-                        size_hint_y=None,
-                        height=44,
-                    )
-                    btn.bind(  # type: ignore pylint: disable=no-member
-                        on_release=lambda btn: (
-                            self._fill_inputs(t_min=st_range[0], t_max=st_range[1]),
-                            dropdown_st.dismiss(),
-                        )
-                    )
-                    dropdown_st.add_widget(btn)
-
-                    main_button = Button(
-                        text="Select Surface Tension Data",
-                        size_hint_y=None,
-                        height=44,
-                        size_hint_x=0.4,
-                        pos_hint={"center_x": 0.5},
-                        background_color=(0.1, 0.5, 0.8, 1),
-                    )
-                    main_button.bind(on_release=dropdown_st.open)  # type: ignore pylint: disable=no-member
-                    self.predicted_parameters.add_widget(main_button)
-
-                # Vapor Pressure
-                if vp_range[0] is not None:
-                    dropdown_vp = DropDown()
-                    btn = Button(
-                        text=f"VP: {vp_range[0]:.2f} - {vp_range[1]:.2f} K",
-                        size_hint_y=None,
-                        height=44,
-                    )
-                    btn.bind(  # type: ignore pylint: disable=no-member
-                        on_release=lambda btn: (
-                            self._fill_inputs(t_min=vp_range[0], t_max=vp_range[1]),
-                            dropdown_vp.dismiss(),
-                        )
-                    )
-                    dropdown_vp.add_widget(btn)
-
-                    main_button = Button(
-                        text="Select Vapor Pressure Data",
-                        size_hint_y=None,
-                        height=44,
-                        size_hint_x=0.4,
-                        pos_hint={"center_x": 0.5},
-                        background_color=(0.1, 0.5, 0.8, 1),
-                    )
-                    main_button.bind(on_release=dropdown_vp.open)  # type: ignore pylint: disable=no-member
-                    self.predicted_parameters.add_widget(main_button)
-
-                # Density
-                if rho_data is not None and len(rho_data) > 0:
-                    dropdown = DropDown()
-                    for row in rho_data:
-                        # row: [Pressure (kPa), T_min, T_max]
-                        btn = Button(
-                            text=f"P={row[0]:.5g} kPa: {row[1]:.2f} - {row[2]:.2f} K",
-                            size_hint_y=None,
-                            height=44,
-                        )
-                        btn.bind(  # type: ignore pylint: disable=no-member
-                            on_release=lambda btn, r=row: (
-                                self._fill_inputs(
-                                    pressure=r[0], t_min=r[1], t_max=r[2]
-                                ),
-                                dropdown.dismiss(),
-                            )
-                        )
-                        dropdown.add_widget(btn)
-
-                    main_button = Button(
-                        text="Select Liquid Density Data",
-                        size_hint_y=None,
-                        height=44,
-                        size_hint_x=0.4,
-                        pos_hint={"center_x": 0.5},
-                        background_color=(0.1, 0.5, 0.8, 1),
-                    )
-                    main_button.bind(on_release=dropdown.open)  # type: ignore pylint: disable=no-member
-                    self.predicted_parameters.add_widget(main_button)
-
-                self.predicted_parameters.add_widget(Label(size_hint_y=None, height=20))
-            except (ValueError, RuntimeError):
-                pass  # Fail silently if data retrieval errors, proceed to prediction
-
-            pred = predict_pcsaft_parameters(smiles)
-            pred += critical_points_feos(copy(pred))
-
-            # Title
-            title = Label(
-                text="Estimated PC-SAFT parameters",
-                size_hint_y=None,  # changed
-                height=40,  # changed
-                color="#198754",  # Bootstrap text-success
-                font_size=20,
-                bold=True,
-            )
-            self.predicted_parameters.add_widget(title)
-
-            # Table container (Grid)
-            # Calculate required height based on number of rows (header + data)
-            row_height = 30
-            params_count = len(available_params)
-            table_height = (params_count + 1) * row_height
-
-            table = GridLayout(
-                cols=2,
-                size_hint_y=None,
-                height=table_height,
-                spacing=[10, 5],
+            def compute():
+                try:
+                    available = retrieve_available_data_pure(smiles)
+                except (ValueError, RuntimeError):
+                    available = None  # Fail silently, proceed to prediction
+
+                pred = predict_pcsaft_parameters(smiles)
+                pred += list(pure_critical_point(smiles))
+                return available, pred
+
+            self._run_job(
+                "submit",
+                compute,
+                lambda result: self._show_parameters(*result),
+                history=False,
             )
+        except ValueError as e:
+            self._show_error_alert(e)
 
-            # Headers - Using dark gray for contrast on white
-            table.add_widget(
-                Label(text="Parameter name", bold=True, color="#212529", halign="left")
-            )
-            table.add_widget(
+    def _show_available_data(self, rho_data, vp_range, st_range):
+        "display buttons filling the inputs with the available experimental data"
+        if (rho_data is not None and len(rho_data) > 0) or (
+            vp_range[0] is not None or st_range[0] is not None
+        ):
+            self.predicted_parameters.add_widget(
                 Label(
-                    text="Parameter value", bold=True, color="#212529", halign="right"
+                    text="Experimental Data Availability",
+                    size_hint_y=None,
+                    height=40,
+                    color="#0d6efd",
+                    font_size=20,
+                    bold=True,
                 )
             )
 
-            # Rows
-            for name, para in zip(available_params, pred):
-                # Parameter Name
-                param_label = Label(text=str(name), color="#212529", halign="left")
-                param_label.bind(  # type: ignore pylint: disable=no-member
-                    size=param_label.setter("text_size")  # type: ignore pylint: disable=no-member
-                )  # Ensure text aligns within widget
-                table.add_widget(param_label)
-
-                # Parameter Value
-                param_label_value = Label(
-                    text=f"{para:.5g}", color="#212529", halign="right"
-                )
-                param_label_value.bind(size=param_label_value.setter("text_size"))  # type: ignore pylint: disable=no-member
-                table.add_widget(param_label_value)
-
-            self.predicted_parameters.add_widget(table)
-
-            # Footer
-            footer = Label(
-                text="* Not estimated",
-                size_hint_y=None,
-                height=30,
-                color="#6c757d",
-                italic=True,
+        # Surface Tension
+        if st_range[0] is not None:
+            add_data_dropdown(
+                self.predicted_parameters,
+                "Select Surface Tension Data",
+                [
+                    (
+                        f"ST: {st_range[0]:.2f} - {st_range[1]:.2f} K",
+                        lambda: self._fill_inputs(t_min=st_range[0], t_max=st_range[1]),
+                    )
+                ],
             )
-            self.predicted_parameters.add_widget(footer)
 
-        except ValueError as e:
-            self._show_error_alert(e)
+        # Vapor Pressure
+        if vp_range[0] is not None:
+            add_data_dropdown(
+                self.predicted_parameters,
+                "Select Vapor Pressure Data",
+                [
+                    (
+                        f"VP: {vp_range[0]:.2f} - {vp_range[1]:.2f} K",
+                        lambda: self._fill_inputs(t_min=vp_range[0], t_max=vp_range[1]),
+                    )
+                ],
+            )
+
+        # Density
+        if rho_data is not None and len(rho_data) > 0:
+            add_data_dropdown(
+                self.predicted_parameters,
+                "Select Liquid Density Data",
+                [
+                    # row: [Pressure (kPa), T_min, T_max]
+                    (
+                        f"P={row[0]:.5g} kPa: {row[1]:.2f} - {row[2]:.2f} K",
+                        lambda r=row: self._fill_inputs(
+                            pressure=r[0], t_min=r[1], t_max=r[2]
+                        ),
+                    )
+                    for row in rho_data
+                ],
+            )
+
+        self.predicted_parameters.add_widget(Label(size_hint_y=None, height=20))
+
+    def _show_parameters(self, available, pred):
+        "display the experimental data availability and the estimated parameters"
+        if available is not None:
+            self._show_available_data(*available)
+
+        # Title
+        title = Label(
+            text="Estimated PC-SAFT parameters",
+            size_hint_y=None,  # changed
+            height=40,  # changed
+            color="#198754",  # Bootstrap text-success
+            font_size=20,
+            bold=True,
+        )
+        self.predicted_parameters.add_widget(title)
+
+        # Table of the parameters, recycled rows
+        self.predicted_parameters.add_widget(parameter_table(pred))
+
+        # Footer
+        footer = Label(
+            text="* Not estimated",
+            size_hint_y=None,
+            height=30,
+            color="#6c757d",
+            italic=True,
+        )
+        self.predicted_parameters.add_widget(footer)
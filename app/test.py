@@ -1,16 +1,31 @@
 "tests"
 
+import queue
 import sys
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+
+# Installed solver backends, to check the sweeps against them unmocked
+try:
+    import feos as installed_feos
+    import si_units as installed_si
+    from gnnepcsaft.pcsaft import pcsaft_feos as installed_pcsaft_feos
+except ImportError:
+    installed_feos = installed_si = installed_pcsaft_feos = None
+
 # -- MOCK DEPENDENCIES BEFORE IMPORTING APP MODULES --
 # This prevents GUI/Backend libraries from trying to initialize during tests
 sys.modules["kivy"] = MagicMock()
 sys.modules["kivy.app"] = MagicMock()
 sys.modules["matplotlib"] = MagicMock()
+sys.modules["matplotlib.figure"] = MagicMock()
 sys.modules["matplotlib.pyplot"] = MagicMock()
 sys.modules["polars"] = MagicMock()
+sys.modules["si_units"] = MagicMock()
+sys.modules["feos"] = MagicMock()
 
 # Mock thermodynamic backend libraries
 sys.modules["gnnepcsaft"] = MagicMock()
@@ -22,8 +37,98 @@ sys.modules["gnnepcsaft_mcp_server.utils"] = MagicMock()
 # -- IMPORT MODULES TO TEST --
 
 import utils
+import utils_atlas
+import utils_jobs
 import utils_mix
+import utils_pcsaft
 import utils_pure
+import utils_sweep
+
+# Units of the mocked si_units module, all 1 so values pass through unchanged
+SI_UNITS = (
+    "MOL",
+    "METER",
+    "KELVIN",
+    "PASCAL",
+    "KILO",
+    "MEGA",
+    "MILLI",
+    "JOULE",
+    "NEWTON",
+    "ANGSTROM",
+)
+
+
+def mock_backend(test, module, *names, **returns):
+    """
+    Patch the solver backend of app `module` for one `test`: its si units
+    to 1, each of `names` with a mock and each of `returns` with a mock
+    returning the given value. Returns the mocks by name.
+    """
+    patchers = {"si": patch(f"{module}.si", MagicMock(**dict.fromkeys(SI_UNITS, 1.0)))}
+    patchers.update({name: patch(f"{module}.{name}") for name in names})
+    patchers.update(
+        {
+            name: patch(f"{module}.{name}", return_value=value)
+            for name, value in returns.items()
+        }
+    )
+    mocks = {}
+    for name, patcher in patchers.items():
+        mocks[name] = patcher.start()
+        test.addCleanup(patcher.stop)
+    return mocks
+
+
+def clear_solver_caches():
+    "drop the EoS, critical points and curves cached by the solver modules"
+    utils_pure.pure_critical_point.cache_clear()
+    utils_pure._dft_model.cache_clear()  # pylint: disable=protected-access
+    utils_pure._curve_store.clear()  # pylint: disable=protected-access
+    utils_mix._mixture_eos.cache_clear()  # pylint: disable=protected-access
+    utils_mix._dft_functional.cache_clear()  # pylint: disable=protected-access
+    utils_mix._curve_store.clear()  # pylint: disable=protected-access
+
+
+def installed_backend(test, parameters):
+    """
+    Run the solver modules on the installed feos, si_units and gnnepcsaft
+    for one `test`, with the PC-SAFT `parameters` of each SMILES in place
+    of the predicted ones. The cached solver state is dropped around it.
+    """
+    # feos builds its unit results from the si_units module it imports
+    patcher = patch.dict(sys.modules, si_units=installed_si, feos=installed_feos)
+    patcher.start()
+    test.addCleanup(patcher.stop)
+    for module in (utils_pure, utils_mix):
+        names = {
+            "si": installed_si,
+            "predict_pcsaft_parameters": lambda smiles: list(parameters[smiles]),
+        }
+        for backend in (installed_feos, installed_pcsaft_feos):
+            names.update(
+                {
+                    name: getattr(backend, name)
+                    for name in backend.__all__
+                    if hasattr(module, name)
+                }
+            )
+        patcher = patch.multiple(module, **names)
+        patcher.start()
+        test.addCleanup(patcher.stop)
+    clear_solver_caches()
+    test.addCleanup(clear_solver_caches)
+
+
+def metastable_state(*_, density_initialization, **__):
+    """
+    mocked feos State: a warm start stays on the liquid root, metastable
+    past the boiling point, a cold start lands on the stable vapor
+    """
+    state = MagicMock()
+    state.density = 800.0 if density_initialization is not None else 40.0
+    state.is_stable.return_value = density_initialization is None
+    return state
 
 
 class TestUtils(unittest.TestCase):
@@ -46,76 +151,989 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(res, "CCC_converted")
         mock_i2s.assert_called_with(inchi_text)
 
+    def test_plot_series_pairs_lines(self):
+        """Test the lines refined in place match the generated ones"""
+        x, y1, y2 = [1, 2], [3, 4], [5, 6]
+        self.assertEqual(utils.plot_series(x, y1), [(x, y1)])
+        self.assertEqual(utils.plot_series(x, [y1, y2]), [(x, y1), (x, y2)])
+        self.assertEqual(utils.plot_series([y1, y2], x), [(y1, x), (y2, x)])
+        self.assertEqual(utils.plot_series([x, y1], [y1, y2]), [(x, y1), (y1, y2)])
+
+    def test_detail_indices_thin_dense_points_keeping_outliers(self):
+        """Test large overlays are thinned per view, keeping sparse points"""
+        rng = np.random.default_rng(0)
+        x = np.append(rng.uniform(0.0, 1.0, 5000), 9.0)  # an outlier
+        y = np.append(rng.uniform(0.0, 1.0, 5000), 9.0)
+
+        shown = utils.detail_indices(x, y, (0.0, 10.0), (0.0, 10.0), max_points=100)
+        self.assertLessEqual(len(shown), 100)
+        self.assertIn(5000, shown)
+
+        # zoomed in, every visible point is drawn
+        zoomed = utils.detail_indices(x, y, (0.0, 0.1), (0.0, 0.1), max_points=100)
+        visible = (x <= 0.1) & (y <= 0.1)
+        np.testing.assert_array_equal(zoomed, np.flatnonzero(visible))
+
 
 class TestUtilsPure(unittest.TestCase):
     "test utils_pure.py"
 
-    @patch("utils_pure.predict_pcsaft_parameters")
-    @patch("utils_pure.pure_den_feos")
-    def test_pure_den(self, mock_calc, mock_predict):
+    def setUp(self):
+        utils_pure.pure_critical_point.cache_clear()
+        utils_pure._curve_store.clear()  # pylint: disable=protected-access
+
+    def mock_saturation(self):
+        "mocked saturation solver of a compound with Tc = 500 K"
+        return mock_backend(
+            self,
+            "utils_pure",
+            "pc_saft",
+            "PhaseEquilibrium",
+            predict_pcsaft_parameters="dummy_params",
+            critical_points_feos=[500.0, 6e6, 8000.0],
+            _saturation_properties=[12345.0, 40.0, 20000.0, 5.0],
+        )
+
+    def test_pure_den(self):
         """Test Pure Density Logic"""
-        # Setup mocks
-        mock_predict.return_value = "dummy_params"
-        mock_calc.return_value = 1000.0  # Mocked density result
+        mocks = mock_backend(
+            self,
+            "utils_pure",
+            predict_pcsaft_parameters="dummy_params",
+            pure_den_feos=1000.0,  # Mocked density result
+            mix_den_feos=1000.0,  # Warm-started points
+        )
 
         # Execute
-        temps, dens = utils_pure.pure_den("water", 300, 310, 101325)
+        temps, dens, valid, errors = utils_pure.pure_den("water", 300, 310, 101325)
 
         # Assert
         self.assertEqual(len(temps), 10)  # np.linspace default num=10
         self.assertEqual(len(dens), 10)
         self.assertEqual(dens[0], 1000.0)
-        mock_predict.assert_called_with("water")
+        self.assertTrue(valid.all())
+        self.assertFalse(errors.any())
+        mocks["predict_pcsaft_parameters"].assert_called_with("water")
 
-    @patch("utils_pure.predict_pcsaft_parameters")
-    @patch("utils_pure.pure_vp_feos")
-    def test_pure_vp(self, mock_calc, mock_predict):
+    def test_pure_vp(self):
         """Test Pure Vapor Pressure Logic"""
-        mock_predict.return_value = "dummy_params"
-        mock_calc.return_value = 12345.0
+        mocks = self.mock_saturation()
+
+        temps, vps, _, _ = utils_pure.pure_vp("ethanol", 300, 310)
+
+        self.assertEqual(len(temps), 10)
+        self.assertEqual(vps[0], 12345.0)
+        mocks["pc_saft"].assert_called_once_with("dummy_params")
 
-        temps, vps = utils_pure.pure_vp("ethanol", 300, 310)
+    def test_saturation_bundle_shared_between_plots(self):
+        """Vapor pressure, H_vap and phase diagram reuse one VLE sweep"""
+        mock_vle = self.mock_saturation()["PhaseEquilibrium"]
+
+        temps, vps, _, _ = utils_pure.pure_vp("ethanol", 300, 400)
+        self.assertEqual(mock_vle.pure.call_count, 10)
+        _, h_lv, _, _ = utils_pure.pure_h_lv("ethanol", 300, 400)
+        self.assertEqual(mock_vle.pure.call_count, 10)  # same points as vp
+        t_diagram, _, rho_l, rho_v = utils_pure.pure_phase_diagram("ethanol", 300)
 
         self.assertEqual(len(temps), 10)
+        self.assertEqual(temps[-1], 400.0)
         self.assertEqual(vps[0], 12345.0)
+        self.assertEqual(h_lv[0], 40.0)
+        # dense towards Tc, where the diagram closes
+        self.assertEqual(len(t_diagram), utils_pure.PHASE_DIAGRAM_POINTS)
+        self.assertEqual(t_diagram[-1], 500.0)
+        self.assertTrue(np.all(np.diff(np.diff(t_diagram)) < 0))
+        self.assertEqual((rho_l[-1], rho_v[-1]), (8000.0, 8000.0))
+        # only the new subcritical temperatures are solved
+        self.assertEqual(mock_vle.pure.call_count, 10 + len(t_diagram) - 2)
+        # warm-started from the previous equilibrium after the first point
+        first, second = mock_vle.pure.call_args_list[:2]
+        self.assertIsNone(first.kwargs["initial_state"])
+        self.assertIs(second.kwargs["initial_state"], mock_vle.pure.return_value)
+
+    def test_pure_vp_clipped_at_critical_point(self):
+        """Vapor pressure sweeps stop at the cached critical point"""
+        mocks = self.mock_saturation()
+
+        t_min, t_max, note = utils_pure.clip_to_saturation("ethanol", 300, 600)
+        self.assertEqual((t_min, t_max), (300, 500.0))
+        self.assertIn("500.00", note)
+
+        temps, vps, _, _ = utils_pure.pure_vp("ethanol", 300, 600)
+
+        self.assertEqual(temps[-1], 500.0)
+        self.assertEqual(vps[-1], 6e6)  # critical pressure, no solver call
+        self.assertEqual(mocks["PhaseEquilibrium"].pure.call_count, 9)
+        mocks["critical_points_feos"].assert_called_once()  # cached between calls
+
+        with self.assertRaises(ValueError):
+            utils_pure.pure_vp("ethanol", 550, 600)
+
+    def test_pure_surface_tension_stored_curve(self):
+        """Surface tension closes at Tc and reuses the stored curve"""
+        mocks = mock_backend(
+            self,
+            "utils_pure",
+            "PhaseEquilibrium",
+            predict_pcsaft_parameters="dummy_params",
+            critical_points_feos=[500.0, 6e6, 8000.0],
+            _dft_model=(MagicMock(), 500.0, {}),
+            _interface_surface_tension=20.0,
+        )
+        mock_st = mocks["_interface_surface_tension"]
+
+        temps, st, valid, _ = utils_pure.pure_surface_tension("ethanol", 300)
+
+        self.assertEqual(len(temps), 100)
+        self.assertEqual((temps[-1], st[-1]), (500.0, 0.0))
+        self.assertTrue(valid.all())
+        self.assertEqual(mock_st.call_count, 99)  # no DFT solve at Tc
+
+        mock_st.reset_mock()
+        utils_pure.pure_surface_tension("ethanol", 300)
+        mock_st.assert_not_called()
+
+        temps, _, _, _ = utils_pure.pure_surface_tension("ethanol", 290)
+        self.assertEqual(temps[0], 290.0)
+        self.assertEqual(mock_st.call_count, 5)  # only the new sub-interval
+        self.assertEqual(mocks["PhaseEquilibrium"].pure.call_count, 104)
+
+    def test_interface_seeded_from_neighbour(self):
+        """Profiles start from the neighbouring one, and from pDGT near Tc"""
+        mock_interface = mock_backend(
+            self, "utils_pure", "PlanarInterface", _dft_model=(MagicMock(), 500.0, {})
+        )["PlanarInterface"]
+        for start in (mock_interface.from_pdgt, mock_interface.from_density_profile):
+            start.return_value.solve.return_value = MagicMock(surface_tension=20.0)
+
+        def surface_tension(temperature):
+            return utils_pure._interface_surface_tension(  # pylint: disable=protected-access
+                "CCO", temperature, MagicMock()
+            )
+
+        self.assertEqual(surface_tension(300.0), 20.0)
+        surface_tension(310.0)
+        self.assertEqual(mock_interface.from_pdgt.call_count, 1)
+        mock_interface.from_density_profile.assert_called_once()
+        self.assertEqual(
+            mock_interface.from_density_profile.call_args.args[1],
+            utils_pure.INTERFACE_GRID,
+        )
+
+        surface_tension(460.0)  # above SEEDED_INTERFACE_MAX_TR * Tc
+        self.assertEqual(mock_interface.from_pdgt.call_count, 2)
+
+        mock_interface.from_density_profile.return_value.solve.side_effect = (
+            RuntimeError("not converged")
+        )
+        self.assertEqual(surface_tension(320.0), 20.0)  # falls back to pDGT
+        self.assertEqual(mock_interface.from_pdgt.call_count, 3)
+
+    def test_pure_properties_one_state_per_point(self):
+        """All derived properties of an isobar come from one sweep"""
+        n_props = len(utils_pure.STATE_PROPERTIES)
+        mocks = mock_backend(
+            self,
+            "utils_pure",
+            "pc_saft",
+            "State",
+            predict_pcsaft_parameters="dummy_params",
+            state_properties=[1000.0] + [1.0] * (n_props - 1),
+        )
+        mock_state = mocks["State"]
+
+        temps, props, valid, _ = utils_pure.pure_properties("water", 300, 310, 1e5)
+
+        self.assertEqual(props.shape, (10, n_props))
+        self.assertTrue(valid.all())
+        self.assertEqual(mock_state.call_count, len(temps))
+        mocks["pc_saft"].assert_called_once_with("dummy_params")
+        first, second = mock_state.call_args_list[:2]
+        self.assertEqual(first.kwargs["density_initialization"], "liquid")
+        self.assertNotIsInstance(second.kwargs["density_initialization"], str)
+
+        utils_pure.pure_properties("water", 300, 310, 1e5)
+        self.assertEqual(mock_state.call_count, len(temps))  # stored sweep
 
 
 class TestUtilsMix(unittest.TestCase):
     "test utils_mix.py"
 
-    @patch("utils_mix.predict_pcsaft_parameters")
-    @patch("utils_mix.mix_den_feos")
-    def test_mix_den(self, mock_calc, mock_predict):
+    def setUp(self):
+        utils_mix._curve_store.clear()  # pylint: disable=protected-access
+
+    def test_mix_den(self):
         """Test Mixture Density Logic"""
-        mock_predict.side_effect = ["p1", "p2"]
-        mock_calc.return_value = 800.0
+        mock_state = mock_backend(self, "utils_mix", "_mixture_eos", "State")["State"]
+        stable = MagicMock(density=800.0)
+        stable.is_stable.return_value = True
+        mock_state.return_value = stable
 
         smiles = ["C1", "C2"]
         fracs = [0.5, 0.5]
         kij = [[0.0, 0.0], [0.0, 0.0]]
-        temps, dens = utils_mix.mix_den(smiles, fracs, kij, 300, 310, 100000)
+        temps, dens, _, _ = utils_mix.mix_den(smiles, fracs, kij, 300, 310, 100000)
 
         self.assertEqual(len(temps), 10)
         self.assertEqual(dens[0], 800.0)
+        inits = [c.kwargs["density_initialization"] for c in mock_state.call_args_list]
+        # stable phase first, then warm-started from the previous point
+        self.assertIsNone(inits[0])
+        self.assertEqual(inits[1:], [800.0] * (len(temps) - 1))
 
-        # Verify call arguments structure
-        call_kwargs = mock_calc.call_args[1]
-        self.assertIn("parameters", call_kwargs)
-        self.assertIn("state", call_kwargs)
-        self.assertIn("kij_matrix", call_kwargs)
+    def test_mix_den_metastable(self):
+        """A metastable warm-started root is replaced by the stable one"""
+        mock_state = mock_backend(self, "utils_mix", "_mixture_eos", "State")["State"]
+        mock_state.side_effect = metastable_state
 
-    @patch("utils_mix.predict_pcsaft_parameters")
-    @patch("utils_mix.mix_vle_diagram_feos")
-    def test_mix_vle(self, mock_calc, mock_predict):
+        _, dens, _, _ = utils_mix.mix_den(
+            ["C1", "C2"], [0.5, 0.5], [[0, 0], [0, 0]], 300, 310, 1e5, num=3
+        )
+
+        self.assertEqual(list(dens), [40.0, 40.0, 40.0])
+        inits = [c.kwargs["density_initialization"] for c in mock_state.call_args_list]
+        self.assertEqual(inits, [None, 40.0, None, 40.0, None])
+
+    def test_mix_den_grid_stable_phase(self):
+        """Density map points keep the stable phase, as the isobar"""
+        mock_state = mock_backend(self, "utils_mix", "_mixture_eos", "State")["State"]
+        mock_state.side_effect = metastable_state
+
+        grid = utils_mix.mix_den_grid(
+            ["C1", "C2"], [[0, 0], [0, 0]], [[0.5]], [1e5], [300.0, 310.0]
+        )
+
+        self.assertEqual(grid.values.ravel().tolist(), [40.0, 40.0])
+        inits = [c.kwargs["density_initialization"] for c in mock_state.call_args_list]
+        self.assertEqual(inits, [None, 40.0, None])
+
+    def test_mix_properties_stable_phase(self):
+        """Mixture properties start from the stable phase, as the density"""
+        mock_state = mock_backend(
+            self,
+            "utils_mix",
+            "_mixture_eos",
+            "State",
+            state_properties=[800.0] + [1.0] * 6,
+        )["State"]
+        mock_state.return_value.is_stable.return_value = True
+
+        utils_mix.mix_properties(
+            ["C1", "C2"], [0.5, 0.5], [[0, 0], [0, 0]], 300, 310, 1e5, num=3
+        )
+
+        inits = [c.kwargs["density_initialization"] for c in mock_state.call_args_list]
+        self.assertEqual(inits, [None, 800.0, 800.0])
+
+    def test_mix_vle(self):
         """Test Mixture VLE Logic"""
-        mock_predict.return_value = "p"
         expected_output = {"x0": [0.1], "y0": [0.9], "temperature": [300]}
-        mock_calc.return_value = expected_output
+        mock_backend(
+            self,
+            "utils_mix",
+            predict_pcsaft_parameters="p",
+            mix_vle_diagram_feos=expected_output,
+        )
 
         res = utils_mix.mix_vle(["A", "B"], [[0, 0], [0, 0]], 101325)
 
         self.assertEqual(res, expected_output)
 
+    def test_mix_vp_envelope(self):
+        """Test Mixture Phase Envelope Logic"""
+        mocks = mock_backend(
+            self,
+            "utils_mix",
+            "pc_saft_mixture",
+            "PhaseDiagram",
+            "PhaseEquilibrium",
+            "State",
+            predict_pcsaft_parameters="p",
+        )
+        mock_diagram, mock_vle = mocks["PhaseDiagram"], mocks["PhaseEquilibrium"]
+        mocks["State"].critical_point.return_value.temperature = 310.0
+        mocks["State"].critical_point.return_value.pressure.return_value = 2e5
+        mock_diagram.bubble_point_line.return_value.to_dict.return_value = {
+            "temperature": [300.0, 310.0],
+            "pressure": [1e5, 2e5],
+        }
+        # the dew line stops short of the critical point
+        mock_diagram.dew_point_line.return_value.to_dict.return_value = {
+            "temperature": [300.0, 305.0],
+            "pressure": [5e4, 1e5],
+        }
+        converged = MagicMock()
+        converged.liquid.pressure.return_value = 1.5e5
+        converged.liquid.density, converged.vapor.density = 500.0, 100.0
+        # next to Tc a warm start lands on the bubble line, the cold one fails
+        crossed = MagicMock()
+        crossed.liquid.density, crossed.vapor.density = 100.0, 500.0
+        mock_vle.dew_point.side_effect = [converged, crossed, RuntimeError]
+
+        bubble, dew = utils_mix.mix_vp(
+            ["A", "B"], [0.5, 0.5], [[0, 0], [0, 0]], 300, npoints=5
+        )
+
+        self.assertEqual(bubble.x.tolist(), [300.0, 310.0])
+        self.assertEqual(bubble.y.tolist(), [1e5, 2e5])
+        mock_vle.bubble_point.assert_not_called()
+        # continued towards Tc, closing at the critical point
+        self.assertEqual(len(dew.x), 5)
+        self.assertTrue(np.all(np.diff(np.diff(dew.x[1:])) < 0))
+        self.assertEqual((dew.x[-1], dew.y[-1]), (310.0, 2e5))
+        self.assertEqual(dew.y[2], 1.5e5)
+        # the failed point is retried cold, then masked
+        self.assertEqual(dew.valid.tolist(), [True, True, True, False, True])
+        self.assertEqual(dew.errors[3], utils_sweep.POINT_NOT_CONVERGED)
+        first = mock_vle.dew_point.call_args_list[0]
+        line = mock_diagram.dew_point_line.return_value
+        self.assertIs(
+            first.kwargs["liquid_molefracs"], line.states[-1].liquid.molefracs
+        )
+        # one continuation call per curve
+        mocks["pc_saft_mixture"].assert_called_once()
+        mock_diagram.bubble_point_line.assert_called_once()
+        mock_diagram.dew_point_line.assert_called_once()
+
+    def test_mix_surface_tension_x_reuses_profiles(self):
+        """Composition steps after the first reuse the previous interface"""
+        solve = MagicMock(return_value=25.0)
+        mock_backend(self, "utils_mix", _interface_solver=solve)
+
+        x1, st, valid, _ = utils_mix.mix_surface_tension_x(
+            ["CCO", "O"], [[0, 0], [0, 0]], 300.0, npoints=5
+        )
+
+        np.testing.assert_allclose(x1, [0.01, 0.255, 0.5, 0.745, 0.99])
+        self.assertTrue(valid.all())
+        self.assertEqual(st[0], 25.0)
+        warm = [call.args[2] for call in solve.call_args_list]
+        self.assertEqual(warm, [False, True, True, True, True])
+        self.assertEqual(solve.call_args_list[1].args[1], [0.255, 0.745])
+
+        with self.assertRaises(ValueError):
+            utils_mix.mix_surface_tension_x(["CCO", "O", "C"], [[0] * 3] * 3, 300.0)
+
+    def test_mix_excess_enthalpy_batched(self):
+        """Excess enthalpy uses one EoS and cold-started pure liquid references"""
+        mocks = mock_backend(self, "utils_mix", "_mixture_eos", "State")
+        h_res = iter([-40.0, -20.0, -32.0, -41.0])  # pure 1, pure 2, mixtures
+
+        def state(*_, density_initialization, **__):
+            result = MagicMock()
+            # a warm start lands on the vapor root, a cold start on the liquid
+            result.density = 16000.0 if density_initialization == "liquid" else 40.0
+            result.molar_enthalpy.side_effect = lambda _: next(h_res)
+            return result
+
+        mocks["State"].side_effect = state
+        e_h = utils_mix.mix_excess_enthalpy(
+            ["CCO", "O"], [[0, 0], [0, 0]], 300.0, 1e5, [[0.5, 0.5], [1.0, 0.0]]
+        )
+
+        np.testing.assert_allclose(e_h, [-2.0, -1.0])
+        mocks["_mixture_eos"].assert_called_once()
+        # the pure liquids and the path start cold; the vapor landing of the
+        # warm start is solved again cold
+        initializations = [
+            call.kwargs["density_initialization"]
+            for call in mocks["State"].call_args_list
+        ]
+        self.assertEqual(
+            initializations, ["liquid", "liquid", "liquid", 16000.0, "liquid"]
+        )
+
+
+@unittest.skipIf(installed_feos is None, "feos is not installed")
+class TestSolverPaths(unittest.TestCase):
+    "check the warm-started and continued sweeps against feos solved cold"
+
+    # PC-SAFT parameters of hexane and ethanol (Gross and Sadowski)
+    parameters = {
+        "CCCCCC": [3.0576, 3.7983, 236.77, 0.0, 0.0, 0.0, 0.0, 0.0, 86.18],
+        "CCO": [2.3827, 3.1771, 198.24, 0.0324, 2653.4, 0.0, 1.0, 1.0, 46.07],
+    }
+
+    def setUp(self):
+        installed_backend(self, self.parameters)
+
+    def test_saturation_views_match_feos(self):
+        """Saturation views of the stored curve agree with feos point by point"""
+        hexane = self.parameters["CCCCCC"]
+        temps, vps, valid, _ = utils_pure.pure_vp("CCCCCC", 250, 400)
+        _, h_lv, _, _ = utils_pure.pure_h_lv("CCCCCC", 250, 400)
+
+        self.assertTrue(valid.all())
+        np.testing.assert_allclose(
+            vps, [installed_pcsaft_feos.pure_vp_feos(hexane, [t]) for t in temps]
+        )
+        np.testing.assert_allclose(
+            h_lv, [installed_pcsaft_feos.pure_h_lv_feos(hexane, [t]) for t in temps]
+        )
+
+    def test_phase_diagram_matches_feos(self):
+        """The dense phase diagram closes at the feos critical point"""
+        hexane = self.parameters["CCCCCC"]
+        utils_pure.pure_vp("CCCCCC", 250, 400)  # part of the curve stored first
+        t_diagram, p_diagram, rho_l, rho_v = utils_pure.pure_phase_diagram(
+            "CCCCCC", 250
+        )
+        tc, pc, dc = installed_pcsaft_feos.critical_points_feos(hexane)
+        np.testing.assert_allclose(
+            [t_diagram[-1], p_diagram[-1], rho_l[-1], rho_v[-1]], [tc, pc, dc, dc]
+        )
+        eos = installed_pcsaft_feos.pc_saft(hexane)
+        for i in range(0, len(t_diagram) - 1, 20):
+            vle = installed_feos.PhaseEquilibrium.pure(
+                eos, t_diagram[i] * installed_si.KELVIN
+            )
+            np.testing.assert_allclose(
+                [rho_l[i], rho_v[i]],
+                [
+                    vle.liquid.density / (installed_si.MOL / installed_si.METER**3),
+                    vle.vapor.density / (installed_si.MOL / installed_si.METER**3),
+                ],
+                rtol=1e-6,
+            )
+
+    def test_density_sweeps_match_feos(self):
+        """Warm-started isobars and the density map stay on the stable root"""
+        hexane = self.parameters["CCCCCC"]
+        temps, dens, _, _ = utils_pure.pure_den("CCCCCC", 250, 330, 1e5)
+        np.testing.assert_allclose(
+            dens, [installed_pcsaft_feos.pure_den_feos(hexane, [t, 1e5]) for t in temps]
+        )
+
+        # the equimolar mixture boils on the isobar
+        smiles = ["CCCCCC", "CCO"]
+        kij = [[0.0, 0.0], [0.0, 0.0]]
+        temps, dens, valid, _ = utils_mix.mix_den(
+            smiles, [0.5, 0.5], kij, 300, 400, 1e5
+        )
+        cold = [
+            installed_pcsaft_feos.mix_den_feos(
+                list(self.parameters.values()), [t, 1e5, 0.5, 0.5]
+            )
+            for t in temps
+        ]
+        self.assertTrue(valid.all())
+        np.testing.assert_allclose(dens, cold)
+        self.assertLess(dens[-1], 100.0)  # vapor
+
+        grid = utils_mix.mix_den_grid(smiles, kij, [[0.5]], [1e5], temps)
+        np.testing.assert_allclose(grid.values.ravel(), cold)
+
+    def test_phase_envelope_closes_at_critical_point(self):
+        """Bubble and dew lines continue up to the mixture critical point"""
+        bubble, dew = utils_mix.mix_vp(
+            ["CCCCCC", "CCO"], [0.5, 0.5], [[0.0, 0.0], [0.0, 0.0]], 300
+        )
+
+        eos = installed_pcsaft_feos.pc_saft_mixture(list(self.parameters.values()))
+        critical = installed_feos.State.critical_point(
+            eos, np.array([0.5, 0.5]) * installed_si.MOL
+        )
+        for line in (bubble, dew):
+            self.assertAlmostEqual(
+                line.x[-1], critical.temperature / installed_si.KELVIN, places=6
+            )
+            self.assertTrue(np.all(np.diff(line.y[line.valid]) > 0))
+        # the dew pressure is below the bubble pressure on the whole envelope
+        inside = dew.valid & (dew.x < bubble.x[-1])
+        self.assertTrue(
+            np.all(dew.y[inside] < np.interp(dew.x[inside], bubble.x, bubble.y))
+        )
+
+    def test_surface_tension_matches_feos(self):
+        """Seeded interface profiles agree with the feos surface tension diagram"""
+        temps, st, valid, _ = utils_pure.pure_surface_tension("CCCCCC", 250)
+        st_feos, t_feos = installed_pcsaft_feos.pure_surface_tension_feos(
+            self.parameters["CCCCCC"], [250]
+        )
+
+        self.assertTrue(valid.all())
+        np.testing.assert_allclose(temps, t_feos)
+        np.testing.assert_allclose(st, st_feos, atol=1e-5)
+
+    def test_mixture_interface_path_matches_cold_solves(self):
+        """Interfaces started from the previous profile match cold starts"""
+        smiles = ["CCCCCC", "CCO"]
+        kij = [[0.0, 0.0], [0.0, 0.0]]
+        x1, st, valid, _ = utils_mix.mix_surface_tension_x(smiles, kij, 300.0, 3)
+
+        solve = utils_mix._interface_solver(  # pylint: disable=protected-access
+            smiles, kij
+        )
+        self.assertTrue(valid.all())
+        np.testing.assert_allclose(
+            st, [solve(300.0, [x, 1.0 - x], False) for x in x1], rtol=1e-5
+        )
+
+    def test_state_properties_match_feos(self):
+        """Isobar properties and liquid paths agree with cold feos states"""
+        smiles = ["CCCCCC", "CCO"]
+        parameters = list(self.parameters.values())
+        kij = [[0.0, 0.0], [0.0, 0.0]]
+
+        temps, props, _, _ = utils_pure.pure_properties("CCCCCC", 250, 330, 1e5)
+        np.testing.assert_allclose(
+            props[:, 0],
+            [
+                installed_pcsaft_feos.pure_den_feos(parameters[0], [t, 1e5])
+                for t in temps
+            ],
+        )
+        temps, props, _, _ = utils_mix.mix_properties(
+            smiles, [0.5, 0.5], kij, 300, 400, 1e5
+        )
+        np.testing.assert_allclose(
+            props[:, 0],
+            [
+                installed_pcsaft_feos.mix_den_feos(parameters, [t, 1e5, 0.5, 0.5])
+                for t in temps
+            ],
+        )
+
+        compositions = [[0.2, 0.8], [0.5, 0.5], [0.8, 0.2]]
+        gammas = utils_mix.mix_activity_coefficients(
+            smiles, kij, 300.0, 1e5, compositions
+        )
+        np.testing.assert_allclose(
+            np.log(gammas),
+            [
+                installed_pcsaft_feos.mix_ln_activity_coefficient(
+                    parameters, [300.0, 1e5] + x, density_initialization="liquid"
+                )
+                for x in compositions
+            ],
+            rtol=1e-6,
+        )
+
+        eos = installed_pcsaft_feos.pc_saft_mixture(parameters)
+
+        def h_res(x):
+            "residual enthalpy (kJ/mol) of the liquid at 300 K and 1 bar"
+            state = installed_feos.State(
+                eos,
+                temperature=300.0 * installed_si.KELVIN,
+                pressure=1e5 * installed_si.PASCAL,
+                composition=np.asarray(x) * installed_si.MOL,
+                density_initialization="liquid",
+            )
+            return state.molar_enthalpy(installed_feos.Contributions.Residual) / (
+                installed_si.KILO * installed_si.JOULE / installed_si.MOL
+            )
+
+        np.testing.assert_allclose(
+            utils_mix.mix_excess_enthalpy(smiles, kij, 300.0, 1e5, compositions),
+            [
+                h_res(x) - x[0] * h_res([1.0, 0.0]) - x[1] * h_res([0.0, 1.0])
+                for x in compositions
+            ],
+            rtol=1e-6,
+        )
+
+
+class TestUtilsAtlas(unittest.TestCase):
+    "test utils_atlas.py"
+
+    def test_cubic_interpolation_exact_for_quadratics(self):
+        """Cubic Hermite interpolation reproduces a quadratic between nodes"""
+        nodes = np.linspace(0.0, 1.0, 11)
+        x = np.array([0.05, 0.33, 0.71])
+
+        values = utils_atlas.cubic_interpolation(nodes, nodes**2, x)
+        np.testing.assert_allclose(values[1:], x[1:] ** 2, rtol=1e-12)
+        # decreasing nodes, as on the saturation grid
+        values = utils_atlas.cubic_interpolation(nodes[::-1], nodes[::-1] ** 2, x)
+        np.testing.assert_allclose(values[1:], x[1:] ** 2, rtol=1e-12)
+
+    @patch("utils_atlas._atlas_row", return_value=None)
+    def test_untabulated_compound_falls_back(self, _):
+        """Compounds outside the atlas are left to the solver"""
+        self.assertIsNone(utils_atlas.atlas_density("CCO", 300.0, 350.0, 1e5))
+        self.assertIsNone(utils_atlas.atlas_saturation("CCO", 300.0, 350.0))
+
+
+class TestUtilsPcsaft(unittest.TestCase):
+    "test utils_pcsaft.py"
+
+    # non-associating and associating polar parameter sets, with their
+    # densities at 300 K and 1 MPa from `pure_den_feos`
+    parameters = np.array(
+        [
+            [2.5, 3.7, 250.0, 0.0, 0.0, 0.0, 0.0, 0.0, 72.0],
+            [1.2, 2.9, 250.0, 0.03, 2500.0, 1.8, 1.0, 1.0, 18.0],
+        ]
+    )
+    feos_densities = np.array([9889.860686095539, 51197.66682266331])
+
+    def test_liquid_density_matches_feos(self):
+        """Vectorized liquid densities agree with feos"""
+        densities = utils_pcsaft.liquid_density(self.parameters, 300.0, 1e6)
+        np.testing.assert_allclose(densities, self.feos_densities, rtol=1e-7)
+
+    @unittest.skipIf(installed_feos is None, "feos is not installed")
+    def test_liquid_density_matches_installed_feos(self):
+        """Vectorized liquid densities agree with feos away from the fixture state"""
+        installed_backend(self, {})
+        temperatures = np.array([250.0, 300.0, 350.0])
+        for pressure in (1e5, 1e7):
+            densities = utils_pcsaft.liquid_density(
+                self.parameters[:, None, :], temperatures, pressure
+            )
+            expected = [
+                [
+                    installed_pcsaft_feos.pure_den_feos(list(p), [t, pressure])
+                    for t in temperatures
+                ]
+                for p in self.parameters
+            ]
+            np.testing.assert_allclose(densities, expected, rtol=1e-7)
+
+    def test_states_and_parameter_sets_broadcast(self):
+        """Arrays of states and parameter sets are solved at once"""
+        temperatures = np.array([280.0, 300.0, 320.0])
+        densities = utils_pcsaft.liquid_density(
+            self.parameters[:, None, :], temperatures, 1e6, chunk_size=2
+        )
+        self.assertEqual(densities.shape, (2, 3))
+        np.testing.assert_allclose(densities[:, 1], self.feos_densities, rtol=1e-7)
+        pressures = utils_pcsaft.pressure(
+            self.parameters[:, None, :], temperatures, densities
+        )
+        np.testing.assert_allclose(pressures, 1e6, rtol=1e-6)
+
+
+class TestUtilsSweep(unittest.TestCase):
+    "test utils_sweep.py"
+
+    def test_continuation_sweep_seeds_previous_value(self):
+        """Each point is warm-started from the previous converged value"""
+        guesses = []
+
+        def solve(point, guess):
+            guesses.append(guess)
+            return point * 10.0
+
+        result = utils_sweep.continuation_sweep(solve, [1.0, 2.0, 3.0])
+
+        self.assertEqual(result.y.tolist(), [10.0, 20.0, 30.0])
+        self.assertEqual(guesses, [None, 10.0, 20.0])
+
+    def test_continuation_sweep_falls_back_to_cold_start(self):
+        """A failed warm start is retried from a cold start"""
+        guesses = []
+
+        def solve(point, guess):
+            guesses.append(guess)
+            if guess is not None:
+                raise RuntimeError("not converged")
+            return point
+
+        result = utils_sweep.continuation_sweep(solve, [1.0, 2.0])
+
+        self.assertEqual(result.y.tolist(), [1.0, 2.0])
+        self.assertEqual(guesses, [None, 1.0, None])
+
+    def test_continuation_sweep_keeps_partial_results(self):
+        """A failed point is masked without discarding the other points"""
+
+        def solve(point, _):
+            if point == 2.0:
+                raise RuntimeError("not converged")
+            if point == 3.0:
+                raise AssertionError("temperature mismatch")
+            return point
+
+        result = utils_sweep.continuation_sweep(solve, [1.0, 2.0, 3.0, 4.0])
+
+        self.assertEqual(result.valid.tolist(), [True, False, False, True])
+        self.assertEqual(
+            result.errors.tolist(),
+            [
+                utils_sweep.POINT_OK,
+                utils_sweep.POINT_NOT_CONVERGED,
+                utils_sweep.POINT_INVALID,
+                utils_sweep.POINT_OK,
+            ],
+        )
+        self.assertEqual(result.y[[0, 3]].tolist(), [1.0, 4.0])
+        self.assertEqual(utils_sweep.failure_note(result), "2 of 4 points failed")
+
+    def test_curve_store_computes_only_uncovered_points(self):
+        """Widening a cached range only solves the new sub-interval"""
+        store = utils_sweep.CurveStore()
+        solved = []
+
+        def solve(point, guess):
+            solved.append((point, guess))
+            return 2.0 * point
+
+        store.sweep("curve", solve, 300.0, 309.0, num=10)
+        self.assertEqual(len(solved), 10)
+
+        solved.clear()
+        result = store.sweep("curve", solve, 300.0, 318.0, num=19)
+        self.assertEqual([point for point, _ in solved], list(range(310, 319)))
+        self.assertEqual(solved[0][1], 618.0)  # seeded from the cached 309 K
+        self.assertEqual(len(result.x), 19)
+        self.assertTrue(np.all(np.diff(result.x) > 0))
+
+        solved.clear()
+        result = store.sweep("curve", solve, 290.0, 300.0, num=11)
+        self.assertEqual(solved[0][0], 299.0)  # swept away from the cache
+        self.assertEqual(solved[0][1], 600.0)
+        self.assertEqual(len(solved), 10)
+
+        solved.clear()
+        result = store.sweep("curve", solve, 302.0, 306.0, num=5)
+        self.assertEqual(solved, [])
+        np.testing.assert_array_equal(result.y, 2.0 * result.x)
+
+    def test_curve_store_sweep_at_requested_points(self):
+        """A sweep at given points solves and returns only those points"""
+        store = utils_sweep.CurveStore()
+        solved = []
+
+        def solve(point, _):
+            solved.append(point)
+            return 2.0 * point
+
+        store.sweep_at("curve", solve, [300.0, 305.0, 310.0])
+        result = store.sweep_at("curve", solve, [300.0, 302.0, 308.0, 310.0])
+
+        self.assertEqual(solved, [300.0, 305.0, 310.0, 302.0, 308.0])
+        self.assertEqual(result.x.tolist(), [300.0, 302.0, 308.0, 310.0])
+        self.assertEqual(result.y.tolist(), [600.0, 604.0, 616.0, 620.0])
+
+    def test_curve_store_concurrent_sweeps(self):
+        """Sweeps of one key on two threads solve each point once"""
+        store = utils_sweep.CurveStore()
+        solved = []
+        started = threading.Event()
+
+        def solve(point, _):
+            started.set()
+            solved.append(point)
+            return 2.0 * point
+
+        other = threading.Thread(
+            target=store.sweep, args=("curve", solve, 300.0, 309.0, 10)
+        )
+        other.start()
+        started.wait(timeout=5)
+        result = store.sweep("curve", solve, 300.0, 309.0, num=10)
+        other.join()
+
+        self.assertEqual(sorted(solved), list(range(300, 310)))
+        self.assertEqual(len(result.x), 10)
+
+    def test_curve_merge_drops_repeated_points(self):
+        """Merging a point already on the curve keeps the cached one"""
+        curve = utils_sweep._Curve()  # pylint: disable=protected-access
+        ok = utils_sweep.POINT_OK
+        curve.merge(
+            utils_sweep.SweepResult(
+                np.array([1.0, 2.0]),
+                np.array([10.0, 20.0]),
+                np.array([True, True]),
+                np.array([ok, ok]),
+            ),
+            1.0,
+            2.0,
+            1.0,
+        )
+        curve.merge(
+            utils_sweep.SweepResult(
+                np.array([2.0, 3.0]),
+                np.array([99.0, 30.0]),
+                np.array([True, True]),
+                np.array([ok, ok]),
+            ),
+            2.0,
+            3.0,
+            1.0,
+        )
+        self.assertEqual(curve.result.x.tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(curve.result.y.tolist(), [10.0, 20.0, 30.0])
+
+    def test_require_valid_raises_when_nothing_converged(self):
+        """A sweep without any converged point is reported as an error"""
+
+        def solve(point, _):
+            raise RuntimeError("not converged")
+
+        result = utils_sweep.continuation_sweep(solve, [1.0, 2.0])
+
+        with self.assertRaises(RuntimeError):
+            utils_sweep.require_valid(result)
+
+    def test_grid_sweep_labelled_chunks(self):
+        """A state grid is solved in chunks, warm-started along the last axis"""
+        guesses = []
+
+        def solve(point, guess):
+            guesses.append(guess)
+            if point["x1"] > 0.5 and point["T"] == 320.0:
+                raise ValueError("invalid state")
+            return point["T"] + 1000.0 * point["x1"]
+
+        result = utils_sweep.grid_sweep(
+            solve,
+            {"x1": [0.2, 0.8], "P": [1e5], "T": [300.0, 310.0, 320.0]},
+            chunk_size=2,
+        )
+
+        self.assertEqual(result.dims, ("x1", "P", "T"))
+        self.assertEqual(result.values.shape, (2, 1, 3))
+        np.testing.assert_allclose(result.values[0, 0], [500.0, 510.0, 520.0])
+        self.assertEqual(result.errors[1, 0, 2], utils_sweep.POINT_INVALID)
+        self.assertTrue(np.isnan(result.values[1, 0, 2]))
+        # each isotherm line starts cold, across chunk boundaries too
+        self.assertEqual(guesses[:4], [None, 500.0, 510.0, None])
+        self.assertEqual(result.squeeze().dims, ("x1", "T"))
+
+    def test_family_map_keeps_order_and_failures(self):
+        """Family curves follow the conditions; a failed one gives its error"""
+
+        def compute(pressure):
+            if pressure == 2e5:
+                raise RuntimeError("not converged")
+            return pressure / 1e5
+
+        results = utils_sweep.family_map(compute, [1e5, 2e5, 3e5], max_workers=3)
+
+        self.assertEqual(results[0], 1.0)
+        self.assertIsInstance(results[1], RuntimeError)
+        self.assertEqual(results[2], 3.0)
+
+
+class TestUtilsJobs(unittest.TestCase):
+    "Test utils_jobs.py"
+
+    def setUp(self):
+        self.delivered = []
+        # deliveries queued like `Clock.schedule_once`, run by `deliver`
+        self.scheduled = queue.Queue()
+        self.executor = utils_jobs.JobExecutor(self.scheduled.put)
+
+    def deliver(self, count=1):
+        "run the deliveries scheduled by the workers on this thread"
+        for _ in range(count):
+            self.scheduled.get(timeout=5)(0)
+
+    def test_result_and_progress_delivered(self):
+        """A job hands back its result with the progress of its sweep"""
+
+        def compute():
+            return utils_sweep.continuation_sweep(lambda t, _: t, [1.0, 2.0, 3.0, 4.0])
+
+        job = self.executor.submit(compute, self.delivered.append, self.fail)
+        self.deliver()
+
+        self.assertTrue(job.done)
+        self.assertEqual(job.progress, 0.75)  # reported before the last point
+        np.testing.assert_allclose(self.delivered[0].y, [1.0, 2.0, 3.0, 4.0])
+
+    def test_error_delivered(self):
+        """A failing job hands its exception to the error callback"""
+
+        def compute():
+            raise RuntimeError("not converged")
+
+        self.executor.submit(compute, self.fail, self.delivered.append)
+        self.deliver()
+
+        self.assertIsInstance(self.delivered[0], RuntimeError)
+
+    def test_repeated_request_merged_and_outdated_cancelled(self):
+        """A repeated press joins the job in flight, a new request cancels it"""
+        started, release = threading.Event(), threading.Event()
+
+        def solve(t, _):
+            started.set()
+            release.wait(timeout=5)
+            return t
+
+        def compute():
+            return utils_sweep.continuation_sweep(solve, [1.0, 2.0, 3.0])
+
+        first = self.executor.submit(compute, self.delivered.append, self.fail, "a")
+        started.wait(timeout=5)
+        again = self.executor.submit(compute, self.delivered.append, self.fail, "a")
+        newer = self.executor.submit(lambda: 4.0, self.delivered.append, self.fail, "b")
+        release.set()
+        self.deliver(2)
+
+        self.assertIs(again, first)
+        self.assertTrue(first.cancelled)
+        assert first.future is not None
+        # stopped at the checkpoint before its second point
+        self.assertIsInstance(first.future.exception(), utils_jobs.JobCancelled)
+        self.assertTrue(newer.done)
+        self.assertEqual(self.delivered, [4.0])  # the cancelled result is dropped
+
+    def test_partial_curve_streamed(self):
+        """A stored sweep publishes the curve so far while it computes"""
+        partials = []
+        started, release = threading.Event(), threading.Event()
+
+        def solve(t, _):
+            if t > 1.0:
+                started.set()
+                release.wait(timeout=5)
+            return t
+
+        def compute():
+            return utils_sweep.CurveStore().sweep("key", solve, 1.0, 3.0, num=3)
+
+        job = self.executor.submit(
+            compute, self.delivered.append, self.fail, on_partial=partials.append
+        )
+        started.wait(timeout=5)
+        self.deliver()  # poll while the second point is computing
+        release.set()
+        assert job.future is not None
+        job.future.result(timeout=5)
+        self.deliver(2)  # the last poll stops, the result is delivered
+
+        self.assertEqual(len(partials), 1)
+        np.testing.assert_allclose(partials[0].y, [1.0])
+        np.testing.assert_allclose(self.delivered[0].y, [1.0, 2.0, 3.0])
+
+    def test_stored_result_answers_request(self):
+        """A request made before is delivered from the store, not computed"""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return np.ones(4)
+
+        self.executor.results = utils_jobs.ResultStore()
+        self.executor.submit(compute, self.delivered.append, self.fail, "a")
+        self.deliver()
+        job = self.executor.submit(compute, self.delivered.append, self.fail, "a")
+        self.deliver()
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(job.done)
+        np.testing.assert_allclose(self.delivered[1], np.ones(4))
+
+    def test_result_store_budget(self):
+        """The least recently used results are dropped beyond the budget"""
+        store = utils_jobs.ResultStore(budget=2000)
+        store.put("a", np.zeros(100))  # 800 bytes each
+        store.put("b", np.zeros(100))
+        store.get("a")
+        store.put("c", np.zeros(100))
+        store.put("huge", np.zeros(1000))  # larger than the budget
+
+        self.assertNotIn("b", store)
+        self.assertNotIn("huge", store)
+        self.assertEqual(len(store), 2)
+        self.assertLessEqual(store.nbytes, store.budget)
+
 
 if __name__ == "__main__":
     unittest.main()
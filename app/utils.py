@@ -1,8 +1,11 @@
 "General utility"
 
+import itertools
 import re
+import threading
+from weakref import WeakKeyDictionary
 
-import matplotlib.pyplot as plt
+import numpy as np
 from gnnepcsaft_mcp_server.utils import inchitosmiles, smilestoinchi
 from kivy.app import App
 
@@ -24,6 +27,23 @@ available_params = [
 
 MARKERS = ("o", "v", "s", "<", ">", "*", "^", "p", "P", "D")
 
+# Plot figures, reused in turn per kind of plot instead of building one
+# per plot. Two per kind, so a new plot is drawn on a figure other than
+# the displayed one.
+FIGURE_POOL_SIZE = 2
+_figure_pool = {}  # kind -> [figure, artists signature], least recently used first
+_layouts = {}  # texts around the axes -> `tight_layout` margins
+_plot_serials = itertools.count()
+
+# Experimental points drawn at most per dataset; the ones thinned out show
+# up as the view is zoomed in
+MAX_EXP_POINTS = 400
+_exp_points = WeakKeyDictionary()  # scatter -> full resolution (x, y)
+
+# Figures may be rendered off the UI thread, so they are changed and drawn
+# holding their lock
+_figure_locks = WeakKeyDictionary()  # figure -> lock
+
 
 def get_smiles_from_input(input_text):
     "check if input is SMILES or InChI and convert to SMILES if needed"
@@ -36,176 +56,451 @@ def get_smiles_from_input(input_text):
     return smiles
 
 
-def generate_plot(
-    x_datas, y_datas, title, x_label, y_label, legends=None, exp_data=None
-):
-    """Helper to generate plot and switch screen"""
+def title_with_note(title, *notes):
+    "append sweep adjustment notes to a plot title"
+    notes = [note for note in notes if note]
+    return f"{title}\n[{'; '.join(notes)}]" if notes else title
+
+
+def parse_grid(text, name):
+    """
+    parse a grid axis given as a value ("300"), a list of values
+    ("300,320,340") or an evenly spaced range ("300:400:11" for start,
+    stop and number of points)
+    """
+    text = text.strip()
+    try:
+        if ":" in text:
+            start, stop, num = text.split(":")
+            values = np.linspace(float(start), float(stop), int(num))
+        else:
+            values = np.array([float(v) for v in text.split(",") if v.strip()])
+    except ValueError as e:
+        raise ValueError(
+            f"{name} must be a value, comma-separated values or start:stop:num"
+        ) from e
+    if values.size == 0:
+        raise ValueError(f"{name} grid is empty")
+    return values
+
+
+def plot_series(x_datas, y_datas):
+    "`(x, y)` pairs of the lines described by `generate_plot` data"
+    if isinstance(x_datas[0], (list, np.ndarray)) and isinstance(
+        y_datas[0], (list, np.ndarray)
+    ):
+        # Multiple lines with their own x and y (e.g., Bubble/Dew curves)
+        return list(zip(x_datas, y_datas))
+    if isinstance(y_datas[0], (list, np.ndarray)):
+        # Multiple lines (e.g., Bubble/Dew points)
+        return [(x_datas, y_data) for y_data in y_datas]
+    if isinstance(x_datas[0], (list, np.ndarray)):
+        # Multiple lines (e.g., Phase diagram points)
+        return [(x_data, y_datas) for x_data in x_datas]
+    # Single line
+    return [(x_datas, y_datas)]
+
+
+def _plot_layout():
+    "layout of the plot screen"
+    app = App.get_running_app()
+    return app.root.get_screen("plot_screen").ids.plot_layout  # type: ignore
+
+
+def plot_size(x_datas):
+    "number of points of the lines or scatters described by plot data"
+    if len(x_datas) == 0:
+        return 0
+    if isinstance(x_datas[0], (list, np.ndarray)):
+        return sum(len(x_data) for x_data in x_datas)
+    return len(x_datas)
+
+
+def figure_lock(figure):
+    "lock held while a figure is changed or drawn, created on the UI thread"
+    lock = _figure_locks.get(figure)
+    if lock is None:
+        lock = _figure_locks[figure] = threading.RLock()
+    return lock
+
+
+def _displayed(figure):
+    "the displayed figure if it is `figure` (any one for None), else None"
+    displayed = _plot_layout().ids.mat_plot_figure.figure
+    if displayed is None or not displayed.axes:
+        return None
+    if figure is not None and displayed is not figure:
+        return None
+    return displayed
+
+
+def refine_plot(x_datas, y_datas, title, figure=None):
+    """
+    Replace the model lines of the displayed plot in place, keeping its
+    experimental data and styling. Returns False if the lines differ in
+    number, or if `figure` is given and no longer displayed, in which case
+    the plot must be generated again.
+    """
+    figure = _displayed(figure)
+    if figure is None:
+        return False
+    ax = figure.axes[0]
+    lines = ax.get_lines()
+    series = plot_series(x_datas, y_datas)
+    if len(lines) != len(series):
+        return False
+    with figure_lock(figure):
+        for line, (x_data, y_data) in zip(lines, series):
+            line.set_data(x_data, y_data)
+        ax.set_title(title, fontsize=10, pad=10)
+        ax.relim()
+        ax.autoscale_view()
+        figure.canvas.draw_idle()
+    return True
+
+
+def refine_ternary_plot(a, b, title, figure=None):
+    "`refine_plot` for the scatters of `generate_ternary_plot`"
+    figure = _displayed(figure)
+    if figure is None:
+        return False
+    ax = figure.axes[0]
+    series = list(zip(a, b)) if a and isinstance(a[0], list) else [(a, b)]
+    if len(ax.collections) < len(series):
+        return False
+    with figure_lock(figure):
+        for scatter, (a_val, b_val) in zip(ax.collections, series):
+            scatter.set_offsets(np.column_stack([a_val, b_val]))
+        ax.set_title(title, fontsize=10, pad=10)
+        figure.canvas.draw_idle()
+    return True
+
+
+def curve_updater(plot, refine):
+    """
+    Draw a curve that improves while it computes, e.g. a coarse preview,
+    the partial results of a sweep and the exact curve. `plot(x_datas,
+    y_datas, title)` draws it anew and returns the figure, `refine(x_datas,
+    y_datas, title, figure=figure)` moves its lines in place. Returns
+    `update((x_datas, y_datas, title), partial=False)`, which skips partial
+    data with fewer points than the displayed ones.
+    """
+    shown = {"figure": None, "label": None, "size": 0}
+
+    def update(data, partial=False):
+        size = plot_size(data[0])
+        figure = shown["figure"]
+        if partial and figure is not None and size < shown["size"]:
+            return
+        # a pooled figure relabelled since then holds another plot
+        if (
+            figure is None
+            or figure.get_label() != shown["label"]
+            or not refine(*data, figure=figure)
+        ):
+            figure = plot(*data)
+        label = None if figure is None else figure.get_label()
+        shown.update(figure=figure, label=label, size=size)
+
+    return update
+
+
+def show_figure(figure):
+    "display a figure on the plot screen, switching to it if needed"
+    app = App.get_running_app()
+    plot_layout = _plot_layout()
+
+    mat_plot_figure = plot_layout.ids.mat_plot_figure
+    mat_plot_figure.figure = figure
 
-    if not x_datas or not y_datas:
+    # a plot redrawn on the plot screen keeps the screen to go back to
+    if app.root.current == "plot_screen":  # type: ignore
         return
+    plot_layout.previous_screen = app.root.current  # type: ignore
 
-    # Optimized for mobile (390px width)
-    plt.figure(figsize=(3.5, 4.5), dpi=100)
-    plt.clf()  # Clear previous figure
+    app.root.transition.direction = "left"  # type: ignore
+    app.root.current = "plot_screen"  # type: ignore
 
-    # Reduce font sizes for mobile
-    plt.xticks(fontsize=8)
-    plt.yticks(fontsize=8)
 
-    if isinstance(y_datas[0], list):
-        # Multiple lines (e.g., Bubble/Dew points)
-        for i, y_data in enumerate(y_datas):
-            label = legends[i] if legends and i < len(legends) else None
-            plt.plot(
-                x_datas,
-                y_data,
-                marker=MARKERS[i],
-                linestyle="-",
-                markersize=4,
-                label=label,
-            )
-        if legends:
-            plt.legend(fontsize=8)
-    elif isinstance(x_datas[0], list):
-        # Multiple lines (e.g., Phase diagram points)
-        for i, x_data in enumerate(x_datas):
+def remember_plot(label, replay):
+    "add a plot to the history of the plot screen, `replay()` drawing it again"
+    _plot_layout().remember(label, replay)
+
+
+def _exp_datasets(exp_data):
+    "experimental datasets `[(x, y, label), ...]` of `generate_plot` data"
+    if not exp_data:
+        return []
+    # Check if exp_data is a list of datasets (multiple series)
+    # Structure: [(x1, y1, 'label1'), (x2, y2, 'label2')]
+    if (
+        isinstance(exp_data, list)
+        and len(exp_data) > 0
+        and isinstance(exp_data[0], (list, tuple))
+        and len(exp_data[0]) == 3
+        and not isinstance(exp_data[0][0], (int, float))
+    ):
+        return [tuple(dataset) for dataset in exp_data]
+    # Single dataset case
+    return [tuple(exp_data)]
+
+
+def detail_indices(x, y, xlim, ylim, max_points=MAX_EXP_POINTS):
+    """
+    indices of the points to draw in a view: all visible ones if there are
+    at most `max_points`, else one per occupied cell of a grid over the
+    view, so sparse points and outliers are always kept
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    x_lo, x_hi = sorted(xlim)
+    y_lo, y_hi = sorted(ylim)
+    visible = np.flatnonzero((x >= x_lo) & (x <= x_hi) & (y >= y_lo) & (y <= y_hi))
+    if visible.size <= max_points:
+        return visible
+    side = int(np.sqrt(max_points))
+    cells = []
+    for values, lo, hi in ((x[visible], x_lo, x_hi), (y[visible], y_lo, y_hi)):
+        cell = (values - lo) / ((hi - lo) or 1.0) * side
+        cells.append(np.clip(cell.astype(np.int64), 0, side - 1))
+    _, first = np.unique(cells[0] * side + cells[1], return_index=True)
+    return visible[np.sort(first)]
+
+
+def _set_exp_points(scatter, exp_x, exp_y):
+    "draw an experimental dataset, keeping large ones for `_show_exp_detail`"
+    scatter.set_offsets(np.column_stack([exp_x, exp_y]))
+    if len(exp_x) > MAX_EXP_POINTS:
+        _exp_points[scatter] = (np.asarray(exp_x), np.asarray(exp_y))
+    else:
+        _exp_points.pop(scatter, None)
+
+
+def _show_exp_detail(ax):
+    "thin the large experimental datasets to the level of detail of the view"
+    for scatter in ax.collections:
+        points = _exp_points.get(scatter)
+        if points is None:
+            continue
+        exp_x, exp_y = points
+        shown = detail_indices(exp_x, exp_y, ax.get_xlim(), ax.get_ylim())
+        scatter.set_offsets(np.column_stack([exp_x[shown], exp_y[shown]]))
+
+
+def _pooled_figure(kind, signature):
+    """
+    least recently used figure of a kind other than the displayed one, and
+    whether it already holds the artists described by `signature`
+    """
+    pool = _figure_pool.setdefault(kind, [])
+    displayed = _plot_layout().ids.mat_plot_figure.figure
+    entry = next((entry for entry in pool if entry[0] is not displayed), None)
+    if entry is None or len(pool) < FIGURE_POOL_SIZE:
+        # matplotlib is loaded with the first plot
+        from matplotlib.figure import (  # pylint: disable=import-outside-toplevel
+            Figure,
+        )
+
+        # Optimized for mobile (390px width)
+        entry = [Figure(figsize=(3.5, 4.5), dpi=100), None]
+    else:
+        pool.remove(entry)
+    pool.append(entry)
+
+    figure, previous = entry
+    with figure_lock(figure):
+        pass  # a render of the figure when last displayed is finished
+    entry[1] = signature
+    figure.set_label(f"plot {next(_plot_serials)}")  # a new plot on the figure
+    if previous != signature:
+        figure.clear()
+        return figure, False
+    # drop the patch copies the plot widget adds each time it shows the figure
+    for patch in list(figure.axes[0].patches):
+        patch.remove()
+    return figure, True
+
+
+def _apply_layout(figure, kind, x_label, y_label, title):
+    """
+    `tight_layout` margins of the figure, cached by the texts setting them:
+    axis labels, title lines and the widest y tick label
+    """
+    ax = figure.axes[0]
+    ticks = ax.yaxis.get_major_formatter().format_ticks(ax.get_yticks())
+    key = (
+        kind,
+        x_label,
+        y_label,
+        title.count("\n"),
+        max((len(tick) for tick in ticks), default=0),
+    )
+    margins = _layouts.get(key)
+    if margins is None:
+        # Increase padding to ensure labels are not cut off
+        figure.tight_layout(pad=2.5)
+        params = figure.subplotpars
+        _layouts[key] = (params.left, params.bottom, params.right, params.top)
+    else:
+        figure.subplots_adjust(*margins)
+
+
+def dispose_figures():
+    "clear the pooled plot figures and drop them with the cached layouts"
+    for pool in _figure_pool.values():
+        for figure, _ in pool:
+            figure.clear()
+    _figure_pool.clear()
+    _layouts.clear()
+
+
+def generate_plot(
+    x_datas, y_datas, title, x_label, y_label, legends=None, exp_data=None
+):
+    """
+    Helper to generate plot and switch screen, returning the figure. A
+    pooled figure holding the same kind of plot keeps its artists and only
+    gets their data replaced.
+    """
+
+    if len(x_datas) == 0 or len(y_datas) == 0:
+        return None
+
+    # NaN values (failed sweep points) split lines into their valid segments
+    series = plot_series(x_datas, y_datas)
+    single = series[0][0] is x_datas and series[0][1] is y_datas
+    legends = None if single else legends
+    exp_sets = _exp_datasets(exp_data)
+    signature = (
+        x_label,
+        y_label,
+        len(series),
+        tuple(legends or ()),
+        tuple(label for _, _, label in exp_sets),
+    )
+    figure, reuse = _pooled_figure("plot", signature)
+
+    if reuse:
+        ax = figure.axes[0]
+        for line, (x_data, y_data) in zip(ax.get_lines(), series):
+            line.set_data(x_data, y_data)
+        for scatter, (exp_x, exp_y, _) in zip(ax.collections, exp_sets):
+            _set_exp_points(scatter, exp_x, exp_y)
+        ax.set_title(title, fontsize=10, pad=10)
+        ax.relim()
+        for scatter in ax.collections:
+            ax.update_datalim(scatter.get_offsets())
+        ax.set_autoscale_on(True)  # zooming the previous plot turned it off
+        ax.autoscale_view()
+        _show_exp_detail(ax)
+    else:
+        ax = figure.add_subplot()
+        # Reduce font sizes for mobile
+        ax.tick_params(labelsize=8)
+
+        for i, (x_data, y_data) in enumerate(series):
             label = legends[i] if legends and i < len(legends) else None
-            plt.plot(
+            ax.plot(
                 x_data,
-                y_datas,
-                marker=MARKERS[i],
+                y_data,
+                marker=MARKERS[i % len(MARKERS)],
                 linestyle="-",
                 markersize=4,
                 label=label,
             )
         if legends:
-            plt.legend(fontsize=8)
-    else:
-        # Single line
-        plt.plot(x_datas, y_datas, marker="o", linestyle="-", markersize=4)
+            ax.legend(fontsize=8)
 
-    # Plot Experimental Data if available
-    if exp_data:
-        # Check if exp_data is a list of datasets (multiple series)
-        # Structure: [(x1, y1, 'label1'), (x2, y2, 'label2')]
-        if (
-            isinstance(exp_data, list)
-            and len(exp_data) > 0
-            and isinstance(exp_data[0], (list, tuple))
-            and len(exp_data[0]) == 3
-            and not isinstance(exp_data[0][0], (int, float))
-        ):
-            # Defined colors/markers for multiple exp sets if needed, or cycle
-            exp_markers = ["x", "+", "1", "2"]
-            for idx, dataset in enumerate(exp_data):
-                ex, ey, el = dataset
-                marker = exp_markers[idx % len(exp_markers)]
-                plt.scatter(
-                    ex,
-                    ey,
-                    color="black",
-                    marker=marker,
-                    s=30,
-                    linewidths=1,
-                    label=el,
-                    zorder=3,
-                )
-        else:
-            # Single dataset case
-            exp_x, exp_y, exp_lbl = exp_data
-            plt.scatter(
+        # Plot Experimental Data if available
+        # Defined colors/markers for multiple exp sets if needed, or cycle
+        exp_markers = ["x", "+", "1", "2"]
+        for idx, (exp_x, exp_y, exp_lbl) in enumerate(exp_sets):
+            scatter = ax.scatter(
                 exp_x,
                 exp_y,
                 color="black",
-                marker="x",
+                marker=exp_markers[idx % len(exp_markers)],
                 s=30,
                 linewidths=1,
                 label=exp_lbl,
                 zorder=3,
             )
-        plt.legend(fontsize=8)
-
-    plt.title(title, fontsize=10, pad=10)
-    plt.xlabel(x_label, fontsize=9)
-    plt.ylabel(y_label, fontsize=9)
-    plt.grid(True, linestyle="--", alpha=0.6)
-
-    # Increase padding to ensure labels are not cut off
-    plt.tight_layout(pad=2.5)
-
-    # Interactive Plot Logic
-    app = App.get_running_app()
-    plot_screen = app.root.get_screen("plot_screen")  # type: ignore
-    plot_layout = plot_screen.ids.plot_layout
+            _set_exp_points(scatter, exp_x, exp_y)
+        if exp_sets:
+            ax.legend(fontsize=8)
+        # large datasets follow the view as it is zoomed and panned
+        ax.callbacks.connect("xlim_changed", _show_exp_detail)
+        ax.callbacks.connect("ylim_changed", _show_exp_detail)
+        _show_exp_detail(ax)
 
-    mat_plot_figure = plot_layout.ids.mat_plot_figure
-    mat_plot_figure.figure = plt.gcf()
-
-    plot_layout.previous_screen = app.root.current  # type: ignore
+        ax.set_title(title, fontsize=10, pad=10)
+        ax.set_xlabel(x_label, fontsize=9)
+        ax.set_ylabel(y_label, fontsize=9)
+        ax.grid(True, linestyle="--", alpha=0.6)
 
-    app.root.transition.direction = "left"  # type: ignore
-    app.root.current = "plot_screen"  # type: ignore
+    _apply_layout(figure, "plot", x_label, y_label, title)
+    show_figure(figure)
+    return figure
 
 
 def generate_ternary_plot(a, b, title, a_label, b_label, legends=None, exp_data=None):
     "Helper to generate right triangle ternary plot and switch screen"
 
-    # Optimized for mobile (390px width)
-    fig = plt.figure(figsize=(3.5, 4.5), dpi=100)
-    fig.clf()  # Clear previous figure
-
-    # Reduce font sizes for mobile
-    plt.xticks(fontsize=8)
-    plt.yticks(fontsize=8)
-
-    # Right Triangle Frame
-    plt.plot([0, 1, 0, 0], [0, 0, 1, 0], "k-", linewidth=1.5)
-
-    # Plot Data
     if a and isinstance(a[0], list):
-        for a_val, b_val, l_val in zip(a, b, legends or []):
-            plt.scatter(a_val, b_val, label=l_val)
+        series = list(zip(a, b, legends or []))
     else:
-        plt.scatter(a, b)
-
-    # Plot Experimental Data
-    if exp_data:
-        exp_a, exp_b = exp_data
-        plt.scatter(
-            exp_a,
-            exp_b,
-            color="black",
-            marker="x",
-            s=30,
-            linewidths=1,
-            label="Exp. Data",
-            zorder=3,
-        )
-
-    if legends or exp_data:
-        plt.legend(fontsize=8)
-
-    plt.title(title, fontsize=10, pad=10)
-    plt.xlabel(a_label, fontsize=9)
-    plt.ylabel(b_label, fontsize=9)
-
-    plt.grid(True, linestyle="--", alpha=0.6)
-    plt.xlim(-0.1, 1.1)
-    plt.ylim(-0.1, 1.1)
-    plt.gca().set_aspect("equal", adjustable="box")
-
-    # Increase padding to ensure labels are not cut off
-    plt.tight_layout(pad=2.5)
+        series = [(a, b, None)]
+    signature = (a_label, b_label, len(series), tuple(legends or ()), bool(exp_data))
+    figure, reuse = _pooled_figure("ternary", signature)
+
+    if reuse:
+        ax = figure.axes[0]
+        for scatter, (a_val, b_val, _) in zip(ax.collections, series):
+            scatter.set_offsets(np.column_stack([a_val, b_val]))
+        if exp_data:
+            ax.collections[len(series)].set_offsets(np.column_stack(exp_data))
+        # the previous plot may have been zoomed or panned
+        ax.set_xlim(-0.1, 1.1)
+        ax.set_ylim(-0.1, 1.1)
+        ax.set_title(title, fontsize=10, pad=10)
+    else:
+        ax = figure.add_subplot()
+        # Reduce font sizes for mobile
+        ax.tick_params(labelsize=8)
+
+        # Right Triangle Frame
+        ax.plot([0, 1, 0, 0], [0, 0, 1, 0], "k-", linewidth=1.5)
+
+        # Plot Data
+        for a_val, b_val, l_val in series:
+            ax.scatter(a_val, b_val, label=l_val)
+
+        # Plot Experimental Data
+        if exp_data:
+            exp_a, exp_b = exp_data
+            ax.scatter(
+                exp_a,
+                exp_b,
+                color="black",
+                marker="x",
+                s=30,
+                linewidths=1,
+                label="Exp. Data",
+                zorder=3,
+            )
 
-    # Interactive Plot Logic
-    app = App.get_running_app()
-    plot_screen = app.root.get_screen("plot_screen")  # type: ignore
-    plot_layout = plot_screen.ids.plot_layout
+        if legends or exp_data:
+            ax.legend(fontsize=8)
 
-    mat_plot_figure = plot_layout.ids.mat_plot_figure
-    mat_plot_figure.figure = fig
+        ax.set_title(title, fontsize=10, pad=10)
+        ax.set_xlabel(a_label, fontsize=9)
+        ax.set_ylabel(b_label, fontsize=9)
 
-    plot_layout.previous_screen = app.root.current  # type: ignore
+        ax.grid(True, linestyle="--", alpha=0.6)
+        ax.set_xlim(-0.1, 1.1)
+        ax.set_ylim(-0.1, 1.1)
+        ax.set_aspect("equal", adjustable="box")
 
-    app.root.transition.direction = "left"  # type: ignore
-    app.root.current = "plot_screen"  # type: ignore
+    _apply_layout(figure, "ternary", a_label, b_label, title)
+    show_figure(figure)
+    return figure
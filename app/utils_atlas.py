@@ -0,0 +1,184 @@
+"Pre-tabulated property atlas of the compounds in the shipped datasets"
+
+import os.path as osp
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import polars as pl
+from gnnepcsaft_mcp_server.utils import smilestoinchi
+from utils_sweep import POINT_OK, SweepResult
+
+application_path = osp.dirname(osp.abspath(__file__))
+ATLAS_PATH = osp.join(application_path, "_data", "atlas")
+
+# Max relative error of an interpolated value, checked at build time
+ATLAS_TOLERANCE = 1e-3
+
+# Density grid, shared by all compounds
+ATLAS_TEMPERATURES = np.linspace(200.0, 700.0, 51)
+ATLAS_PRESSURES = np.logspace(3.0, 8.0, 26)  # Pa
+
+# Saturation grid nodes, evenly spaced in sqrt(1 - T/Tc) up to Tc
+ATLAS_SATURATION_NODES = 48
+ATLAS_SATURATION_MIN_TR = 0.35
+
+# Saturation columns, ordered as utils_pure.SATURATION_PROPERTIES,
+# interpolated in log scale
+LOG_COLUMNS = np.array([True, False, False, False])
+
+
+class _Atlas:
+    "memory-mapped atlas tables with their validated cells"
+
+    def __init__(self, path: str):
+        index = pl.read_parquet(osp.join(path, "index.parquet"))
+        self.rows: Dict[str, Tuple[int, float, float]] = {
+            inchi: (row, t_min, tc)
+            for inchi, row, t_min, tc in index.select(
+                "inchi1", "row", "t_sat_min", "tc"
+            ).iter_rows()
+        }
+        self.density = np.load(osp.join(path, "density.npy"), mmap_mode="r")
+        self.density_valid = np.load(osp.join(path, "density_valid.npy"), mmap_mode="r")
+        self.saturation = np.load(osp.join(path, "saturation.npy"), mmap_mode="r")
+        self.saturation_valid = np.load(
+            osp.join(path, "saturation_valid.npy"), mmap_mode="r"
+        )
+
+
+@lru_cache(maxsize=1)
+def _atlas() -> Optional[_Atlas]:
+    "the shipped atlas, or None when it was not generated for this build"
+    if not osp.exists(osp.join(ATLAS_PATH, "index.parquet")):
+        return None
+    return _Atlas(ATLAS_PATH)
+
+
+@lru_cache(maxsize=128)
+def _atlas_row(smiles: str) -> Optional[Tuple[int, float, float]]:
+    "atlas row `(row, t_sat_min, tc)` of a compound, if tabulated"
+    atlas = _atlas()
+    if atlas is None:
+        return None
+    return atlas.rows.get(smilestoinchi(smiles))
+
+
+def saturation_nodes(t_min: float, tc: float) -> np.ndarray:
+    "saturation grid coordinate sqrt(1 - T/Tc) of the nodes, from t_min to Tc"
+    return np.linspace(np.sqrt(1.0 - t_min / tc), 0.0, ATLAS_SATURATION_NODES)
+
+
+def cubic_interpolation(nodes: np.ndarray, values: np.ndarray, x: np.ndarray):
+    """
+    Cubic Hermite interpolation of `values` (nodes along the first axis) at
+    `x`, with finite-difference slopes. Nodes must be monotonic.
+    """
+    if nodes[0] > nodes[-1]:
+        nodes, values = nodes[::-1], values[::-1]
+    values = np.asarray(values, dtype=np.float64)
+    slopes = np.gradient(values, nodes, axis=0)
+    i = np.clip(np.searchsorted(nodes, x, side="right") - 1, 0, len(nodes) - 2)
+    h = nodes[i + 1] - nodes[i]
+    t = ((x - nodes[i]) / h).reshape((-1,) + (1,) * (values.ndim - 1))
+    h = h.reshape(t.shape)
+    return (
+        (2 * t**3 - 3 * t**2 + 1) * values[i]
+        + (t**3 - 2 * t**2 + t) * h * slopes[i]
+        + (-2 * t**3 + 3 * t**2) * values[i + 1]
+        + (t**3 - t**2) * h * slopes[i + 1]
+    )
+
+
+def interpolate_density(
+    table: np.ndarray, pressure: float, temperatures: np.ndarray
+) -> np.ndarray:
+    "density isobar from a `(pressure, temperature)` atlas table"
+    # along log pressure at every temperature node, then along temperature
+    log_p = np.log(ATLAS_PRESSURES)
+    isobar = cubic_interpolation(log_p, table, np.array([np.log(pressure)]))[0]
+    return cubic_interpolation(ATLAS_TEMPERATURES, isobar, temperatures)
+
+
+def interpolate_saturation(
+    table: np.ndarray, t_min: float, tc: float, temperatures: np.ndarray
+) -> np.ndarray:
+    "saturation properties from a `(node, property)` atlas table"
+    table = np.array(table, dtype=np.float64)
+    table[:, LOG_COLUMNS] = np.log(table[:, LOG_COLUMNS])
+    y = cubic_interpolation(
+        saturation_nodes(t_min, tc), table, np.sqrt(1.0 - temperatures / tc)
+    )
+    y[:, LOG_COLUMNS] = np.exp(y[:, LOG_COLUMNS])
+    return y
+
+
+def _cells(nodes: np.ndarray, lo: float, hi: float) -> Optional[np.ndarray]:
+    "indices of the grid cells covering `[lo, hi]`, None outside the grid"
+    if nodes[0] > nodes[-1]:
+        cells = _cells(nodes[::-1], lo, hi)
+        return None if cells is None else len(nodes) - 2 - cells
+    if lo < nodes[0] or hi > nodes[-1]:
+        return None
+    first = min(int(np.searchsorted(nodes, lo, side="right")) - 1, len(nodes) - 2)
+    last = min(int(np.searchsorted(nodes, hi, side="left")), len(nodes) - 1)
+    return np.arange(first, max(last, first + 1))
+
+
+def _result(x: np.ndarray, y: np.ndarray) -> SweepResult:
+    "interpolated points as a fully converged sweep"
+    return SweepResult(
+        x, y, np.ones(len(x), dtype=bool), np.full(len(x), POINT_OK, dtype=np.int8)
+    )
+
+
+def atlas_density(
+    smiles: str, min_temp: float, max_temp: float, pressure: float, num: int = 10
+) -> Optional[SweepResult]:
+    """
+    Liquid density isobar interpolated from the atlas, or None when the
+    compound or the range is not tabulated within `ATLAS_TOLERANCE`
+    """
+    row = _atlas_row(smiles)
+    log_p = np.log(ATLAS_PRESSURES)
+    t_cells = _cells(ATLAS_TEMPERATURES, min_temp, max_temp)
+    p_cells = _cells(log_p, np.log(pressure), np.log(pressure))
+    if row is None or t_cells is None or p_cells is None:
+        return None
+    atlas = _atlas()
+    assert atlas is not None
+    if not np.all(atlas.density_valid[row[0]][p_cells[0], t_cells]):
+        return None
+    temperatures = np.linspace(min_temp, max_temp, num)
+    return _result(
+        temperatures,
+        interpolate_density(atlas.density[row[0]], pressure, temperatures),
+    )
+
+
+def atlas_saturation(
+    smiles: str, min_temp: float, max_temp: float, num: int = 10
+) -> Optional[SweepResult]:
+    """
+    Saturation properties interpolated from the atlas, columns ordered as
+    `SATURATION_PROPERTIES`, or None when the compound or the range is not
+    tabulated within `ATLAS_TOLERANCE`
+    """
+    row = _atlas_row(smiles)
+    if row is None:
+        return None
+    index, t_min, tc = row
+    nodes = saturation_nodes(t_min, tc)
+    if max_temp > tc:
+        return None
+    s_lo, s_hi = np.sqrt(1.0 - max_temp / tc), np.sqrt(1.0 - min_temp / tc)
+    cells = _cells(nodes, s_lo, s_hi)
+    atlas = _atlas()
+    assert atlas is not None
+    if cells is None or not np.all(atlas.saturation_valid[index][cells]):
+        return None
+    temperatures = np.linspace(min_temp, max_temp, num)
+    return _result(
+        temperatures,
+        interpolate_saturation(atlas.saturation[index], t_min, tc, temperatures),
+    )
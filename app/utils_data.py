@@ -182,6 +182,218 @@ def retrieve_bubble_pressure_data(smiles_list: list, x1: float):
     return filtered.select("T_K", "BP_kPa").sort("T_K").to_numpy()
 
 
+def retrieve_st_binary_data(smiles_list: list, x1: float):
+    "retrieve binary surface tension (N/m) data (st-T at constant x)"
+    if len(smiles_list) != 2:
+        return None
+
+    path = osp.join(application_path, "_data", "st_binary.parquet")
+    if not osp.exists(path):
+        return None
+
+    df = pl.read_parquet(path)
+    i1, i2 = smilestoinchi(smiles_list[0]), smilestoinchi(smiles_list[1])
+
+    tol_x = 0.01
+
+    filtered = (
+        df.filter(
+            ((pl.col("inchi1") == i1) & (pl.col("inchi2") == i2))
+            | ((pl.col("inchi1") == i2) & (pl.col("inchi2") == i1))
+        )
+        .with_columns(
+            pl.when(pl.col("inchi1") == i1)
+            .then(pl.col("mole_fraction_c1"))
+            .otherwise(pl.col("mole_fraction_c2"))
+            .alias("x_c1")
+        )
+        .filter((pl.col("x_c1") > x1 - tol_x) & (pl.col("x_c1") < x1 + tol_x))
+    )
+
+    if filtered.height == 0:
+        return None
+
+    return filtered.select("T_K", "st").sort("T_K").to_numpy()
+
+
+def retrieve_st_binary_x_data(smiles_list: list, temperature: float):
+    "retrieve binary surface tension (N/m) data (st-x at constant T)"
+    if len(smiles_list) != 2:
+        return None
+
+    path = osp.join(application_path, "_data", "st_binary.parquet")
+    if not osp.exists(path):
+        return None
+
+    df = pl.read_parquet(path)
+    i1, i2 = smilestoinchi(smiles_list[0]), smilestoinchi(smiles_list[1])
+
+    tol_t = 0.5  # Tolerance for temperature
+
+    filtered = df.filter(
+        ((pl.col("inchi1") == i1) & (pl.col("inchi2") == i2))
+        | ((pl.col("inchi1") == i2) & (pl.col("inchi2") == i1))
+    ).filter(
+        (pl.col("T_K") > temperature - tol_t) & (pl.col("T_K") < temperature + tol_t)
+    )
+
+    if filtered.height == 0:
+        return None
+
+    # Normalize x1 to strictly match input order
+    return (
+        filtered.with_columns(
+            pl.when(pl.col("inchi1") == i1)
+            .then(pl.col("mole_fraction_c1"))
+            .otherwise(pl.col("mole_fraction_c2"))
+            .alias("x_c1"),
+        )
+        .select("x_c1", "st")
+        .sort("x_c1")
+        .to_numpy()
+    )
+
+
+def retrieve_gamma_binary_data(smiles_list: list, temperature: float):
+    "retrieve binary activity coefficient data (x1, gamma1, gamma2) at constant T"
+    if len(smiles_list) != 2:
+        return None
+
+    path = osp.join(application_path, "_data", "gamma_binary.parquet")
+    if not osp.exists(path):
+        return None
+
+    df = pl.read_parquet(path)
+    i1, i2 = smilestoinchi(smiles_list[0]), smilestoinchi(smiles_list[1])
+
+    tol_t = 0.5  # Tolerance for temperature
+
+    filtered = df.filter(
+        ((pl.col("inchi1") == i1) & (pl.col("inchi2") == i2))
+        | ((pl.col("inchi1") == i2) & (pl.col("inchi2") == i1))
+    ).filter(
+        (pl.col("T_K") > temperature - tol_t) & (pl.col("T_K") < temperature + tol_t)
+    )
+
+    if filtered.height == 0:
+        return None
+
+    # Normalize x1, m1 and m2 to strictly match input order
+    is_input_order = pl.col("inchi1") == i1
+    return (
+        filtered.with_columns(
+            pl.when(is_input_order)
+            .then(pl.col("mole_fraction_c1"))
+            .otherwise(pl.col("mole_fraction_c2"))
+            .alias("x_c1"),
+            pl.when(is_input_order)
+            .then(pl.col("m1"))
+            .otherwise(pl.col("m2"))
+            .alias("gamma1"),
+            pl.when(is_input_order)
+            .then(pl.col("m2"))
+            .otherwise(pl.col("m1"))
+            .alias("gamma2"),
+        )
+        .select("x_c1", "gamma1", "gamma2")
+        .sort("x_c1")
+        .to_numpy()
+    )
+
+
+def retrieve_gamma_inf_binary_data(smiles_list: list, temp_min: float, temp_max: float):
+    """
+    retrieve binary infinite dilution activity coefficient data
+    `([T, gamma1_inf], [T, gamma2_inf])` of component 1 diluted in 2 and of
+    2 diluted in 1, in input order
+    """
+    if len(smiles_list) != 2:
+        return None
+
+    path = osp.join(application_path, "_data", "gamma_binary.parquet")
+    if not osp.exists(path):
+        return None
+
+    df = pl.read_parquet(path)
+    i1, i2 = smilestoinchi(smiles_list[0]), smilestoinchi(smiles_list[1])
+
+    filtered = df.filter(
+        ((pl.col("inchi1") == i1) & (pl.col("inchi2") == i2))
+        | ((pl.col("inchi1") == i2) & (pl.col("inchi2") == i1)),
+        pl.col("T_K") >= temp_min,
+        pl.col("T_K") <= temp_max,
+    )
+
+    # Normalize x1, m1 and m2 to strictly match input order: x1 = 0 rows
+    # then hold gamma_inf of component 1, x1 = 1 rows of component 2
+    is_input_order = pl.col("inchi1") == i1
+    normalized = filtered.with_columns(
+        pl.when(is_input_order)
+        .then(pl.col("mole_fraction_c1"))
+        .otherwise(pl.col("mole_fraction_c2"))
+        .alias("x_c1"),
+        pl.when(is_input_order)
+        .then(pl.col("m1"))
+        .otherwise(pl.col("m2"))
+        .alias("gamma1"),
+        pl.when(is_input_order)
+        .then(pl.col("m2"))
+        .otherwise(pl.col("m1"))
+        .alias("gamma2"),
+    )
+    gamma1_inf, gamma2_inf = (
+        normalized.filter(pl.col("x_c1") == x_c1)
+        .select("T_K", gamma)
+        .drop_nulls()
+        .sort("T_K")
+        .to_numpy()
+        for x_c1, gamma in ((0.0, "gamma1"), (1.0, "gamma2"))
+    )
+
+    if len(gamma1_inf) == 0 and len(gamma2_inf) == 0:
+        return None
+
+    return gamma1_inf, gamma2_inf
+
+
+def retrieve_e_h_binary_data(smiles_list: list, temperature: float):
+    "retrieve binary excess enthalpy (kJ/mol) data (x1, e_h) at constant T"
+    if len(smiles_list) != 2:
+        return None
+
+    path = osp.join(application_path, "_data", "e_h_binary.parquet")
+    if not osp.exists(path):
+        return None
+
+    df = pl.read_parquet(path)
+    i1, i2 = smilestoinchi(smiles_list[0]), smilestoinchi(smiles_list[1])
+
+    tol_t = 0.5  # Tolerance for temperature
+
+    filtered = df.filter(
+        ((pl.col("inchi1") == i1) & (pl.col("inchi2") == i2))
+        | ((pl.col("inchi1") == i2) & (pl.col("inchi2") == i1))
+    ).filter(
+        (pl.col("T_K") > temperature - tol_t) & (pl.col("T_K") < temperature + tol_t)
+    )
+
+    if filtered.height == 0:
+        return None
+
+    # Normalize x1 to strictly match input order
+    return (
+        filtered.with_columns(
+            pl.when(pl.col("inchi1") == i1)
+            .then(pl.col("mole_fraction_c1"))
+            .otherwise(pl.col("mole_fraction_c2"))
+            .alias("x_c1"),
+        )
+        .select("x_c1", "e_h")
+        .sort("x_c1")
+        .to_numpy()
+    )
+
+
 def retrieve_vle_binary_data(smiles_list: list, pressure: float):
     """
     retrieve binary VLE data (T-x-y). Currently, only for mixtures with CO2 for
@@ -707,3 +919,122 @@ def retrieve_vle_ternary_data(smiles_list: list, pressure: float, temperature: f
         .select("x_m1", "x_m2")
         .to_numpy()
     )
+
+
+def retrieve_st_ternary_data(smiles_list: list, x1: float, x2: float):
+    "retrieve ternary surface tension (N/m) data (st-T at constant x)"
+    if len(smiles_list) != 3:
+        return None
+
+    path_st = osp.join(application_path, "_data", "st_ternary.parquet")
+    if not osp.exists(path_st):
+        return None
+
+    i1, i2, i3 = (
+        smilestoinchi(smiles_list[0]),
+        smilestoinchi(smiles_list[1]),
+        smilestoinchi(smiles_list[2]),
+    )
+    target_set = [i1, i2, i3]
+
+    df = pl.read_parquet(path_st)
+
+    # Function to map column X based on inchi match
+    def get_col_map(target_inchi, col_prefix):
+        return (
+            pl.when(pl.col("inchi1") == target_inchi)
+            .then(pl.col(f"{col_prefix}1"))
+            .otherwise(
+                pl.when(pl.col("inchi2") == target_inchi)
+                .then(pl.col(f"{col_prefix}2"))
+                .otherwise(pl.col(f"{col_prefix}3"))
+            )
+        )
+
+    tol_x = 0.01
+
+    filtered = (
+        df.filter(
+            pl.col("inchi1").is_in(target_set)
+            & pl.col("inchi2").is_in(target_set)
+            & pl.col("inchi3").is_in(target_set)
+        )
+        .with_columns(
+            [
+                get_col_map(i1, "mole_fraction_c").alias("x_m1"),
+                get_col_map(i2, "mole_fraction_c").alias("x_m2"),
+            ]
+        )
+        .filter(
+            (pl.col("x_m1").is_between(x1 - tol_x, x1 + tol_x))
+            & (pl.col("x_m2").is_between(x2 - tol_x, x2 + tol_x))
+        )
+    )
+
+    if filtered.height == 0:
+        return None
+
+    return filtered.select("T_K", "st").sort("T_K").to_numpy()
+
+
+def retrieve_e_h_ternary_data(smiles_list: list, temperature: float, x2_ratio: float):
+    """
+    retrieve ternary excess enthalpy (kJ/mol) data (x1, e_h) at constant T,
+    on the section with constant x2 / (x2 + x3)
+    """
+    if len(smiles_list) != 3:
+        return None
+
+    path_e_h = osp.join(application_path, "_data", "e_h_ternary.parquet")
+    if not osp.exists(path_e_h):
+        return None
+
+    i1, i2, i3 = (
+        smilestoinchi(smiles_list[0]),
+        smilestoinchi(smiles_list[1]),
+        smilestoinchi(smiles_list[2]),
+    )
+    target_set = [i1, i2, i3]
+
+    df = pl.read_parquet(path_e_h)
+
+    # Function to map column X based on inchi match
+    def get_col_map(target_inchi, col_prefix):
+        return (
+            pl.when(pl.col("inchi1") == target_inchi)
+            .then(pl.col(f"{col_prefix}1"))
+            .otherwise(
+                pl.when(pl.col("inchi2") == target_inchi)
+                .then(pl.col(f"{col_prefix}2"))
+                .otherwise(pl.col(f"{col_prefix}3"))
+            )
+        )
+
+    tol_t = 0.5
+    tol_x = 0.02
+
+    filtered = (
+        df.filter(
+            pl.col("inchi1").is_in(target_set)
+            & pl.col("inchi2").is_in(target_set)
+            & pl.col("inchi3").is_in(target_set)
+        )
+        .filter(pl.col("T_K").is_between(temperature - tol_t, temperature + tol_t))
+        .with_columns(
+            [
+                get_col_map(i1, "mole_fraction_c").alias("x_m1"),
+                get_col_map(i2, "mole_fraction_c").alias("x_m2"),
+                get_col_map(i3, "mole_fraction_c").alias("x_m3"),
+            ]
+        )
+        .filter(
+            (pl.col("x_m2") / (pl.col("x_m2") + pl.col("x_m3"))).is_between(
+                x2_ratio - tol_x, x2_ratio + tol_x
+            )
+        )
+    )
+
+    if filtered.height == 0:
+        return None
+
+    return filtered.select("x_m1", "e_h").sort("x_m1").to_numpy()
@@ -0,0 +1,274 @@
+"Background jobs running the computations of the UI handlers"
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+import numpy as np
+
+# Worker threads shared by the jobs of a screen. Threads rather than
+# processes, as for the condition families, since mobile builds cannot
+# spawn worker processes.
+JOB_WORKERS = min(2, os.cpu_count() or 1)
+
+# Seconds between the polls of the partial results of a job
+STREAM_INTERVAL = 0.25
+
+# Bytes of computed results kept for the session, so a request made
+# before is answered without computing it again
+RESULT_BUDGET = 64 * 1024 * 1024
+
+
+class JobCancelled(Exception):
+    "raised in the solver loops of a job cancelled by a newer request"
+
+
+class Job:
+    "a computation running in the background, with the progress of its sweeps"
+
+    def __init__(self, compute: Callable[[], Any], key: Optional[Hashable] = None):
+        self.compute = compute
+        self.key = key  # identity of the request, to merge repeated ones
+        self.progress = 0.0  # fraction of the sweep points done
+        self.partial: Any = None  # latest partial result, e.g. a curve so far
+        self.published = 0  # number of partial results published
+        self.future: Optional[Future] = None
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        "stop the job at its next checkpoint and drop its result"
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        "whether the job was cancelled"
+        return self._cancelled.is_set()
+
+    @property
+    def done(self) -> bool:
+        "whether the computation finished, successfully or not"
+        return self.future is not None and self.future.done()
+
+    @property
+    def in_flight(self) -> bool:
+        "whether the job is still computing a result to deliver"
+        return not self.done and not self.cancelled
+
+    def part(self) -> "Job":
+        "a part of the job run on another thread, cancelled with it"
+        part = Job(self.compute, self.key)
+        part._cancelled = self._cancelled  # pylint: disable=protected-access
+        return part
+
+
+_current_job: ContextVar[Optional[Job]] = ContextVar("current_job", default=None)
+
+
+def checkpoint(done: int = 0, total: int = 0):
+    """
+    report the progress of the job running in this thread, if any, and
+    stop it with JobCancelled if it was cancelled. Solver loops call it
+    between state points; without a total only the cancellation is checked.
+    """
+    job = _current_job.get()
+    if job is None:
+        return
+    if job.cancelled:
+        raise JobCancelled()
+    if total > 0:
+        job.progress = min(done / total, 1.0)
+
+
+def publish(partial: Any):
+    """
+    hand a partial result of the job running in this thread, if any, to
+    the UI, e.g. the points of a curve converged so far. Only the latest
+    partial result is kept.
+    """
+    job = _current_job.get()
+    if job is None:
+        return
+    job.partial = partial
+    job.published += 1
+
+
+def job_part(compute: Callable) -> Callable:
+    """
+    `compute` running on another thread as a part of the current job:
+    its checkpoints stop it with the job, without reporting progress or
+    partial results
+    """
+    job = _current_job.get()
+    if job is None:
+        return compute
+    part = job.part()
+
+    def _compute(*args):
+        token = _current_job.set(part)
+        try:
+            return compute(*args)
+        finally:
+            _current_job.reset(token)
+
+    return _compute
+
+
+def _run(job: Job) -> Any:
+    "run a job as the current job of the sweeps it calls"
+    token = _current_job.set(job)
+    try:
+        return job.compute()
+    finally:
+        _current_job.reset(token)
+
+
+def result_nbytes(result: Any) -> int:
+    "approximate memory held by a result: its arrays, containers and scalars"
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    if isinstance(result, (tuple, list)):
+        return sys.getsizeof(result) + sum(result_nbytes(item) for item in result)
+    if isinstance(result, dict):
+        return sys.getsizeof(result) + sum(
+            result_nbytes(key) + result_nbytes(value) for key, value in result.items()
+        )
+    return sys.getsizeof(result)
+
+
+class ResultStore:
+    """
+    Results of the session by the key of their request, within `budget`
+    bytes. The least recently used are dropped first; a result larger
+    than the budget is not kept.
+    """
+
+    def __init__(self, budget: int = RESULT_BUDGET):
+        self.budget = budget
+        self.nbytes = 0
+        self._results: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._results
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, key: Hashable) -> Any:
+        "result stored for a request, as the most recently used"
+        self._results.move_to_end(key)
+        return self._results[key][0]
+
+    def put(self, key: Hashable, result: Any):
+        "store the result of a request, dropping the oldest beyond the budget"
+        if key in self._results:
+            self.nbytes -= self._results.pop(key)[1]
+        nbytes = result_nbytes(result)
+        if nbytes > self.budget:
+            return
+        self._results[key] = (result, nbytes)
+        self.nbytes += nbytes
+        while self.nbytes > self.budget:
+            self.nbytes -= self._results.popitem(last=False)[1][1]
+
+    def clear(self):
+        "drop all stored results"
+        self._results.clear()
+        self.nbytes = 0
+
+
+class JobExecutor:
+    """
+    Runs the computations of a screen on worker threads and hands their
+    result or error back through `schedule` (`Clock.schedule_once` in the
+    app), so the callbacks run on the UI thread. Only the latest request
+    of the screen is kept: a repeated request in flight is merged into
+    it, any other cancels it. With a `ResultStore`, the results are kept
+    by key and a request made before is answered from it.
+    """
+
+    def __init__(
+        self,
+        schedule: Callable[..., Any],
+        max_workers: int = JOB_WORKERS,
+        results: Optional[ResultStore] = None,
+    ):
+        self._schedule = schedule
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix="job")
+        self._latest: Optional[Job] = None
+        self.results = results
+
+    def computing(self, key: Hashable) -> bool:
+        "whether the request with this key is in flight"
+        latest = self._latest
+        return latest is not None and latest.in_flight and latest.key == key
+
+    def submit(
+        self,
+        compute: Callable[[], Any],
+        on_done: Callable[[Any], Any],
+        on_error: Callable[[Exception], Any],
+        key: Optional[Hashable] = None,
+        on_partial: Optional[Callable[[Any], Any]] = None,
+    ) -> Job:
+        """
+        run `compute()` in the background, then `on_done(result)` or
+        `on_error(e)`. While it computes, `on_partial(partial)` gets the
+        latest result it published every `STREAM_INTERVAL` seconds.
+        """
+        latest = self._latest
+        if latest is not None and latest.in_flight:
+            if key is not None and key == latest.key:
+                return latest  # the same request is already computing
+            latest.cancel()
+        job = Job(compute, key)
+        self._latest = job
+        results = self.results if key is not None else None
+
+        def _deliver(future: Future):
+            if job.cancelled:
+                return  # outdated by a newer request
+            error = future.exception()
+            if error is None:
+                if results is not None:
+                    results.put(key, future.result())
+                on_done(future.result())
+            else:
+                on_error(error)  # type: ignore
+
+        if results is not None and key in results:
+            # answered from the session results, delivered on the next frame
+            job.future = Future()
+            job.future.set_result(results.get(key))
+            job.progress = 1.0
+            on_partial = None
+        else:
+            job.future = self._pool.submit(_run, job)
+        job.future.add_done_callback(
+            lambda future: self._schedule(lambda _dt: _deliver(future))
+        )
+        if on_partial is not None:
+            self._stream(job, on_partial)
+        return job
+
+    def _stream(self, job: Job, on_partial: Callable[[Any], Any]):
+        "poll the partial results of a job until it is done or cancelled"
+        seen = 0
+
+        def _poll(_dt):
+            nonlocal seen
+            if not job.in_flight:
+                return  # the result or nothing is delivered instead
+            if job.published != seen:
+                seen = job.published
+                on_partial(job.partial)
+            self._schedule(_poll, STREAM_INTERVAL)
+
+        self._schedule(_poll, STREAM_INTERVAL)
+
+
+# results of the requests of both screens, sharing the budget
+session_results = ResultStore()
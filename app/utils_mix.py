@@ -1,76 +1,611 @@
 "Mixture screen utilities"
 
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
 
 import numpy as np
+import si_units as si
+from feos import BinaryRecord  # pyright: ignore[reportAttributeAccessIssue]
+from feos import Contributions  # pyright: ignore[reportAttributeAccessIssue]
+from feos import (
+    HelmholtzEnergyFunctional,  # pyright: ignore[reportAttributeAccessIssue]
+)
+from feos import Identifier  # pyright: ignore[reportAttributeAccessIssue]
+from feos import IdentifierOption  # pyright: ignore[reportAttributeAccessIssue]
+from feos import Parameters  # pyright: ignore[reportAttributeAccessIssue]
+from feos import PhaseDiagram  # pyright: ignore[reportAttributeAccessIssue]
+from feos import PhaseEquilibrium  # pyright: ignore[reportAttributeAccessIssue]
+from feos import PlanarInterface  # pyright: ignore[reportAttributeAccessIssue]
+from feos import State  # pyright: ignore[reportAttributeAccessIssue]
 from gnnepcsaft.pcsaft.pcsaft_feos import (
-    mix_den_feos,
+    get_records,
     mix_lle_diagram_feos,
     mix_lle_feos,
     mix_vle_diagram_feos,
     mix_vle_pxy_diagram_feos,
-    mix_vp_feos,
+    pc_saft_mixture,
 )
 from gnnepcsaft_mcp_server.utils import predict_pcsaft_parameters
+from utils_jobs import checkpoint, publish
+from utils_pure import (
+    INTERFACE_GRID,
+    INTERFACE_WIDTH,
+    pure_critical_point,
+    state_properties,
+)
+from utils_sweep import (
+    POINT_OK,
+    CurveStore,
+    GridResult,
+    SweepResult,
+    continuation_sweep,
+    grid_sweep,
+)
+
+# Computed curves keyed by (property, system, fixed conditions)
+_curve_store = CurveStore()
+
+# J/(mol K)
+GAS_CONSTANT = 8.314462618
+# Compressibility factor below which a state is taken as liquid; liquids
+# far from the critical point are well under it, vapors near 1
+LIQUID_MAX_Z = 0.3
+
+
+def _stable_state(eos, temperature, pressure, composition, density=None):
+    """
+    State of the stable phase at `temperature` (K) and `pressure` (Pa).
+
+    The solver is warm-started from `density` (mol/m³), if any; the root
+    is kept only when stable, as past a phase boundary it may stay on the
+    metastable branch, and the state is solved cold otherwise.
+    """
+    temperature = temperature * si.KELVIN
+    pressure = pressure * si.PASCAL
+    if density is not None:
+        try:
+            state = State(
+                eos,
+                temperature=temperature,
+                pressure=pressure,
+                composition=composition,
+                density_initialization=density * si.MOL / si.METER**3,
+            )
+            if state.is_stable():
+                return state
+        except RuntimeError:
+            pass
+    # without an initialization feos picks the stable root
+    return State(
+        eos,
+        temperature=temperature,
+        pressure=pressure,
+        composition=composition,
+        density_initialization=None,
+    )
 
 
-def mix_den(
+def mix_den(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     smiles_list: List[str],
     mole_fractions: List[float],
     kij_matrix: List[List[float]],
     min_temp: float,
     max_temp: float,
     pressure: float,
-) -> Tuple[List[float], List[float]]:
+    num: int = 10,
+) -> SweepResult:
     "Calculate mixture density using PC-SAFT EOS"
+    eos = _mixture_eos(tuple(smiles_list), _kij_key(kij_matrix))
+    composition = np.asarray(mole_fractions, dtype=np.float64) * si.MOL
+
+    def _solve(temperature, rho_guess):
+        state = _stable_state(eos, temperature, pressure, composition, rho_guess)
+        return state.density / (si.MOL / si.METER**3)
+
+    key = (
+        "density",
+        tuple(smiles_list),
+        tuple(mole_fractions),
+        _kij_key(kij_matrix),
+        pressure,
+    )
+    return _curve_store.sweep(key, _solve, min_temp, max_temp, num=num)
+
+
+def mix_den_grid(
+    smiles_list: List[str],
+    kij_matrix: List[List[float]],
+    fractions: Sequence[Sequence[float]],
+    pressures: Sequence[float],
+    temperatures: Sequence[float],
+) -> GridResult:
+    """
+    Calculate mixture density (mol/m³) on a composition, pressure and
+    temperature grid using PC-SAFT EOS.
+
+    `fractions` holds the grid axis of the first n - 1 mole fractions; the
+    last one is the remainder, and points where it is negative are
+    invalid. The grid dims are `("x1", ..., "P", "T")`, so each isobar
+    line is warm-started along temperature; every point keeps the stable
+    phase, as `mix_den` does.
+    """
+    n = len(smiles_list)
+    if len(fractions) != n - 1:
+        raise ValueError(f"Expected {n - 1} mole fraction axes, got {len(fractions)}")
+    eos = _mixture_eos(tuple(smiles_list), _kij_key(kij_matrix))
+    x_dims = [f"x{i + 1}" for i in range(n - 1)]
+
+    def _solve(point, rho_guess):
+        mole_fractions = [point[dim] for dim in x_dims]
+        mole_fractions.append(1.0 - sum(mole_fractions))
+        if min(mole_fractions) < 0.0:
+            raise ValueError("Mole fractions must sum to at most 1")
+        state = _stable_state(
+            eos,
+            point["T"],
+            point["P"],
+            np.asarray(mole_fractions, dtype=np.float64) * si.MOL,
+            rho_guess,
+        )
+        return state.density / (si.MOL / si.METER**3)
+
+    coords = dict(zip(x_dims, fractions))
+    coords["P"] = pressures
+    coords["T"] = temperatures
+    return grid_sweep(_solve, coords)
+
+
+def mix_properties(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    smiles_list: List[str],
+    mole_fractions: List[float],
+    kij_matrix: List[List[float]],
+    min_temp: float,
+    max_temp: float,
+    pressure: float,
+    num: int = 10,
+) -> SweepResult:
+    """
+    Calculate mixture state properties along an isobar using PC-SAFT EOS.
+
+    Each state is built once from the cached EoS, warm-started from the
+    previous density while it stays the stable phase, and all
+    `STATE_PROPERTIES` are taken from it.
+    """
+    eos = _mixture_eos(tuple(smiles_list), _kij_key(kij_matrix))
+    composition = np.asarray(mole_fractions, dtype=np.float64) * si.MOL
+
+    def _solve(temperature, guess):
+        # the stable phase, as for `mix_den`
+        state = _stable_state(
+            eos,
+            temperature,
+            pressure,
+            composition,
+            None if guess is None else guess[0],
+        )
+        return state_properties(state)
+
+    key = (
+        "properties",
+        tuple(smiles_list),
+        tuple(mole_fractions),
+        _kij_key(kij_matrix),
+        pressure,
+    )
+    return _curve_store.sweep(key, _solve, min_temp, max_temp, num=num)
+
+
+def _envelope_line(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    line, eos, composition: np.ndarray, kind: str, critical_point, npoints: int
+) -> SweepResult:
+    """
+    Pressures (Pa) over temperatures (K) of a bubble or dew (`kind`) line
+    traced by feos. A line stopping short of the mixture critical point
+    `(Tc, Pc)` is continued up to it with one `kind` point solve per
+    temperature, warm-started from the last converged point, on a grid
+    evenly spaced in sqrt(Tc - T) so it is denser towards Tc. Points
+    failing there, or landing on the other line past the critical point,
+    are masked, and the line closes at the critical point.
+    """
+    data = line.to_dict(Contributions.Residual)
+    traced = SweepResult(
+        np.asarray(data["temperature"], dtype=np.float64),
+        np.asarray(data["pressure"], dtype=np.float64),
+        np.ones(len(data["temperature"]), dtype=bool),
+        np.full(len(data["temperature"]), POINT_OK, dtype=np.int8),
+    )
+    if critical_point is None or len(traced.x) == 0:
+        return traced
+    tc, pc = critical_point
+    if tc - traced.x[-1] <= 1e-6 * tc:
+        return traced
+
+    last_vle = {"vle": line.states[-1]}
+
+    def _solve(temperature, guess):
+        if temperature >= tc:
+            return pc
+        previous = None if guess is None else last_vle["vle"]
+        tp_init = None if previous is None else previous.liquid.pressure()
+        if kind == "bubble":
+            vle = PhaseEquilibrium.bubble_point(
+                eos,
+                temperature * si.KELVIN,
+                composition,
+                tp_init=tp_init,
+                vapor_molefracs=None if previous is None else previous.vapor.molefracs,
+            )
+        else:
+            vle = PhaseEquilibrium.dew_point(
+                eos,
+                temperature * si.KELVIN,
+                composition,
+                tp_init=tp_init,
+                liquid_molefracs=(
+                    None if previous is None else previous.liquid.molefracs
+                ),
+            )
+        if vle.liquid.density < vle.vapor.density:
+            # close to Tc the solver can land on the other line
+            raise ValueError(f"The {kind} point solve crossed the critical point")
+        last_vle["vle"] = vle
+        return vle.liquid.pressure() / si.PASCAL
+
+    num = max(npoints - len(traced.x), 2) + 1
+    grid = tc - (tc - traced.x[-1]) * np.linspace(1.0, 0.0, num) ** 2
+    continued = continuation_sweep(
+        _solve, grid[1:].tolist(), initial_guess=traced.y[-1]
+    )
+    return SweepResult(*(np.concatenate([a, b]) for a, b in zip(traced, continued)))
+
+
+def mix_vp(
+    smiles_list: List[str],
+    mole_fractions: List[float],
+    kij_matrix: List[List[float]],
+    min_temp: float,
+    npoints: int = 50,
+) -> Tuple[SweepResult, SweepResult]:
+    """
+    Calculate mixture phase envelope (bubble and dew curves) using PC-SAFT EOS.
+
+    Each curve is traced by feos continuation from `min_temp`. The feos
+    dew line can stop well short of the mixture critical point (about
+    20 K below it for hexane/ethanol); such a line is
+    continued up to the critical point with per-temperature solves, so
+    both lines meet there. The points that do not converge close to it
+    are masked in the returned `(bubble, dew)` sweeps of pressure (Pa)
+    over temperature (K).
+    """
     parameters_list = [predict_pcsaft_parameters(smiles) for smiles in smiles_list]
-    temperatures = np.linspace(min_temp, max_temp, num=10).tolist()
+    eos = pc_saft_mixture(parameters_list, kij_matrix=kij_matrix)
+    x = np.asarray(mole_fractions, dtype=np.float64)
+
+    bubble_line = PhaseDiagram.bubble_point_line(eos, x, min_temp * si.KELVIN, npoints)
+    dew_line = PhaseDiagram.dew_point_line(eos, x, min_temp * si.KELVIN, npoints)
+    try:
+        critical = State.critical_point(eos, x * si.MOL)
+        critical_point = (
+            critical.temperature / si.KELVIN,
+            critical.pressure() / si.PASCAL,
+        )
+    except RuntimeError:
+        critical_point = None  # the lines are kept as traced
+
+    bubble = _envelope_line(bubble_line, eos, x, "bubble", critical_point, npoints)
+    dew = _envelope_line(dew_line, eos, x, "dew", critical_point, npoints)
+
+    if len(bubble.x) == 0 and len(dew.x) == 0:
+        raise ValueError("No phase envelope found at the given conditions.")
+
+    return bubble, dew
 
-    densities = [
-        mix_den_feos(
-            parameters=parameters_list,
-            state=[T, pressure] + mole_fractions,
-            kij_matrix=kij_matrix,
+
+def _kij_key(kij_matrix: List[List[float]]) -> Tuple[Tuple[float, ...], ...]:
+    "hashable form of a kij matrix"
+    return tuple(tuple(row) for row in kij_matrix)
+
+
+@lru_cache(maxsize=16)
+def _dft_functional(
+    smiles_list: Tuple[str, ...], kij_matrix: Tuple[Tuple[float, ...], ...]
+):
+    "PC-SAFT Helmholtz energy functional of a mixture"
+    parameters_list = [predict_pcsaft_parameters(smiles) for smiles in smiles_list]
+    records = get_records(parameters_list)
+    binary_records = [
+        BinaryRecord(
+            id1=Identifier(name=f"comp_{i}"),
+            id2=Identifier(name=f"comp_{j}"),
+            k_ij=kij_matrix[i][j],
         )
-        for T in temperatures
+        for i in range(len(records))
+        for j in range(len(records))
+        if i != j
     ]
-    return temperatures, densities
+    return HelmholtzEnergyFunctional.pcsaft(
+        Parameters.from_records(
+            records,
+            binary_records=binary_records,
+            identifier_option=IdentifierOption.Name,
+        )
+    )
 
 
-def mix_vp(
+def _interface_solver(
+    smiles_list: List[str], kij_matrix: List[List[float]]
+) -> Callable[[float, List[float], bool], float]:
+    """
+    Surface tension (mN/m) of the bubble-point interface at a temperature and
+    liquid composition. Along a path, a warm call starts from the previous
+    converged VLE and interface density profile.
+    """
+    functional = _dft_functional(tuple(smiles_list), _kij_key(kij_matrix))
+    # mole-fraction average of the pure Tc, to estimate the interface width
+    tcs = np.array([pure_critical_point(smiles)[0] for smiles in smiles_list])
+    l_grid = INTERFACE_WIDTH * si.ANGSTROM
+    previous = {}
+
+    def _solve(temperature: float, liquid_molefracs: List[float], warm: bool):
+        x = np.asarray(liquid_molefracs, dtype=np.float64)
+        if warm and previous:
+            vle = PhaseEquilibrium.bubble_point(
+                functional,
+                temperature * si.KELVIN,
+                x,
+                tp_init=previous["vle"].liquid.pressure(),
+                vapor_molefracs=previous["vle"].vapor.molefracs,
+            )
+            interface = PlanarInterface.from_density_profile(
+                vle, INTERFACE_GRID, l_grid, previous["density"]
+            )
+        else:
+            vle = PhaseEquilibrium.bubble_point(functional, temperature * si.KELVIN, x)
+            interface = PlanarInterface.from_tanh(
+                vle=vle,
+                n_grid=INTERFACE_GRID,
+                l_grid=l_grid,
+                critical_temperature=float(tcs @ x) * si.KELVIN,
+            )
+        interface = interface.solve()
+        previous.update(vle=vle, density=interface.density)
+        return interface.surface_tension / (si.MILLI * si.NEWTON / si.METER)
+
+    return _solve
+
+
+def mix_surface_tension(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     smiles_list: List[str],
     mole_fractions: List[float],
     kij_matrix: List[List[float]],
     min_temp: float,
     max_temp: float,
-) -> Tuple[List[float], List[float], List[float]]:
-    "Calculate mixture vapor pressure using PC-SAFT EOS"
+    num: int = 10,
+) -> SweepResult:
+    """
+    Calculate mixture surface tension (mN/m) vs temperature using PC-SAFT DFT.
+
+    The interface is the bubble point of a liquid with `mole_fractions`;
+    each temperature step reuses the previous converged density profile.
+    """
+    solve = _interface_solver(smiles_list, kij_matrix)
+
+    def _solve(temperature, guess):
+        return solve(temperature, mole_fractions, guess is not None)
+
+    key = (
+        "surface tension",
+        tuple(smiles_list),
+        tuple(mole_fractions),
+        _kij_key(kij_matrix),
+    )
+    return _curve_store.sweep(key, _solve, min_temp, max_temp, num=num)
+
+
+def mix_surface_tension_x(
+    smiles_list: List[str],
+    kij_matrix: List[List[float]],
+    temperature: float,
+    npoints: int = 20,
+) -> SweepResult:
+    """
+    Calculate binary mixture surface tension (mN/m) vs liquid mole fraction of
+    the first component using PC-SAFT DFT, at the bubble point.
+
+    Each composition step reuses the previous converged density profile.
+    """
+    if len(smiles_list) != 2:
+        raise ValueError("Surface tension vs composition is for binary mixtures")
+    solve = _interface_solver(smiles_list, kij_matrix)
+
+    def _solve(x1, guess):
+        return solve(temperature, [x1, 1.0 - x1], guess is not None)
+
+    key = (
+        "surface tension x",
+        tuple(smiles_list),
+        _kij_key(kij_matrix),
+        temperature,
+    )
+    return _curve_store.sweep(key, _solve, 0.01, 0.99, num=npoints)
+
+
+@lru_cache(maxsize=16)
+def _mixture_eos(
+    smiles_list: Tuple[str, ...], kij_matrix: Tuple[Tuple[float, ...], ...]
+):
+    "PC-SAFT equation of state of a mixture"
     parameters_list = [predict_pcsaft_parameters(smiles) for smiles in smiles_list]
-    temperatures = np.linspace(min_temp, max_temp, num=10).tolist()
-
-    buble_points = []
-    dew_point = []
-    for temp in temperatures:
-        x_bubble, y_dew = mix_vp_feos(
-            parameters=parameters_list,
-            state=[temp, 0] + mole_fractions,
-            kij_matrix=kij_matrix,
+    return pc_saft_mixture(parameters_list, kij_matrix=[list(k) for k in kij_matrix])
+
+
+def _is_liquid(state, temperature: float, pressure: float) -> bool:
+    "whether a state is on the liquid branch, by its compressibility factor"
+    density = float(state.density / (si.MOL / si.METER**3))
+    return pressure / (density * GAS_CONSTANT * temperature) < LIQUID_MAX_Z
+
+
+def _liquid_state(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    eos, temperature: float, pressure: float, mole_fractions: List[float], density
+):
+    """
+    liquid state initialized from `density`, if any, and solved again from a
+    cold liquid start if it fails or lands off the liquid branch; None if
+    the cold start fails too
+    """
+
+    def _state(initialization):
+        return State(
+            eos,
+            temperature=temperature * si.KELVIN,
+            pressure=pressure * si.PASCAL,
+            composition=np.asarray(mole_fractions, dtype=np.float64) * si.MOL,
+            density_initialization=initialization,
         )
-        buble_points.append(x_bubble)
-        dew_point.append(y_dew)
-    return temperatures, buble_points, dew_point
+
+    if density is not None:
+        try:
+            state = _state(density)
+            if _is_liquid(state, temperature, pressure):
+                return state
+        except RuntimeError:
+            pass
+    try:
+        return _state("liquid")
+    except RuntimeError:
+        return None
+
+
+def _liquid_states(
+    smiles_list: List[str],
+    kij_matrix: List[List[float]],
+    paths: List[List[Tuple[float, float, List[float]]]],
+) -> List:
+    """
+    Liquid states at the `(temperature, pressure, mole_fractions)` conditions
+    of each path, in order, all from one cached EoS. Each path starts cold;
+    along it a state is initialized from the previous density. A state
+    that fails is None.
+    """
+    eos = _mixture_eos(tuple(smiles_list), _kij_key(kij_matrix))
+    total = sum(len(path) for path in paths)
+    states = []
+    for path in paths:
+        density = None
+        for temperature, pressure, mole_fractions in path:
+            checkpoint(len(states), total)
+            state = _liquid_state(eos, temperature, pressure, mole_fractions, density)
+            states.append(state)
+            density = None if state is None else state.density
+    return states
+
+
+def _require_any(values: np.ndarray) -> np.ndarray:
+    "raise if no state converged"
+    if np.all(np.isnan(values)):
+        raise RuntimeError("No state converged at the given conditions.")
+    return values
+
+
+def mix_activity_coefficients(
+    smiles_list: List[str],
+    kij_matrix: List[List[float]],
+    temperature: float,
+    pressure: float,
+    compositions: List[List[float]],
+) -> np.ndarray:
+    """
+    Calculate liquid activity coefficients using PC-SAFT EOS, one row per
+    composition and one column per component (NaN where a state failed)
+    """
+    states = _liquid_states(
+        smiles_list, kij_matrix, [[(temperature, pressure, x) for x in compositions]]
+    )
+    gammas = np.full((len(compositions), len(smiles_list)), np.nan)
+    for i, state in enumerate(states):
+        if state is not None:
+            gammas[i] = np.exp(state.ln_symmetric_activity_coefficient())
+    return _require_any(gammas)
+
+
+def mix_gamma_infinite(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    smiles_list: List[str],
+    kij_matrix: List[List[float]],
+    min_temp: float,
+    max_temp: float,
+    pressure: float,
+    npoints: int = 10,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate binary infinite-dilution activity coefficients vs temperature
+    using PC-SAFT EOS. Returns the temperatures and a `(npoints, 2)` array
+    with γ∞ of component 1 in component 2 and of component 2 in component 1.
+    """
+    if len(smiles_list) != 2:
+        raise ValueError("Infinite dilution activity coefficients are for binaries")
+    temperatures = np.linspace(min_temp, max_temp, num=npoints)
+    # component 1 diluted in 2 along the isobar, then 2 diluted in 1
+    paths = [
+        [(t, pressure, [0.0, 1.0]) for t in temperatures],
+        [(t, pressure, [1.0, 0.0]) for t in temperatures],
+    ]
+    states = _liquid_states(smiles_list, kij_matrix, paths)
+    gammas = np.full((npoints, 2), np.nan)
+    for i, state in enumerate(states):
+        if state is not None:
+            solute = 0 if i < npoints else 1
+            gammas[i % npoints, solute] = np.exp(
+                state.ln_symmetric_activity_coefficient()[solute]
+            )
+    return temperatures, _require_any(gammas)
+
+
+def mix_excess_enthalpy(
+    smiles_list: List[str],
+    kij_matrix: List[List[float]],
+    temperature: float,
+    pressure: float,
+    compositions: List[List[float]],
+) -> np.ndarray:
+    """
+    Calculate liquid excess enthalpy (kJ/mol) using PC-SAFT EOS, one value
+    per composition (NaN where a state failed)
+    """
+    n = len(smiles_list)
+    # each pure liquid on its own, so none starts from another's density
+    paths = [[(temperature, pressure, x)] for x in np.eye(n).tolist()]
+    paths.append([(temperature, pressure, x) for x in compositions])
+    states = _liquid_states(smiles_list, kij_matrix, paths)
+    h_res = np.array(
+        [
+            (
+                np.nan
+                if state is None
+                else state.molar_enthalpy(Contributions.Residual)
+                / (si.KILO * si.JOULE / si.MOL)
+            )
+            for state in states
+        ]
+    )
+    # the ideal gas parts cancel against the pure-component references
+    h_pure, h_mix = h_res[:n], h_res[n:]
+    return _require_any(h_mix - np.asarray(compositions, dtype=np.float64) @ h_pure)
 
 
 def mix_vle(
     smiles_list: List[str],
     kij_matrix: List[List[float]],
     pressure: float,
+    npoints: int = 500,
 ) -> Dict[str, List[float]]:
     "Calculate mixture VLE (T-x-y) using PC-SAFT EOS"
     parameters_list = [predict_pcsaft_parameters(smiles) for smiles in smiles_list]
 
     return mix_vle_diagram_feos(
-        parameters=parameters_list, state=[pressure], kij_matrix=kij_matrix
+        parameters=parameters_list,
+        state=[pressure],
+        kij_matrix=kij_matrix,
+        npoints=npoints,
     )
 
 
@@ -78,21 +613,26 @@ def mix_vle_pxy(
     smiles_list: List[str],
     kij_matrix: List[List[float]],
     temperature: float,
+    npoints: int = 500,
 ) -> Dict[str, List[float]]:
     "Calculate mixture VLE (P-x-y) using PC-SAFT EOS"
     parameters_list = [predict_pcsaft_parameters(smiles) for smiles in smiles_list]
 
     return mix_vle_pxy_diagram_feos(
-        parameters=parameters_list, temperature=temperature, kij_matrix=kij_matrix
+        parameters=parameters_list,
+        temperature=temperature,
+        kij_matrix=kij_matrix,
+        npoints=npoints,
     )
 
 
-def mix_lle(
+def mix_lle(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     smiles_list: List[str],
     mole_fractions: List[float],
     kij_matrix: List[List[float]],
     temperature: float,
     pressure: float,
+    npoints: int = 500,
 ) -> Dict[str, List[float]]:
     "Calculate mixture LLE using PC-SAFT EOS"
     parameters_list = [predict_pcsaft_parameters(smiles) for smiles in smiles_list]
@@ -101,45 +641,67 @@ def mix_lle(
         parameters=parameters_list,
         state=[temperature, pressure, *mole_fractions],
         kij_matrix=kij_matrix,
+        npoints=npoints,
     )
 
 
-def _get_ternary_lle_data(
+# Tie line columns of the ternary LLE, one phase in x and the other in y
+TIE_LINE_KEYS = ("x0", "x1", "x2", "y0", "y1", "y2")
+
+# Feeds of the ternary grid solved per chunk of tie lines
+TIE_LINE_CHUNK = 16
+
+
+def _ternary_tie_lines(
     params: List[List[float]],
     state: List[float],
     kij_matrix: List[List[float]],
-) -> Dict[str, List[float]]:
+    n_pts: int = 25,
+    chunk: int = TIE_LINE_CHUNK,
+) -> Iterator[Dict[str, List[float]]]:
+    "tie lines over an `n_pts` feed grid, yielded every `chunk` feeds"
     t, p = state  # Temperatura (K) e pressão (Pa)
 
-    def _grid(n_pts: int = 25):
-        xi = np.linspace(1e-5, 0.999, n_pts, dtype=np.float64)
-        x1_m, x2_m = np.meshgrid(xi, xi, indexing="xy")
-        x3_m = 1.0 - x1_m - x2_m
-        return x1_m, x2_m, x3_m, (x3_m >= 0.0)
-
-    def _collect_tie_lines(x1_m, x2_m, x3_m, mask):
-        valid_idx = np.argwhere(mask)
-        ternary_data = {"x0": [], "x1": [], "x2": [], "y0": [], "y1": [], "y2": []}
-        for i, j in valid_idx:
-            try:
-                lle = mix_lle_feos(
-                    params,
-                    [t, p, x1_m[i, j].item(), x2_m[i, j].item(), x3_m[i, j].item()],
-                    kij_matrix,
-                )
-            except (RuntimeError, ValueError):
-                continue
-            # For LLE, y is one phase and x is the other phase
-            ternary_data["x0"].extend(lle["x0"])
-            ternary_data["x1"].extend(lle["x1"])
-            ternary_data["x2"].extend(lle["x2"])
-            ternary_data["y0"].extend(lle["y0"])
-            ternary_data["y1"].extend(lle["y1"])
-            ternary_data["y2"].extend(lle["y2"])
-        return ternary_data
-
-    x1, x2, x3, mask = _grid()
-    return _collect_tie_lines(x1, x2, x3, mask)
+    xi = np.linspace(1e-5, 0.999, n_pts, dtype=np.float64)
+    x1_m, x2_m = np.meshgrid(xi, xi, indexing="xy")
+    x3_m = 1.0 - x1_m - x2_m
+    valid_idx = np.argwhere(x3_m >= 0.0)
+
+    tie_lines: Dict[str, List[float]] = {key: [] for key in TIE_LINE_KEYS}
+    for k, (i, j) in enumerate(valid_idx):
+        checkpoint(k, len(valid_idx))
+        if k > 0 and k % chunk == 0:
+            yield tie_lines
+            tie_lines = {key: [] for key in TIE_LINE_KEYS}
+        try:
+            lle = mix_lle_feos(
+                params,
+                [t, p, x1_m[i, j].item(), x2_m[i, j].item(), x3_m[i, j].item()],
+                kij_matrix,
+            )
+        except (RuntimeError, ValueError):
+            continue
+        for key in TIE_LINE_KEYS:
+            tie_lines[key].extend(lle[key])
+    yield tie_lines
+
+
+def _get_ternary_lle_data(
+    params: List[List[float]],
+    state: List[float],
+    kij_matrix: List[List[float]],
+    n_pts: int = 25,
+) -> Dict[str, List[float]]:
+    """
+    collect the tie lines of the feed grid, publishing the ones found so
+    far to the running job after each chunk
+    """
+    ternary_data: Dict[str, List[float]] = {key: [] for key in TIE_LINE_KEYS}
+    for tie_lines in _ternary_tie_lines(params, state, kij_matrix, n_pts):
+        for key in TIE_LINE_KEYS:
+            ternary_data[key].extend(tie_lines[key])
+        publish({key: list(values) for key, values in ternary_data.items()})
+    return ternary_data
 
 
 def mix_ternary_lle(
@@ -147,12 +709,14 @@ def mix_ternary_lle(
     kij_matrix: List[List[float]],
     temperature: float,
     pressure: float,
+    n_pts: int = 25,
 ) -> Dict[str, List[float]]:
-    "Calculate ternary LLE/VLE using PC-SAFT EOS"
+    "Calculate ternary LLE/VLE using PC-SAFT EOS on an `n_pts` feed grid"
     parameters_list = [predict_pcsaft_parameters(smiles) for smiles in smiles_list]
 
     return _get_ternary_lle_data(
         params=parameters_list,
         state=[temperature, pressure],
         kij_matrix=kij_matrix,
+        n_pts=n_pts,
     )
@@ -0,0 +1,276 @@
+"""
+Vectorized PC-SAFT for pure components, in NumPy.
+
+Evaluates the residual Helmholtz energy (hard-chain, dispersion,
+association and dipolar terms), pressure and liquid density for arrays of
+states and parameter sets at once, for screening many compounds. The
+parameters follow `predict_pcsaft_parameters`:
+`[m, sigma, epsilon/kB, kappa_ab, epsilon_ab/kB, dipole moment, na, nb, mw]`.
+"""
+
+from typing import Tuple
+
+import numpy as np
+from utils_sweep import family_map
+
+KB = 1.380649e-23  # J/K
+NAV = 6.02214076e23  # 1/mol
+RGAS = KB * NAV  # J/mol/K
+
+# Close packing limit of the packing fraction
+MAX_ETA = 0.7405
+
+# Relative width of the unstable gap at which a density branch is given up
+SPINODAL_GAP = 1e-4
+
+# Complex step of the density derivatives
+COMPLEX_STEP = 1e-30
+
+# Dispersion integrals (Gross and Sadowski, 2001)
+DISP_A = np.array(
+    [
+        [0.9105631445, -0.3084016918, -0.0906148351],
+        [0.6361281449, 0.1860531159, 0.4527842806],
+        [2.6861347891, -2.5030047259, 0.5962700728],
+        [-26.547362491, 21.419793629, -1.7241829131],
+        [97.759208784, -65.255885330, -4.1302112531],
+        [-159.59154087, 83.318680481, 13.776631870],
+        [91.297774084, -33.746922930, -8.6728470368],
+    ]
+)
+DISP_B = np.array(
+    [
+        [0.7240946941, -0.5755498075, 0.0976883116],
+        [2.2382791861, 0.6995095521, -0.2557574982],
+        [-4.0025849485, 3.8925673390, -9.1558561530],
+        [-21.003576815, -17.215471648, 20.642075974],
+        [26.855641363, 192.67226447, -38.804430052],
+        [206.55133841, -161.82646165, 93.626774077],
+        [-355.60235612, -165.20769346, -29.666905585],
+    ]
+)
+
+# Dipolar integrals (Gross and Vrabec, 2006)
+DIPOLE_A = np.array(
+    [
+        [0.3043504, 0.9534641, -1.1610080],
+        [-0.1358588, -1.8396383, 4.5258607],
+        [1.4493329, 2.0131180, 0.9751222],
+        [0.3556977, -7.3724958, -12.281038],
+        [-2.0653308, 8.2374135, 5.9397575],
+    ]
+)
+DIPOLE_B = np.array(
+    [
+        [0.2187939, -0.5873164, 3.4869576],
+        [-1.1896431, 1.2489132, -14.915974],
+        [1.1626889, -0.5085280, 15.372022],
+        [0.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0],
+    ]
+)
+DIPOLE_C = np.array(
+    [
+        [-0.0646774, -0.9520876, -0.6260979],
+        [0.1975882, 2.9924258, 1.2924686],
+        [-0.8087562, -2.3802636, 1.6542783],
+        [0.6902849, -0.2701261, -3.4396744],
+    ]
+)
+
+# Squared dipole moment in D² to the reduced form, per m sigma³ (Å³) epsilon/kB (K)
+DIPOLE_UNIT = 1e-19 / KB
+
+
+def _split(parameters: np.ndarray) -> Tuple[np.ndarray, ...]:
+    "parameter columns as separate arrays"
+    parameters = np.asarray(parameters, dtype=np.float64)
+    return tuple(parameters[..., i] for i in range(9))
+
+
+def _polynomial(coefs: np.ndarray, m, eta):
+    "sum_i (c0_i + (m-1)/m c1_i + (m-1)(m-2)/m² c2_i) eta^i"
+    m1 = (m - 1.0) / m
+    m2 = m1 * (m - 2.0) / m
+    total = 0.0
+    for c0, c1, c2 in coefs[::-1]:  # Horner scheme
+        total = total * eta + (c0 + m1 * c1 + m2 * c2)
+    return total
+
+
+def _helmholtz(parameters, temperature, eta):
+    """
+    Residual Helmholtz energy per molecule over kT at packing fraction
+    `eta` (may be complex for the complex-step derivatives)
+    """
+    m, sigma, epsilon, kappa_ab, epsilon_ab, mu, na, nb, _ = _split(parameters)
+    d = sigma * (1.0 - 0.12 * np.exp(-3.0 * epsilon / temperature))
+    rho = 6.0 * eta / (np.pi * m * d**3)  # molecules per Å³
+    eta2 = eta * eta
+    frac = 1.0 - eta
+    frac2 = frac * frac
+
+    # hard sphere (Carnahan-Starling) and chain
+    a_hs = (4.0 * eta - 3.0 * eta2) / frac2
+    g_hs = (1.0 - eta / 2.0) / (frac2 * frac)
+    a_hc = m * a_hs - (m - 1.0) * np.log(g_hs)
+
+    # dispersion
+    i1 = _polynomial(DISP_A, m, eta)
+    i2 = _polynomial(DISP_B, m, eta)
+    c1 = 1.0 / (
+        1.0
+        + m * (8.0 * eta - 2.0 * eta2) / (frac2 * frac2)
+        + (1.0 - m)
+        * (20.0 * eta - 27.0 * eta2 + (12.0 * eta - 2.0 * eta2) * eta2)
+        / (frac2 * (2.0 - eta) * (2.0 - eta))
+    )
+    e_t = epsilon / temperature
+    m2es3 = m**2 * e_t * sigma**3
+    a_disp = -2.0 * np.pi * rho * i1 * m2es3 - np.pi * rho * m * c1 * i2 * m2es3 * e_t
+
+    # association, analytic site fractions for na A and nb B sites
+    delta = g_hs * sigma**3 * kappa_ab * (np.exp(epsilon_ab / temperature) - 1.0)
+    rd = rho * delta
+    ba = 1.0 + (nb - na) * rd
+    bb = 1.0 + (na - nb) * rd
+    xa = 2.0 / (ba + np.sqrt(ba * ba + 4.0 * na * rd))
+    xb = 2.0 / (bb + np.sqrt(bb * bb + 4.0 * nb * rd))
+    a_assoc = na * (np.log(xa) - xa / 2.0 + 0.5) + nb * (np.log(xb) - xb / 2.0 + 0.5)
+
+    # dipolar, with the segment number capped at 2
+    mu2 = mu**2 * DIPOLE_UNIT / (m * sigma**3 * epsilon)
+    m_dd = np.minimum(m, 2.0)
+    j2 = _polynomial(DIPOLE_A, m_dd, eta) + e_t * _polynomial(DIPOLE_B, m_dd, eta)
+    j3 = _polynomial(DIPOLE_C, m_dd, eta)
+    a2 = -np.pi * rho * e_t**2 * sigma**3 * mu2**2 * j2
+    a3 = -4.0 / 3.0 * np.pi**2 * rho * rho * e_t**3 * sigma**6 * mu2**3 * j3
+    polar = mu > 0.0
+    a_dd = np.where(polar, a2 / (1.0 - a3 / np.where(polar, a2, 1.0)), 0.0)
+
+    return a_hc + a_disp + a_assoc + a_dd
+
+
+def _packing_fraction(parameters, temperature, density):
+    "packing fraction at a molar density (mol/m³)"
+    m, sigma, epsilon = _split(parameters)[:3]
+    d = sigma * (1.0 - 0.12 * np.exp(-3.0 * epsilon / temperature))
+    return np.pi / 6.0 * m * d**3 * density * NAV * 1e-30
+
+
+def residual_helmholtz(parameters, temperature, density) -> np.ndarray:
+    "Residual Helmholtz energy over NkT at molar density (mol/m³)"
+    return np.real(
+        _helmholtz(
+            parameters,
+            temperature,
+            _packing_fraction(parameters, temperature, density),
+        )
+    )
+
+
+def _compressibility(parameters, temperature, eta) -> np.ndarray:
+    "compressibility factor, with the density derivative taken by complex step"
+    a = _helmholtz(parameters, temperature, eta + 1j * COMPLEX_STEP)
+    return 1.0 + eta * np.imag(a) / COMPLEX_STEP
+
+
+def pressure(parameters, temperature, density) -> np.ndarray:
+    "Pressure (Pa) at temperature (K) and molar density (mol/m³)"
+    eta = _packing_fraction(parameters, temperature, density)
+    return density * RGAS * temperature * _compressibility(parameters, temperature, eta)
+
+
+def _density_iteration(
+    parameters, temperature, target_pressure, eta, liquid: bool, tol, max_iter
+) -> np.ndarray:
+    """
+    Newton iterations on the packing fraction of flat arrays of states,
+    from the liquid side (decreasing) or the vapor side (increasing).
+    Steps that leave the branch are replaced by bisection between the
+    closest points known on either side of the root. Returns NaN where
+    the branch ends at a spinodal before reaching the target pressure.
+    """
+    to_density = 1.0 / _packing_fraction(parameters, temperature, 1.0)
+    result = np.full(eta.shape, np.nan)
+    # closest points on the branch side and on the far side of the root
+    near = np.full(eta.shape, MAX_ETA if liquid else 0.0)
+    far = np.full(eta.shape, 0.0 if liquid else MAX_ETA)
+    active = np.arange(eta.size)
+    for _ in range(max_iter):
+        args = (parameters[active], temperature[active])
+        target = target_pressure[active]
+        e = eta[active]
+        p = pressure(*args, e * to_density[active])
+        step = 1e-7 * e
+        dp = (pressure(*args, (e + step) * to_density[active]) - p) / step
+        stable = dp > 0.0
+        newton = e - (p - target) / np.where(stable, dp, 1.0)
+        converged = stable & (np.abs(newton - e) <= tol * e)
+        result[active[converged]] = newton[converged]
+
+        on_branch = stable & ((p > target) if liquid else (p < target))
+        n = np.where(on_branch, e, near[active])
+        f = np.where(on_branch, far[active], e)
+        near[active], far[active] = n, f
+        low, high = np.minimum(n, f), np.maximum(n, f)
+        eta[active] = np.where(
+            stable & (newton > low) & (newton < high), newton, (n + f) / 2.0
+        )
+        # the branch ends at a spinodal before reaching the target pressure
+        failed = ~stable & (high - low <= SPINODAL_GAP * e)
+        active = active[~(converged | failed)]
+        if active.size == 0:
+            break
+    return result * to_density
+
+
+def liquid_density(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    parameters,
+    temperature,
+    target_pressure,
+    tol: float = 1e-10,
+    max_iter: int = 100,
+    chunk_size: int = 20000,
+) -> np.ndarray:
+    """
+    Density (mol/m³) at temperature (K) and pressure (Pa) with liquid
+    initialization, like `pure_den_feos`, for broadcastable arrays of
+    parameter sets and states.
+
+    States without a liquid root fall back to the vapor root; states
+    where neither converges are NaN. Large arrays are split in chunks
+    solved concurrently, NumPy releasing the GIL on the array operations.
+    """
+    parameters = np.asarray(parameters, dtype=np.float64)
+    shape = np.broadcast_shapes(
+        parameters.shape[:-1], np.shape(temperature), np.shape(target_pressure)
+    )
+    parameters = np.broadcast_to(parameters, shape + (9,)).reshape(-1, 9)
+    temperature = np.broadcast_to(temperature, shape).astype(np.float64).ravel()
+    target_pressure = np.broadcast_to(target_pressure, shape).astype(np.float64).ravel()
+
+    def _solve(index: np.ndarray) -> np.ndarray:
+        args = (parameters[index], temperature[index], target_pressure[index])
+        density = _density_iteration(
+            *args, np.full(index.size, 0.5), True, tol, max_iter
+        )
+        vapor = np.flatnonzero(np.isnan(density))
+        if vapor.size:
+            # start from the ideal gas
+            p_v, t_v, target_v = (arg[vapor] for arg in args)
+            eta = _packing_fraction(p_v, t_v, target_v / (RGAS * t_v))
+            density[vapor] = _density_iteration(
+                p_v, t_v, target_v, eta, False, tol, max_iter
+            )
+        return density
+
+    chunks = np.array_split(
+        np.arange(temperature.size), max(1, -(-temperature.size // chunk_size))
+    )
+    density = np.empty(temperature.size)
+    for index, result in zip(chunks, family_map(_solve, chunks)):
+        if isinstance(result, Exception):
+            raise result
+        density[index] = result
+    return density.reshape(shape)
@@ -1,75 +1,347 @@
 "Pure screen utilities"
 
-from typing import List, Tuple
+from copy import copy
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
 
 import numpy as np
+import si_units as si
+from feos import Contributions  # pyright: ignore[reportAttributeAccessIssue]
+from feos import (
+    HelmholtzEnergyFunctional,  # pyright: ignore[reportAttributeAccessIssue]
+)
+from feos import Parameters  # pyright: ignore[reportAttributeAccessIssue]
+from feos import PhaseEquilibrium  # pyright: ignore[reportAttributeAccessIssue]
+from feos import PlanarInterface  # pyright: ignore[reportAttributeAccessIssue]
+from feos import State  # pyright: ignore[reportAttributeAccessIssue]
 from gnnepcsaft.pcsaft.pcsaft_feos import (
-    phase_diagram_feos,
+    critical_points_feos,
+    get_records,
+    mix_den_feos,
+    pc_saft,
     pure_den_feos,
-    pure_h_lv_feos,
-    pure_surface_tension_feos,
-    pure_vp_feos,
 )
 from gnnepcsaft_mcp_server.utils import predict_pcsaft_parameters
+from utils_atlas import atlas_density, atlas_saturation
+from utils_sweep import CurveStore, SweepResult
+
+# Computed curves keyed by (property, compound, fixed conditions)
+_curve_store = CurveStore()
+
+
+@lru_cache(maxsize=128)
+def pure_critical_point(smiles: str) -> Tuple[float, float, float]:
+    "Calculate pure-component critical point `(Tc, Pc, Dc)` using PC-SAFT EOS"
+    parameters = predict_pcsaft_parameters(smiles)
+    tc, pc, dc = critical_points_feos(copy(parameters))
+    return tc, pc, dc
+
+
+def clip_to_saturation(
+    smiles: str, min_temp: float, max_temp: float
+) -> Tuple[float, float, str]:
+    """
+    Clip a temperature range to the vapor-liquid saturation domain, which
+    ends at the critical temperature. Returns the clipped range and a note
+    describing the adjustment (empty when the range is unchanged).
+    """
+    tc, _, _ = pure_critical_point(smiles)
+    if min_temp >= tc:
+        raise ValueError(
+            f"Minimum temperature must be below the critical temperature ({tc:.2f} K)"
+        )
+    if max_temp <= tc:
+        return min_temp, max_temp, ""
+    return min_temp, tc, f"clipped at Tc = {tc:.2f} K"
+
+
+# Columns of `pure_saturation`
+SATURATION_PROPERTIES = ("pressure", "h_lv", "density liquid", "density vapor")
+
+
+def _saturation_properties(vle) -> List[float]:
+    "Saturation properties of a pure-component VLE, ordered as SATURATION_PROPERTIES"
+    liquid = vle.liquid
+    vapor = vle.vapor
+    return [
+        liquid.pressure() / si.PASCAL,
+        (
+            vapor.molar_enthalpy(Contributions.Residual)
+            - liquid.molar_enthalpy(Contributions.Residual)
+        )
+        * (si.MOL / si.KILO / si.JOULE),
+        liquid.density * (si.METER**3) / si.MOL,
+        vapor.density * (si.METER**3) / si.MOL,
+    ]
+
+
+# Points of the pure phase diagram, evenly spaced in sqrt(1 - T/Tc) so they
+# crowd towards the critical point, where the densities change fastest
+PHASE_DIAGRAM_POINTS = 200
+
+
+def saturation_temperatures(
+    min_temp: float, tc: float, num: int = PHASE_DIAGRAM_POINTS
+) -> np.ndarray:
+    "temperatures from `min_temp` up to `tc`, evenly spaced in sqrt(1 - T/Tc)"
+    return tc * (1.0 - np.linspace(np.sqrt(1.0 - min_temp / tc), 0.0, num) ** 2)
+
+
+def pure_saturation(smiles: str, temperatures: Sequence[float]) -> SweepResult:
+    """
+    Calculate pure-component saturation properties at increasing
+    `temperatures` using PC-SAFT EOS.
+
+    The VLE is solved once per temperature, warm-started from the previous
+    one, and the result columns follow `SATURATION_PROPERTIES`. All points
+    of a compound are stored on one curve, so the vapor pressure, enthalpy
+    of vaporization and phase diagram plots are views of it that only
+    solve the temperatures not computed yet.
+    """
+    parameters = predict_pcsaft_parameters(smiles)
+    tc, pc, dc = pure_critical_point(smiles)
+    clip_to_saturation(smiles, temperatures[0], temperatures[-1])  # raises above Tc
+
+    eos = pc_saft(parameters)
+    last_vle = {}
+
+    def _solve(temperature, guess):
+        if temperature >= tc:
+            # The critical point closes the curves without a solver call
+            return [pc, 0.0, dc, dc]
+        vle = PhaseEquilibrium.pure(
+            eos,
+            temperature * si.KELVIN,
+            initial_state=None if guess is None else last_vle.get("vle"),
+        )
+        last_vle["vle"] = vle
+        return _saturation_properties(vle)
+
+    return _curve_store.sweep_at(("saturation", smiles), _solve, temperatures)
+
+
+def _saturation_view(
+    smiles: str, min_temp: float, max_temp: float, prop: str
+) -> SweepResult:
+    "One saturation property at 10 points of `[min_temp, max_temp]`, clipped at Tc"
+    _, clipped_max, _ = clip_to_saturation(smiles, min_temp, max_temp)
+    bundle = atlas_saturation(smiles, min_temp, clipped_max)
+    if bundle is None:
+        bundle = pure_saturation(smiles, np.linspace(min_temp, clipped_max, 10))
+    return saturation_property(bundle, clipped_max, prop)
+
+
+def saturation_property(bundle: SweepResult, max_temp: float, prop: str) -> SweepResult:
+    "One property of a `pure_saturation` curve up to `max_temp`"
+    in_range = bundle.x <= max_temp
+    return SweepResult(
+        bundle.x[in_range],
+        bundle.y[in_range, SATURATION_PROPERTIES.index(prop)],
+        bundle.valid[in_range],
+        bundle.errors[in_range],
+    )
 
 
 def pure_den(
     smiles: str, min_temp: float, max_temp: float, pressure: float
-) -> Tuple[List[float], List[float]]:
-    "Calculate pure-component density using PC-SAFT EOS"
+) -> SweepResult:
+    """
+    Calculate pure-component density using PC-SAFT EOS.
+
+    Inside the validated domain of the atlas, the isobar is interpolated
+    from it without running the solver.
+    """
+    interpolated = atlas_density(smiles, min_temp, max_temp, pressure)
+    if interpolated is not None:
+        return interpolated
     parameters = predict_pcsaft_parameters(smiles)
-    temperatures = np.linspace(min_temp, max_temp, num=10).tolist()
 
-    densities = [pure_den_feos(parameters, [T, pressure]) for T in temperatures]
-    return temperatures, densities
+    def _solve(temperature, rho_guess):
+        if rho_guess is None:
+            return pure_den_feos(parameters, [temperature, pressure])
+        # warm start from the previous converged density
+        return mix_den_feos(
+            parameters=[parameters],
+            state=[temperature, pressure, 1.0],
+            density_initialization=rho_guess * si.MOL / si.METER**3,
+        )
 
+    return _curve_store.sweep(
+        ("density", smiles, pressure), _solve, min_temp, max_temp, num=10
+    )
 
-def pure_vp(
-    smiles: str, min_temp: float, max_temp: float
-) -> Tuple[List[float], List[float]]:
-    "Calculate pure-component vapor pressure using PC-SAFT EOS"
-    parameters = predict_pcsaft_parameters(smiles)
-    temperatures = np.linspace(min_temp, max_temp, num=10).tolist()
 
-    vapor_pressures = [pure_vp_feos(parameters, [T]) for T in temperatures]
-    return temperatures, vapor_pressures
+def pure_vp(smiles: str, min_temp: float, max_temp: float) -> SweepResult:
+    "Calculate pure-component vapor pressure using PC-SAFT EOS"
+    return _saturation_view(smiles, min_temp, max_temp, "pressure")
 
 
-def pure_h_lv(
-    smiles: str, min_temp: float, max_temp: float
-) -> Tuple[List[float], List[float]]:
+def pure_h_lv(smiles: str, min_temp: float, max_temp: float) -> SweepResult:
     "Calculate pure-component enthalpy of vaporization using PC-SAFT EOS"
-    parameters = predict_pcsaft_parameters(smiles)
-    temperatures = np.linspace(min_temp, max_temp, num=10).tolist()
+    return _saturation_view(smiles, min_temp, max_temp, "h_lv")
+
+
+# Columns of `pure_properties`/`mix_properties` with their plot labels
+STATE_PROPERTIES = {
+    "Density": "Density (mol/m³)",
+    "Compressibility factor": "Z",
+    "Residual Cp": r"$C_p^{res}$ (J/mol/K)",
+    "Residual Cv": r"$C_v^{res}$ (J/mol/K)",
+    "Residual enthalpy": r"$H^{res}$ (kJ/mol)",
+    "Isothermal compressibility": r"$\kappa_T$ (1/MPa)",
+    "Thermal expansivity": r"$\alpha_p$ (1/K)",
+}
+
+
+def state_properties(state) -> List[float]:
+    "Properties of a feos state, ordered as STATE_PROPERTIES"
+    return [
+        state.density / (si.MOL / si.METER**3),
+        state.compressibility(),
+        state.molar_isobaric_heat_capacity(Contributions.Residual)
+        / (si.JOULE / si.MOL / si.KELVIN),
+        state.molar_isochoric_heat_capacity(Contributions.Residual)
+        / (si.JOULE / si.MOL / si.KELVIN),
+        state.molar_enthalpy(Contributions.Residual) / (si.KILO * si.JOULE / si.MOL),
+        state.isothermal_compressibility() * (si.MEGA * si.PASCAL),
+        state.thermal_expansivity() * si.KELVIN,
+    ]
+
+
+def pure_properties(
+    smiles: str, min_temp: float, max_temp: float, pressure: float, num: int = 10
+) -> SweepResult:
+    """
+    Calculate pure-component state properties along an isobar using PC-SAFT EOS.
+
+    Each state is built once, initialized from the previous density, and
+    all `STATE_PROPERTIES` are taken from it, so every property of the
+    isobar comes from one stored sweep.
+    """
+    eos = pc_saft(predict_pcsaft_parameters(smiles))
+
+    def _solve(temperature, guess):
+        state = State(
+            eos,
+            temperature=temperature * si.KELVIN,
+            pressure=pressure * si.PASCAL,
+            density_initialization=(
+                "liquid" if guess is None else guess[0] * si.MOL / si.METER**3
+            ),
+        )
+        return state_properties(state)
+
+    key = ("properties", smiles, pressure)
+    return _curve_store.sweep(key, _solve, min_temp, max_temp, num=num)
 
-    h_lvs = [pure_h_lv_feos(parameters, [T]) for T in temperatures]
-    return temperatures, h_lvs
 
+# DFT grid of the planar vapor-liquid interface
+INTERFACE_GRID = 1024
+INTERFACE_WIDTH = 100.0  # Angstrom
 
-def pure_surface_tension(
+# Reduced temperature above which an interface starts from pDGT: near Tc the
+# profile widens too fast for the neighbouring one to be a good start
+SEEDED_INTERFACE_MAX_TR = 0.9
+
+
+@lru_cache(maxsize=16)
+def _dft_model(
     smiles: str,
-    min_temp: float,
-) -> Tuple[List[float], List[float]]:
-    "Calculate pure-component surface tension (mN/m) using PC-SAFT EOS"
+) -> Tuple[Any, float, Dict[float, Tuple[Any, Any, Any]]]:
+    """
+    PC-SAFT Helmholtz energy functional of a compound, its critical
+    temperature (K) and its converged interface profiles
+    `{T: (vle, density, domain width)}`
+    """
     parameters = predict_pcsaft_parameters(smiles)
+    functional = HelmholtzEnergyFunctional.pcsaft(
+        Parameters.from_records(get_records([copy(parameters)]))
+    )
+    tc, _, _ = pure_critical_point(smiles)
+    return functional, tc, {}
+
+
+def _seeded_interface(vle, previous_vle, density, l_grid):
+    "interface started from a neighbouring profile scaled to the new bulk densities"
+    unit = si.MOL / si.METER**3
+    rho_l0 = previous_vle.liquid.density / unit
+    rho_v0 = previous_vle.vapor.density / unit
+    rho_l = vle.liquid.density / unit
+    rho_v = vle.vapor.density / unit
+    profile = rho_v + (density / unit - rho_v0) * (rho_l - rho_v) / (rho_l0 - rho_v0)
+    return PlanarInterface.from_density_profile(
+        vle, INTERFACE_GRID, l_grid, profile * unit
+    )
 
-    surface_tensions, temperatures = pure_surface_tension_feos(parameters, [min_temp])
 
-    return temperatures.tolist(), surface_tensions.tolist()
+def _interface_surface_tension(smiles: str, temperature: float, vle) -> float:
+    """
+    Solve the DFT interface profile of a pure-component VLE and return its
+    surface tension (mN/m). Below `SEEDED_INTERFACE_MAX_TR` the profile is
+    seeded from the cached profile of the nearest temperature, as a sweep
+    steps from its neighbour; it starts from a pDGT calculation, as in the
+    feos surface tension diagram, without one, near Tc or if that fails.
+    """
+    _, tc, profiles = _dft_model(smiles)
+    interface = None
+    if profiles and temperature < SEEDED_INTERFACE_MAX_TR * tc:
+        nearest = min(profiles, key=lambda t: abs(t - temperature))
+        try:
+            interface = _seeded_interface(vle, *profiles[nearest]).solve()
+        except RuntimeError:
+            pass
+    if interface is None:
+        interface = PlanarInterface.from_pdgt(vle, INTERFACE_GRID).solve()
+    z = interface.z / si.ANGSTROM
+    # cell centred grid, so the domain ends half a cell after the last point
+    profiles[temperature] = (vle, interface.density, (z[-1] + z[0]) * si.ANGSTROM)
+    return interface.surface_tension / (si.MILLI * si.NEWTON / si.METER)
+
+
+def pure_surface_tension(smiles: str, min_temp: float) -> SweepResult:
+    """
+    Calculate pure-component surface tension (mN/m) using PC-SAFT DFT.
+
+    The curve runs over 100 points from `min_temp` up to the critical
+    temperature, where it closes at zero. The curve is stored per compound,
+    so repeat views and range changes only solve the temperatures not
+    computed yet.
+    """
+    clip_to_saturation(smiles, min_temp, min_temp)  # raises above Tc
+    functional, tc, _ = _dft_model(smiles)
+    last_vle = {}
+
+    def _solve(temperature, _):
+        if temperature >= tc:
+            return 0.0
+        vle = PhaseEquilibrium.pure(
+            functional, temperature * si.KELVIN, initial_state=last_vle.get("vle")
+        )
+        last_vle["vle"] = vle
+        return _interface_surface_tension(smiles, temperature, vle)
+
+    return _curve_store.sweep(
+        ("surface tension", smiles), _solve, min_temp, tc, num=100, warm_start=False
+    )
 
 
 def pure_phase_diagram(
     smiles: str,
     min_temp: float,
-) -> Tuple[List[float], List[float], List[float], List[float]]:
-    "Calculate pure-component phase diagram using PC-SAFT EOS"
-    parameters = predict_pcsaft_parameters(smiles)
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate pure-component phase diagram using PC-SAFT EOS.
 
-    output = phase_diagram_feos(parameters, [min_temp])
+    The diagram has `PHASE_DIAGRAM_POINTS` points from `min_temp` up to the
+    critical point, solved on the saturation curve shared with the vapor
+    pressure and enthalpy of vaporization plots.
+    """
+    tc, _, _ = pure_critical_point(smiles)
+    bundle = pure_saturation(smiles, saturation_temperatures(min_temp, tc))
 
     return (
-        output["temperature"],
-        output["pressure"],
-        output["density liquid"],
-        output["density vapor"],
+        bundle.x,
+        bundle.y[:, SATURATION_PROPERTIES.index("pressure")],
+        bundle.y[:, SATURATION_PROPERTIES.index("density liquid")],
+        bundle.y[:, SATURATION_PROPERTIES.index("density vapor")],
     )
@@ -0,0 +1,578 @@
+"Sweep utilities shared by pure and mixture calculations"
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+from utils_jobs import checkpoint, job_part, publish
+
+SolveFn = Callable[[float, Any], Any]
+
+# Per-point error codes
+POINT_OK = 0
+POINT_NOT_CONVERGED = 1
+POINT_INVALID = 2
+POINT_NON_PHYSICAL = 3
+
+ERROR_MESSAGES = {
+    POINT_NOT_CONVERGED: "not converged",
+    POINT_INVALID: "invalid state",
+    POINT_NON_PHYSICAL: "non-physical result",
+}
+
+
+class SweepResult(NamedTuple):
+    "Sweep points with a validity mask and per-point error codes"
+
+    x: np.ndarray
+    y: np.ndarray  # NaN where the point failed, one column per property
+    valid: np.ndarray
+    errors: np.ndarray
+
+
+def _is_physical(value: np.ndarray) -> bool:
+    "check if a converged value can seed the next point"
+    return bool(np.all(np.isfinite(value)) and np.all(value > 0.0))
+
+
+def _as_guess(value: np.ndarray) -> Any:
+    "converged value in the form passed back to the solver"
+    return float(value) if value.ndim == 0 else value
+
+
+def _solve_point(solve: SolveFn, point: float, guess: Any) -> np.ndarray:
+    "solve one point warm-started from guess, falling back to a cold start"
+    if guess is None:
+        return np.asarray(solve(point, None), dtype=np.float64)
+    try:
+        value = np.asarray(solve(point, guess), dtype=np.float64)
+    except (RuntimeError, ValueError, AssertionError):
+        return np.asarray(solve(point, None), dtype=np.float64)
+    if not _is_physical(value):
+        return np.asarray(solve(point, None), dtype=np.float64)
+    return value
+
+
+def sweep_points(
+    solve: SolveFn,
+    points: List[float],
+    warm_start: bool = True,
+    initial_guess: Any = None,
+) -> Iterator[Tuple[int, Optional[np.ndarray], int]]:
+    """
+    Solve `solve(point, guess)` along `points` using continuation, yielding
+    `(index, value, error code)` as each point converges or fails (`value`
+    is None for a failed point).
+
+    Each converged value seeds the next point as `guess`. `guess=None`
+    asks for a cold start, used for the first point and as a fallback
+    when a warm-started solve fails or returns a non-physical value.
+    With `warm_start=False` every point is a cold start. `initial_guess`
+    seeds the first point, e.g. from a neighbouring cached point.
+    """
+    guess = initial_guess if warm_start else None
+    for i, point in enumerate(points):
+        checkpoint(i, len(points))
+        try:
+            value = _solve_point(solve, point, guess)
+        except RuntimeError:
+            guess = None
+            yield i, None, POINT_NOT_CONVERGED
+            continue
+        except (ValueError, AssertionError):
+            guess = None
+            yield i, None, POINT_INVALID
+            continue
+
+        if not np.all(np.isfinite(value)):
+            guess = None
+            yield i, None, POINT_NON_PHYSICAL
+            continue
+
+        guess = _as_guess(value) if warm_start and _is_physical(value) else None
+        yield i, value, POINT_OK
+
+
+def continuation_sweep(
+    solve: SolveFn,
+    points: List[float],
+    warm_start: bool = True,
+    initial_guess: Any = None,
+) -> SweepResult:
+    """
+    Solve `solve(point, guess)` along `points` using continuation, as
+    `sweep_points` does, and collect the points.
+
+    `solve` returns either a float or a sequence of floats (one per
+    property), giving a 1-D or 2-D `y` respectively.
+
+    A failed point is recorded in the error codes and the sweep carries
+    on, so points already computed are never discarded.
+    """
+    rows: List[Optional[np.ndarray]] = [None] * len(points)
+    errors = np.full(len(points), POINT_OK, dtype=np.int8)
+    for i, value, error in sweep_points(solve, points, warm_start, initial_guess):
+        rows[i], errors[i] = value, error
+    return _sweep_result(points, rows, errors)
+
+
+def _sweep_result(
+    points: List[float], rows: List[Optional[np.ndarray]], errors: np.ndarray
+) -> SweepResult:
+    "sweep result of the points solved so far"
+    x = np.asarray(points, dtype=np.float64)
+    return SweepResult(x, _stack_rows(rows), errors == POINT_OK, errors)
+
+
+def _stack_rows(rows: List[Optional[np.ndarray]]) -> np.ndarray:
+    "stack converged values, filling failed points with NaN"
+    converged = [row for row in rows if row is not None]
+    if not converged or converged[0].ndim == 0:
+        y = np.full(len(rows), np.nan)
+    else:
+        y = np.full((len(rows), converged[0].size), np.nan)
+    for i, row in enumerate(rows):
+        if row is not None:
+            y[i] = row
+    return y
+
+
+def require_valid(result: SweepResult) -> SweepResult:
+    "raise if no point of the sweep converged"
+    if not result.valid.any():
+        codes = [code for code in np.unique(result.errors) if code != POINT_OK]
+        reasons = ", ".join(ERROR_MESSAGES[code] for code in codes)
+        raise RuntimeError(f"No point of the sweep converged ({reasons})")
+    return result
+
+
+def failure_note(result: SweepResult) -> str:
+    "describe the failed points of a sweep (empty when all converged)"
+    n_failed = int((~result.valid).sum())
+    if n_failed == 0:
+        return ""
+    return f"{n_failed} of {len(result.valid)} points failed"
+
+
+# A cached interval covers a request when its point spacing is at most
+# this many times the requested spacing, so small zooms reuse it as is
+COVERAGE_TOLERANCE = 1.5
+
+
+def _eps(value: float) -> float:
+    "tolerance for comparing sweep points"
+    return 1e-9 * max(1.0, abs(value))
+
+
+class _Curve:
+    """
+    sorted points of one curve and the intervals they cover; `lock` is held
+    by the sweep computing and merging its points
+    """
+
+    def __init__(self):
+        self.result: Optional[SweepResult] = None
+        self.intervals: List[Tuple[float, float, float]] = []  # (lo, hi, step)
+        self.lock = threading.RLock()
+
+    def has_point(self, point: float) -> bool:
+        "check if the point was already computed"
+        if self.result is None:
+            return False
+        return bool(np.any(np.abs(self.result.x - point) <= _eps(point)))
+
+    def uncovered(
+        self, min_x: float, max_x: float, step: float
+    ) -> List[Tuple[float, float]]:
+        "sub-intervals of `[min_x, max_x]` not covered at the requested spacing"
+        pieces = [(min_x, max_x)]
+        for lo, hi, cached_step in self.intervals:
+            if cached_step > step * COVERAGE_TOLERANCE + _eps(step):
+                continue
+            remaining = []
+            for p, q in pieces:
+                if hi < p or lo > q:
+                    remaining.append((p, q))
+                    continue
+                if lo > p:
+                    remaining.append((p, lo))
+                if hi < q:
+                    remaining.append((hi, q))
+            pieces = remaining
+        return [(p, q) for p, q in pieces if q - p > _eps(q)]
+
+    def seed(self, points: List[float], step: float) -> Tuple[Any, List[float]]:
+        """
+        guess from the nearest valid cached point within one step of the
+        segment, with the points ordered to sweep away from it
+        """
+        if self.result is None or not self.result.valid.any():
+            return None, points
+        x = self.result.x[self.result.valid]
+        y = self.result.y[self.result.valid]
+        start = np.abs(x - points[0])
+        end = np.abs(x - points[-1])
+        if end.min() < start.min():
+            points = points[::-1]
+            start = end
+        i = int(np.argmin(start))
+        if start[i] > step * COVERAGE_TOLERANCE + _eps(step):
+            return None, points
+        return _as_guess(y[i]), points
+
+    def merged(self, result: SweepResult) -> SweepResult:
+        "the cached points with newly computed ones, sorted and without repeats"
+        if self.result is not None:
+            result = SweepResult(
+                *(
+                    np.concatenate([cached, new])
+                    for cached, new in zip(self.result, result)
+                )
+            )
+        order = np.argsort(result.x, kind="stable")
+        x = result.x[order]
+        # a point computed again keeps its cached value, sorted first
+        repeat = np.zeros(len(x), dtype=bool)
+        repeat[1:] = np.diff(x) <= 1e-9 * np.maximum(1.0, np.abs(x[1:]))
+        order = order[~repeat]
+        return SweepResult(*(field[order] for field in result))
+
+    def merge(self, result: SweepResult, lo: float, hi: float, step: float):
+        "add newly computed points, keeping the curve sorted"
+        self.result = self.merged(result)
+        self.intervals.append((lo, hi, step))
+
+    def view(self, min_x: float, max_x: float) -> SweepResult:
+        "cached points within `[min_x, max_x]`"
+        assert self.result is not None
+        return _in_range(self.result, min_x, max_x)
+
+
+def _in_range(result: SweepResult, min_x: float, max_x: float) -> SweepResult:
+    "points of a sweep within `[min_x, max_x]`"
+    x = result.x
+    in_range = (x >= min_x - _eps(min_x)) & (x <= max_x + _eps(max_x))
+    return SweepResult(*(field[in_range] for field in result))
+
+
+def _at_points(result: SweepResult, points: Sequence[float]) -> SweepResult:
+    "points of a sweep at the requested `points`"
+    x = np.asarray(points, dtype=np.float64)
+    distance = np.abs(result.x[:, None] - x[None, :])
+    at_points = np.any(distance <= 1e-9 * np.maximum(1.0, np.abs(x)), axis=1)
+    return SweepResult(*(field[at_points] for field in result))
+
+
+def _segment_points(lo: float, hi: float, step: float) -> List[float]:
+    "evenly spaced points over `[lo, hi]` at most `step` apart"
+    if step <= 0.0 or hi - lo <= _eps(hi):
+        return [lo]
+    num = max(2, int(np.ceil((hi - lo) / step - 1e-9)) + 1)
+    return np.linspace(lo, hi, num=num).tolist()
+
+
+class CurveStore:
+    """
+    Sorted sweep results per key, e.g. (system, property, fixed conditions).
+
+    A request computes only the sub-intervals of its range not yet covered
+    at the requested spacing, warm-started from the nearest cached point,
+    and merges them with the cached points. The least recently used curves
+    are dropped beyond `maxsize` keys.
+
+    Sweeps of one key run one at a time, as jobs and family members run on
+    worker threads, so a repeated request reuses the points of the one
+    before it instead of computing them again.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._curves: "OrderedDict[Hashable, _Curve]" = OrderedDict()
+        self._lock = threading.Lock()  # guards `_curves`
+
+    def clear(self):
+        "drop all cached curves"
+        with self._lock:
+            self._curves.clear()
+
+    def _curve(self, key: Hashable) -> _Curve:
+        with self._lock:
+            curve = self._curves.pop(key, None) or _Curve()
+            self._curves[key] = curve
+            while len(self._curves) > self.maxsize:
+                self._curves.popitem(last=False)
+            return curve
+
+    def sweep(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        key: Hashable,
+        solve: SolveFn,
+        min_x: float,
+        max_x: float,
+        num: int = 10,
+        warm_start: bool = True,
+    ) -> SweepResult:
+        """
+        `continuation_sweep` over `num` points in `[min_x, max_x]`, cached by
+        key. The curve within the range is published to the running job
+        after each converged point.
+        """
+        curve = self._curve(key)
+        with curve.lock:
+            step = (max_x - min_x) / (num - 1) if num > 1 else 0.0
+            missing = [] if step == 0.0 else curve.uncovered(min_x, max_x, step)
+            # the requested end points are always part of the curve
+            missing += [
+                (end, end)
+                for end in dict.fromkeys((min_x, max_x))
+                if not curve.has_point(end)
+            ]
+
+            for lo, hi in missing:
+                points = [
+                    p for p in _segment_points(lo, hi, step) if not curve.has_point(p)
+                ]
+                if points:
+                    new = self._extend(
+                        curve,
+                        solve,
+                        points,
+                        step,
+                        warm_start,
+                        lambda result: _in_range(result, min_x, max_x),
+                    )
+                    curve.merge(new, lo, hi, step)
+
+            return curve.view(min_x, max_x)
+
+    def sweep_at(
+        self,
+        key: Hashable,
+        solve: SolveFn,
+        points: Sequence[float],
+        warm_start: bool = True,
+    ) -> SweepResult:
+        """
+        `continuation_sweep` at the increasing `points`, e.g. a grid that is
+        denser near a critical point, cached by key. Only the points not on
+        the curve yet are solved, and the result and the curve published to
+        the running job hold exactly the requested points.
+        """
+        curve = self._curve(key)
+        with curve.lock:
+            missing = [p for p in points if not curve.has_point(p)]
+            if missing:
+                step = float(np.max(np.diff(points))) if len(points) > 1 else 0.0
+                new = self._extend(
+                    curve,
+                    solve,
+                    missing,
+                    step,
+                    warm_start,
+                    lambda result: _at_points(result, points),
+                )
+                curve.merge(new, missing[0], missing[-1], step)
+            return _at_points(curve.view(points[0], points[-1]), points)
+
+    @staticmethod
+    def _extend(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        curve: _Curve,
+        solve: SolveFn,
+        points: List[float],
+        step: float,
+        warm_start: bool,
+        view: Callable[[SweepResult], SweepResult],
+    ) -> SweepResult:
+        """
+        solve new points of a curve, warm-started from its nearest cached
+        point, publishing `view` of the curve after each converged point
+        """
+        guess, points = curve.seed(points, step)
+        rows: List[Optional[np.ndarray]] = [None] * len(points)
+        errors = np.full(len(points), POINT_OK, dtype=np.int8)
+        for i, value, error in sweep_points(solve, points, warm_start, guess):
+            rows[i], errors[i] = value, error
+            if value is not None:
+                # the curve so far, for a job drawing it as it converges
+                partial = _sweep_result(points[: i + 1], rows[: i + 1], errors[: i + 1])
+                publish(view(curve.merged(partial)))
+        return _sweep_result(points, rows, errors)
+
+
+# Largest state grid evaluated by `grid_sweep`
+MAX_GRID_POINTS = 1_000_000
+
+
+class GridResult(NamedTuple):
+    "Values on a labelled state grid, one axis per entry of `dims`"
+
+    dims: Tuple[str, ...]
+    coords: Dict[str, np.ndarray]
+    values: np.ndarray  # NaN where the point failed
+    errors: np.ndarray
+
+    @property
+    def valid(self) -> np.ndarray:
+        "mask of the converged points"
+        return self.errors == POINT_OK
+
+    def squeeze(self) -> "GridResult":
+        "drop the axes with a single point"
+        keep = [i for i, dim in enumerate(self.dims) if len(self.coords[dim]) > 1]
+        drop = tuple(i for i in range(len(self.dims)) if i not in keep)
+        return GridResult(
+            tuple(self.dims[i] for i in keep),
+            {self.dims[i]: self.coords[self.dims[i]] for i in keep},
+            self.values.reshape(
+                tuple(n for i, n in enumerate(self.values.shape) if i not in drop)
+            ),
+            self.errors.reshape(
+                tuple(n for i, n in enumerate(self.errors.shape) if i not in drop)
+            ),
+        )
+
+
+GridSolveFn = Callable[[Dict[str, Any], Any], Any]
+
+
+def _grid_chunks(shape: Tuple[int, ...], chunk_size: int) -> Iterator[Tuple[int, int]]:
+    "flat index ranges `[start, stop)` covering a grid"
+    size = int(np.prod(shape))
+    for start in range(0, size, chunk_size):
+        yield start, min(start + chunk_size, size)
+
+
+def grid_sweep(
+    solve: GridSolveFn,
+    coords: Dict[str, Sequence[float]],
+    chunk_size: int = 1024,
+    vectorized: bool = False,
+) -> GridResult:
+    """
+    Evaluate `solve` on the full grid spanned by `coords` (e.g. T, P, x1).
+
+    The grid is walked in chunks of `chunk_size` points, in C order, so
+    only one chunk of states is alive at a time and the memory footprint is
+    bounded by the output array. With `vectorized=True`, `solve` receives
+    a dict of 1-D arrays for a whole chunk and returns one row per point.
+    Otherwise it is called per point with a dict of floats and the value
+    of the previous point along the last axis as warm start `guess`, like
+    `continuation_sweep`.
+    """
+    dims = tuple(coords)
+    axes = {dim: np.asarray(coords[dim], dtype=np.float64) for dim in dims}
+    shape = tuple(len(axes[dim]) for dim in dims)
+    size = int(np.prod(shape))
+    if size > MAX_GRID_POINTS:
+        raise ValueError(f"State grid too large ({size} > {MAX_GRID_POINTS} points)")
+
+    values: Optional[np.ndarray] = None
+    errors = np.full(size, POINT_OK, dtype=np.int8)
+    guess = None
+
+    for start, stop in _grid_chunks(shape, chunk_size):
+        index = np.unravel_index(np.arange(start, stop), shape)
+        points = {dim: axes[dim][index[i]] for i, dim in enumerate(dims)}
+        if vectorized:
+            rows = np.asarray(solve(points, None), dtype=np.float64)
+            rows = rows.reshape(stop - start, -1)
+            chunk_errors = np.where(
+                np.all(np.isfinite(rows), axis=1), POINT_OK, POINT_NON_PHYSICAL
+            ).astype(np.int8)
+        else:
+            rows, chunk_errors, guess = _solve_chunk(solve, points, index[-1], guess)
+        if values is None:
+            values = np.full((size, rows.shape[1]), np.nan)
+        values[start:stop] = rows
+        errors[start:stop] = chunk_errors
+        checkpoint(stop, size)
+
+    assert values is not None
+    values[errors != POINT_OK] = np.nan
+    if values.shape[1] == 1:
+        values = values.reshape(shape)
+    else:
+        values = values.reshape(shape + (values.shape[1],))
+    return GridResult(dims, axes, values, errors.reshape(shape))
+
+
+def _solve_chunk(
+    solve: GridSolveFn,
+    points: Dict[str, np.ndarray],
+    last_axis: np.ndarray,
+    guess: Any,
+) -> Tuple[np.ndarray, np.ndarray, Any]:
+    "solve a chunk point by point, warm-starting along the last grid axis"
+    n = len(last_axis)
+    rows: List[Optional[np.ndarray]] = []
+    errors = np.full(n, POINT_OK, dtype=np.int8)
+    for i in range(n):
+        checkpoint()
+        rows.append(None)
+        if last_axis[i] == 0:
+            guess = None  # a new line of the grid starts cold
+        point = {dim: float(axis[i]) for dim, axis in points.items()}
+        try:
+            value = _solve_point(lambda _, g, point=point: solve(point, g), 0.0, guess)
+        except RuntimeError:
+            errors[i] = POINT_NOT_CONVERGED
+            guess = None
+            continue
+        except (ValueError, AssertionError):
+            errors[i] = POINT_INVALID
+            guess = None
+            continue
+        if not np.all(np.isfinite(value)):
+            errors[i] = POINT_NON_PHYSICAL
+            guess = None
+            continue
+        rows[i] = value
+        guess = _as_guess(value) if _is_physical(value) else None
+    y = _stack_rows(rows)
+    return y.reshape(n, -1), errors, guess
+
+
+# Worker threads computing the curves of a condition family
+FAMILY_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def family_map(
+    compute: Callable[[Any], Any],
+    conditions: Sequence[Any],
+    max_workers: int = FAMILY_WORKERS,
+) -> List[Any]:
+    """
+    Compute one curve per condition (e.g. a list of pressures) concurrently
+    on a thread pool. Results follow the order of `conditions`; a condition
+    that fails with RuntimeError or ValueError gives its exception instead,
+    so one bad condition does not discard the rest of the family.
+    """
+
+    def _compute(condition):
+        try:
+            return compute(condition)
+        except (RuntimeError, ValueError) as e:
+            return e
+
+    if len(conditions) == 1 or max_workers <= 1:
+        return [_compute(condition) for condition in conditions]
+    results = []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(conditions))) as pool:
+        for result in pool.map(job_part(_compute), conditions):
+            results.append(result)
+            checkpoint(len(results), len(conditions))
+    return results
@@ -10,7 +10,8 @@ a = Analysis(
         ("./app/gnnpcsaft.kv", "."),
         ("./app/_data", "./_data"),
     ],
-    hiddenimports=[],
+    # loaded by the kivy Factory on first navigation
+    hiddenimports=["mixture_screen"],
     hookspath=["./hooks"],
     hooksconfig={},
     runtime_hooks=[],
@@ -6,6 +6,9 @@ platform=ubuntu
 # git push origin $version
 # gh release create -d --generate-notes --latest --verify-tag $version
 
+## tabulate the property atlas shipped in _data/atlas
+uv run python ./app/build_atlas.py
+
 ## create package
 uv run pyinstaller --distpath ./app_pkg/dist --workpath ./app_pkg/build --noconfirm --clean ./gnnpcsaft.spec
 cd ./app_pkg/dist/gnnpcsaft